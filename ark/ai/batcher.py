@@ -1,21 +1,139 @@
 """Batch helpers for AI classification."""
 
-from typing import Iterable, Iterator, TypeVar
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Iterable, Iterator, TypeVar
 
 T = TypeVar("T")
+R = TypeVar("R")
 
+DEFAULT_AI_CONCURRENCY = 4
+DEFAULT_TOKEN_BUDGET = 4_000
+MIN_TOKEN_BUDGET = 250
+MAX_BATCH_ITEMS = 200
+CHARS_PER_TOKEN = 4
+ANSWER_TOKENS_PER_ITEM = 30
+_END = object()
 
-def chunk_records(records: Iterable[T], batch_size: int) -> Iterator[list[T]]:
-    """Yield records in fixed-size chunks."""
-    if batch_size <= 0:
+
+def chunk_records(
+    records: Iterable[T],
+    batch_size: int | Callable[[], int],
+    weight: Callable[[T], int] | None = None,
+    max_items: int | None = None,
+) -> Iterator[list[T]]:
+    """Yield records in chunks whose total ``weight`` stays within ``batch_size``.
+
+    Without ``weight`` every record counts as one, giving fixed-size chunks.
+    ``batch_size`` may be a callable; it is re-read for every chunk so the
+    caller can resize batches mid-stream. A record heavier than the limit
+    still forms a chunk of its own.
+    """
+    limit = batch_size if callable(batch_size) else lambda: batch_size
+    if limit() <= 0:
         raise ValueError("batch_size must be positive")
 
     bucket: list[T] = []
+    total = 0
+    current = limit()
     for record in records:
-        bucket.append(record)
-        if len(bucket) >= batch_size:
+        cost = weight(record) if weight else 1
+        full = max_items is not None and len(bucket) >= max_items
+        if bucket and (total + cost > current or full):
             yield bucket
             bucket = []
+            total = 0
+            current = limit()
+        bucket.append(record)
+        total += cost
 
     if bucket:
         yield bucket
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate prompt tokens, at about four characters per token."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+class TokenBudgetBatcher:
+    """Pack prompt inputs into batches that fit an estimated token budget.
+
+    Each input costs its estimated prompt tokens plus a fixed allowance for
+    its JSON answer, so short basenames share a call while deep full paths
+    are split up. ``shrink`` halves the budget after a truncated or
+    unparsable reply; batches packed afterwards are smaller.
+    """
+
+    def __init__(
+        self,
+        budget: int = DEFAULT_TOKEN_BUDGET,
+        max_items: int = MAX_BATCH_ITEMS,
+        min_budget: int = MIN_TOKEN_BUDGET,
+    ):
+        if budget <= 0:
+            raise ValueError("budget must be positive")
+        self.budget = budget
+        self.max_items = max_items
+        self.min_budget = min(min_budget, budget)
+
+    def cost(self, text: str) -> int:
+        """Return the estimated prompt and answer tokens for one input."""
+        return estimate_tokens(text) + ANSWER_TOKENS_PER_ITEM
+
+    def batches(self, texts: Iterable[str]) -> Iterator[list[str]]:
+        """Lazily pack ``texts`` using the budget current at each batch."""
+        return chunk_records(
+            texts,
+            lambda: self.budget,
+            weight=self.cost,
+            max_items=self.max_items,
+        )
+
+    def shrink(self) -> None:
+        """Halve the budget, never going below ``min_budget``."""
+        self.budget = max(self.min_budget, self.budget // 2)
+
+
+def map_batches_ordered(
+    fn: Callable[[T], R],
+    batches: Iterable[T],
+    concurrency: int = DEFAULT_AI_CONCURRENCY,
+) -> Iterator[tuple[int, R]]:
+    """Run ``fn`` over batches concurrently, yielding ``(position, result)`` in order.
+
+    At most ``concurrency`` calls are in flight, and batches are pulled from
+    the iterable only as slots free up, so a lazy packer sees feedback from
+    earlier calls. A batch that finishes early is held back until every
+    batch before it has been yielded, so callers can checkpoint a contiguous
+    prefix. The first failure is re-raised and unstarted batches are
+    cancelled.
+    """
+    if concurrency <= 0:
+        raise ValueError("concurrency must be positive")
+
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="ark-ai")
+    source = iter(batches)
+    exhausted = False
+    pending: dict[Future[R], int] = {}
+    finished: dict[int, R] = {}
+    next_submit = 0
+    next_yield = 0
+    try:
+        while True:
+            while not exhausted and len(pending) < concurrency:
+                batch = next(source, _END)
+                if batch is _END:
+                    exhausted = True
+                    break
+                pending[executor.submit(fn, batch)] = next_submit
+                next_submit += 1
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                finished[pending.pop(future)] = future.result()
+            while next_yield in finished:
+                yield next_yield, finished.pop(next_yield)
+                next_yield += 1
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
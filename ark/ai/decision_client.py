@@ -2,9 +2,20 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+from collections.abc import Mapping
+from typing import Callable
 
+from ark.ai.path_families import PathFamily
 from ark.ai.router import classify_batch
+from ark.state.decision_cache import DecisionCache
+
+
+SUFFIX_PROMPT_VERSION = 1
+PATH_PROMPT_VERSION = 3
+DIRECTORY_PROMPT_VERSION = 1
+PARSE_FALLBACK_REASON = "LLM parse fallback"
 
 
 def llm_suffix_risk(
@@ -18,33 +29,48 @@ def llm_suffix_risk(
     google_client_id: str = "",
     google_client_secret: str = "",
     google_refresh_token: str = "",
+    cache: DecisionCache | None = None,
 ) -> dict[str, dict[str, object]]:
-    """Classify suffix risk with one LLM call and parse JSON output."""
+    """Classify suffix risk with one LLM call and parse JSON output.
+
+    With ``cache``, only suffixes without a stored answer reach the model.
+    """
     if not extensions:
         return {}
 
+    route = {
+        "model": model,
+        "provider": provider,
+        "base_url": base_url,
+        "api_key": api_key,
+        "auth_method": auth_method,
+        "google_client_id": google_client_id,
+        "google_client_secret": google_client_secret,
+        "google_refresh_token": google_refresh_token,
+    }
+    return _cached_lookup(
+        cache,
+        _cache_namespace("suffix", SUFFIX_PROMPT_VERSION, provider, model, base_url),
+        extensions,
+        lambda ext: ext.strip().lower(),
+        lambda misses: _query_suffix_risk(misses, route),
+    )
+
+
+def _query_suffix_risk(
+    extensions: list[str], route: dict[str, str]
+) -> dict[str, dict[str, object]]:
     prompt = (
         "Return strict JSON only. "
         'Schema: {"items":[{"key":".ext","decision":"keep|drop|not_sure",'
         '"confidence":0.0,"reason":"..."}]}. '
         f"Input suffixes: {json.dumps(sorted(set(extensions)))}"
     )
-    raw = classify_batch(
-        model=model,
-        prompt=prompt,
-        temperature=0.0,
-        provider=provider,
-        base_url=base_url,
-        api_key=api_key,
-        auth_method=auth_method,
-        google_client_id=google_client_id,
-        google_client_secret=google_client_secret,
-        google_refresh_token=google_refresh_token,
-    )
+    raw = classify_batch(prompt=prompt, temperature=0.0, **route)
     payload = _try_parse_json(raw)
 
     default = {
-        ext: {"risk": "neutral", "confidence": 0.0, "reason": "LLM parse fallback"}
+        ext: {"risk": "neutral", "confidence": 0.0, "reason": PARSE_FALLBACK_REASON}
         for ext in extensions
     }
     if not payload:
@@ -74,29 +100,56 @@ def llm_path_risk(
     google_client_id: str = "",
     google_client_secret: str = "",
     google_refresh_token: str = "",
+    cache: DecisionCache | None = None,
+    families: Mapping[str, PathFamily] | None = None,
 ) -> dict[str, dict[str, object]]:
-    """Classify path risk for Stage 2."""
+    """Classify path risk for Stage 2.
+
+    Inputs found in ``families`` are templates; the model sees each one with
+    its member count and sample members. With ``cache``, only paths without a
+    stored answer reach the model.
+    """
     if not paths:
         return {}
 
+    route = {
+        "model": model,
+        "provider": provider,
+        "base_url": base_url,
+        "api_key": api_key,
+        "auth_method": auth_method,
+        "google_client_id": google_client_id,
+        "google_client_secret": google_client_secret,
+        "google_refresh_token": google_refresh_token,
+    }
+    return _cached_lookup(
+        cache,
+        _cache_namespace("path", PATH_PROMPT_VERSION, provider, model, base_url),
+        paths,
+        str.strip,
+        lambda misses: _query_path_risk(misses, route, families or {}),
+    )
+
+
+def _query_path_risk(
+    paths: list[str],
+    route: dict[str, str],
+    families: Mapping[str, PathFamily],
+) -> dict[str, dict[str, object]]:
+    inputs = [
+        families[path].prompt_item() if path in families else path for path in paths
+    ]
     prompt = (
         "Return strict JSON only. "
         'Schema: {"items":[{"key":"path","decision":"keep|drop|not_sure",'
         '"score":0.0,"confidence":0.0,"reason":"..."}]}. '
-        f"Input paths: {json.dumps(paths)}"
-    )
-    raw = classify_batch(
-        model=model,
-        prompt=prompt,
-        temperature=0.0,
-        provider=provider,
-        base_url=base_url,
-        api_key=api_key,
-        auth_method=auth_method,
-        google_client_id=google_client_id,
-        google_client_secret=google_client_secret,
-        google_refresh_token=google_refresh_token,
+        'Inputs given as {"key","count","samples"} are templates where '
+        "placeholders {n}, {hex}, {uuid} and {ver} stand for a family of "
+        "count similar files; judge the family from its samples and answer "
+        "once under its key. "
+        f"Input paths: {json.dumps(inputs)}"
     )
+    raw = classify_batch(prompt=prompt, temperature=0.0, **route)
     payload = _try_parse_json(raw)
 
     default = {
@@ -104,7 +157,7 @@ def llm_path_risk(
             "risk": "neutral",
             "score": 0.5,
             "confidence": 0.0,
-            "reason": "LLM parse fallback",
+            "reason": PARSE_FALLBACK_REASON,
         }
         for path in paths
     }
@@ -139,13 +192,29 @@ def llm_directory_decision(
     google_client_id: str = "",
     google_client_secret: str = "",
     google_refresh_token: str = "",
+    cache: DecisionCache | None = None,
 ) -> dict[str, object]:
-    """Classify one directory for Stage 3 DFS decision."""
+    """Classify one directory for Stage 3 DFS decision.
+
+    With ``cache``, the answer is reused while the directory, its child
+    directories and sample files are unchanged.
+    """
+    child_directories = child_directories[:20]
+    sample_files = sample_files[:20]
+    namespace = _cache_namespace(
+        "directory", DIRECTORY_PROMPT_VERSION, provider, model, base_url
+    )
+    key = json.dumps([directory, child_directories, sample_files])
+    if cache is not None:
+        hit = cache.get_many(namespace, [key]).get(key)
+        if hit is not None:
+            return hit
+
     prompt = (
         "Return strict JSON only. "
         'Schema: {"decision":"keep|drop|not_sure","confidence":0.0,"reason":"..."}. '
-        f"Directory: {directory}. Child directories: {json.dumps(child_directories[:20])}. "
-        f"Sample files: {json.dumps(sample_files[:20])}."
+        f"Directory: {directory}. Child directories: {json.dumps(child_directories)}. "
+        f"Sample files: {json.dumps(sample_files)}."
     )
     raw = classify_batch(
         model=model,
@@ -164,13 +233,62 @@ def llm_directory_decision(
         return {
             "decision": "not_sure",
             "confidence": 0.0,
-            "reason": "LLM parse fallback",
+            "reason": PARSE_FALLBACK_REASON,
         }
-    return {
+    result = {
         "decision": _normalize_decision(str(payload.get("decision", "not_sure"))),
         "confidence": float(payload.get("confidence", 0.0)),
         "reason": str(payload.get("reason", "")),
     }
+    if cache is not None:
+        cache.put_many(namespace, {key: result})
+    return result
+
+
+def _cache_namespace(
+    kind: str, version: int, provider: str, model: str, base_url: str
+) -> str:
+    """Key cached answers by prompt, provider, model and endpoint.
+
+    The same model name served from another ``base_url`` may be a different
+    deployment, so the normalized URL is hashed into the namespace.
+    """
+    endpoint = base_url.strip().rstrip("/").lower()
+    digest = hashlib.sha256(endpoint.encode("utf-8")).hexdigest()[:12]
+    return f"{kind}:v{version}:{provider.strip()}:{model.strip()}:{digest}"
+
+
+def _cached_lookup(
+    cache: DecisionCache | None,
+    namespace: str,
+    keys: list[str],
+    normalize: Callable[[str], str],
+    query: Callable[[list[str]], dict[str, dict[str, object]]],
+) -> dict[str, dict[str, object]]:
+    """Answer ``keys`` from ``cache`` and send only the misses to ``query``.
+
+    Parse fallbacks are returned but never stored, so a bad reply is retried
+    on the next run.
+    """
+    if cache is None:
+        return query(keys)
+
+    normalized = {key: normalize(key) for key in keys}
+    hits = cache.get_many(namespace, normalized.values())
+    result = {key: hits[norm] for key, norm in normalized.items() if norm in hits}
+    misses = [key for key in keys if normalized[key] not in hits]
+    if misses:
+        fresh = query(misses)
+        result.update(fresh)
+        cache.put_many(
+            namespace,
+            {
+                normalized[key]: value
+                for key, value in fresh.items()
+                if key in normalized and value.get("reason") != PARSE_FALLBACK_REASON
+            },
+        )
+    return result
 
 
 def _try_parse_json(raw: str) -> dict[str, object] | None:
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable
 
+from ark.state.token_store import EncryptedTokenStore
 
 GOOGLE_TOKEN_URI = "https://oauth2.googleapis.com/token"
 GOOGLE_OAUTH_SCOPES = ("https://www.googleapis.com/auth/generative-language",)
+GOOGLE_REFRESH_MARGIN_SECONDS = 300.0
 
 
 @dataclass(frozen=True)
@@ -78,26 +84,117 @@ def refresh_google_access_token(
     return access_token
 
 
-def build_google_credentials(
-    client_id: str,
-    client_secret: str,
-    refresh_token: str,
-    scopes: tuple[str, ...] = GOOGLE_OAUTH_SCOPES,
-):
-    """Build and refresh Google OAuth credentials object."""
-    if not client_id.strip() or not client_secret.strip() or not refresh_token.strip():
-        raise ValueError("google oauth credentials are required")
-
+def _refresh_credentials(credentials: Any) -> None:
     from google.auth.transport.requests import Request
-    from google.oauth2.credentials import Credentials
 
-    credentials = Credentials(
-        token=None,
-        refresh_token=refresh_token,
-        token_uri=GOOGLE_TOKEN_URI,
-        client_id=client_id,
-        client_secret=client_secret,
-        scopes=list(scopes),
-    )
     credentials.refresh(Request())
-    return credentials
+
+
+@dataclass
+class _CredentialSlot:
+    credentials: Any = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class GoogleCredentialCache:
+    """Share one refreshed credentials object per OAuth identity.
+
+    Credentials are refreshed ``refresh_margin`` seconds before they expire,
+    in place, so SDK clients holding them never refresh on their own. Only
+    one caller refreshes a given identity; concurrent callers wait on its
+    lock and then reuse the new token. With a ``store``, access tokens also
+    survive restarts, encrypted at rest.
+    """
+
+    def __init__(
+        self,
+        store: EncryptedTokenStore | None = None,
+        refresh_margin: float = GOOGLE_REFRESH_MARGIN_SECONDS,
+        clock: Callable[[], float] = time.time,
+        refresh: Callable[[Any], None] = _refresh_credentials,
+    ):
+        self.store = store
+        self.refresh_margin = refresh_margin
+        self._clock = clock
+        self._refresh = refresh
+        self._slots: dict[tuple[str, str, str], _CredentialSlot] = {}
+        self._lock = threading.Lock()
+
+    def fresh(self, client_id: str, client_secret: str, refresh_token: str) -> Any:
+        """Return cached credentials when still fresh, without blocking."""
+        slot = self._slots.get((client_id, client_secret, refresh_token))
+        if slot is not None and self._is_fresh(slot.credentials):
+            return slot.credentials
+        return None
+
+    def get(
+        self,
+        client_id: str,
+        client_secret: str,
+        refresh_token: str,
+        scopes: tuple[str, ...] = GOOGLE_OAUTH_SCOPES,
+    ) -> Any:
+        """Return fresh credentials, refreshing them at most once per expiry."""
+        if not all(item.strip() for item in (client_id, client_secret, refresh_token)):
+            raise ValueError("google oauth credentials are required")
+        key = (client_id, client_secret, refresh_token)
+        with self._lock:
+            slot = self._slots.setdefault(key, _CredentialSlot())
+        if self._is_fresh(slot.credentials):
+            return slot.credentials
+        with slot.lock:
+            if slot.credentials is None:
+                slot.credentials = self._build(key, scopes)
+            if not self._is_fresh(slot.credentials):
+                self._refresh(slot.credentials)
+                if not slot.credentials.token:
+                    raise RuntimeError(
+                        "google oauth refresh returned empty access token"
+                    )
+                self._save(key, slot.credentials)
+            return slot.credentials
+
+    def clear(self) -> None:
+        """Forget every cached credentials object."""
+        with self._lock:
+            self._slots.clear()
+
+    def _is_fresh(self, credentials: Any) -> bool:
+        if credentials is None or not credentials.token:
+            return False
+        expiry = credentials.expiry
+        if expiry is None:
+            return False
+        if expiry.tzinfo is None:
+            expiry = expiry.replace(tzinfo=timezone.utc)
+        return expiry.timestamp() - self.refresh_margin > self._clock()
+
+    def _build(self, key: tuple[str, str, str], scopes: tuple[str, ...]) -> Any:
+        from google.oauth2.credentials import Credentials
+
+        client_id, client_secret, refresh_token = key
+        credentials = Credentials(
+            token=None,
+            refresh_token=refresh_token,
+            token_uri=GOOGLE_TOKEN_URI,
+            client_id=client_id,
+            client_secret=client_secret,
+            scopes=list(scopes),
+        )
+        stored = self.store.load(key) if self.store is not None else None
+        if stored:
+            try:
+                expiry = datetime.fromtimestamp(float(stored["expiry"]), timezone.utc)
+                credentials.token = str(stored["token"])
+                credentials.expiry = expiry.replace(tzinfo=None)
+            except (KeyError, TypeError, ValueError):
+                pass
+        return credentials
+
+    def _save(self, key: tuple[str, str, str], credentials: Any) -> None:
+        if self.store is None or credentials.expiry is None:
+            return
+        expiry = credentials.expiry
+        if expiry.tzinfo is None:
+            expiry = expiry.replace(tzinfo=timezone.utc)
+        self.store.save(key, {"token": credentials.token, "expiry": expiry.timestamp()})
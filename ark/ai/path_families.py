@@ -0,0 +1,120 @@
+"""Collapse families of similar paths into templates for AI classification."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+
+MIN_FAMILY_MEMBERS = 3
+MIN_BASENAME_FAMILY_MEMBERS = 10
+FAMILY_SAMPLE_LIMIT = 3
+
+_UUID_RE = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
+_HEX_RE = re.compile(r"(?<![0-9A-Za-z])[0-9a-fA-F]{8,}(?![0-9A-Za-z])")
+_VERSION_RE = re.compile(r"(?<![0-9A-Za-z])v?\d+(?:\.\d+){1,3}(?![0-9])")
+_DIGITS_RE = re.compile(r"\d+")
+_PLACEHOLDER_RE = re.compile(r"\{(?:uuid|hex|ver|n)\}")
+
+
+@dataclass
+class PathFamily:
+    """One template with its member count and a few sample members."""
+
+    template: str
+    count: int = 0
+    samples: list[str] = field(default_factory=list)
+
+    def prompt_item(self) -> dict[str, object]:
+        """Return the template with its size and samples for the LLM prompt."""
+        return {"key": self.template, "count": self.count, "samples": self.samples}
+
+
+@dataclass
+class FamilyCollapse:
+    """Inputs to classify after collapsing families, and how to fan back out."""
+
+    inputs: list[str]
+    families: dict[str, PathFamily]
+    template_of: dict[str, str]
+
+
+def path_template(text: str) -> str:
+    """Replace variable parts of each path segment with placeholders.
+
+    UUIDs become ``{uuid}``, hex hashes ``{hex}``, dotted versions ``{ver}``
+    and remaining digit runs ``{n}``. File extensions are kept verbatim so
+    ``.mp3`` or ``.h264`` still tell the model what the files are.
+    """
+    return "/".join(_segment_template(segment) for segment in text.split("/"))
+
+
+def _segment_template(segment: str) -> str:
+    stem, dot, ext = segment.rpartition(".")
+    if not dot or not stem or not ext.isalnum() or ext.isdigit():
+        stem, dot, ext = segment, "", ""
+    stem = _UUID_RE.sub("{uuid}", stem)
+    stem = _HEX_RE.sub(_hex_or_keep, stem)
+    stem = _VERSION_RE.sub("{ver}", stem)
+    stem = _split_placeholders(stem)
+    return f"{stem}{dot}{ext}"
+
+
+def _hex_or_keep(match: re.Match[str]) -> str:
+    text = match.group(0)
+    has_digit = any(char.isdigit() for char in text)
+    has_letter = any(char.isalpha() for char in text)
+    return "{hex}" if has_digit and has_letter else text
+
+
+def _split_placeholders(text: str) -> str:
+    """Replace digit runs outside already inserted placeholders."""
+    parts: list[str] = []
+    position = 0
+    for match in _PLACEHOLDER_RE.finditer(text):
+        parts.append(_DIGITS_RE.sub("{n}", text[position : match.start()]))
+        parts.append(match.group(0))
+        position = match.end()
+    parts.append(_DIGITS_RE.sub("{n}", text[position:]))
+    return "".join(parts)
+
+
+def collapse_path_families(
+    inputs: list[str],
+    min_members: int = MIN_FAMILY_MEMBERS,
+    sample_limit: int = FAMILY_SAMPLE_LIMIT,
+) -> FamilyCollapse:
+    """Classify families of ``min_members`` or more inputs once, as a template.
+
+    The returned inputs keep first-seen order, with each family's template
+    standing where its first member was.
+    """
+    templates = {text: path_template(text) for text in inputs}
+    families: dict[str, PathFamily] = {}
+    for text, template in templates.items():
+        if template == text:
+            continue
+        family = families.setdefault(template, PathFamily(template))
+        family.count += 1
+        if len(family.samples) < sample_limit:
+            family.samples.append(text)
+    families = {
+        template: family
+        for template, family in families.items()
+        if family.count >= min_members
+    }
+
+    collapsed: list[str] = []
+    emitted: set[str] = set()
+    template_of: dict[str, str] = {}
+    for text in inputs:
+        template = templates[text]
+        if template not in families:
+            collapsed.append(text)
+            continue
+        template_of[text] = template
+        if template not in emitted:
+            emitted.add(template)
+            collapsed.append(template)
+    return FamilyCollapse(inputs=collapsed, families=families, template_of=template_of)
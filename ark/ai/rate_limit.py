@@ -0,0 +1,250 @@
+"""Per-provider rate limiting and retry scheduling for LLM calls."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_REQUESTS_PER_MINUTE = 60
+DEFAULT_TOKENS_PER_MINUTE = 200_000
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504, 529})
+_RETRYABLE_ERROR_NAMES = frozenset(
+    {
+        "APIConnectionError",
+        "APITimeoutError",
+        "InternalServerError",
+        "RateLimitError",
+        "ServiceUnavailableError",
+        "Timeout",
+    }
+)
+
+logger = logging.getLogger("ark.ai.rate_limit")
+
+
+@dataclass(frozen=True)
+class ProviderLimits:
+    """Requests and tokens one provider accepts per minute; 0 means no limit."""
+
+    requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE
+    tokens_per_minute: int = DEFAULT_TOKENS_PER_MINUTE
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with jitter for transient LLM failures."""
+
+    max_attempts: int = 5
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+
+    def backoff(self, attempt: int, rng: random.Random) -> float:
+        """Return the delay before retry ``attempt`` (1-based), half jittered."""
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return ceiling / 2 + rng.uniform(0, ceiling / 2)
+
+
+class TokenBucket:
+    """Token bucket that hands out reservations instead of rejecting callers.
+
+    ``reserve`` always debits the bucket and returns how long the caller has
+    to wait for its share to refill, so concurrent callers queue up behind
+    each other rather than racing for the same refill.
+    """
+
+    def __init__(self, per_minute: int, now: float):
+        if per_minute <= 0:
+            raise ValueError("per_minute must be positive")
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self._level = self.capacity
+        self._updated = now
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take ``amount`` (capped at capacity) and return the wait in seconds."""
+        elapsed = max(now - self._updated, 0.0)
+        self._level = min(self.capacity, self._level + elapsed * self.rate)
+        self._updated = now
+        self._level -= min(amount, self.capacity)
+        return 0.0 if self._level >= 0 else -self._level / self.rate
+
+
+@dataclass
+class _ProviderState:
+    requests: TokenBucket | None
+    tokens: TokenBucket | None
+    blocked_until: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class LLMScheduler:
+    """Pace and retry LLM calls so concurrent stages share each provider quota.
+
+    Every call first reserves one request and its estimated tokens from the
+    provider's buckets. Rate limits, timeouts and 5xx replies are retried
+    with exponential backoff; a ``Retry-After`` hint instead pauses the whole
+    provider, so other in-flight callers back off too. A hint longer than
+    ``RetryPolicy.max_delay`` is not waited out: the error is re-raised.
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, ProviderLimits] | None = None,
+        retry: RetryPolicy | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[object]] = asyncio.sleep,
+        rng: random.Random | None = None,
+    ):
+        self._limits = dict(limits or {})
+        self.retry = retry or RetryPolicy()
+        self._clock = clock
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+        self._states: dict[str, _ProviderState] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, provider: str, limits: ProviderLimits) -> None:
+        """Set the limits of ``provider``, resetting its buckets."""
+        with self._lock:
+            self._limits[provider] = limits
+            self._states.pop(provider, None)
+
+    async def run(
+        self,
+        provider: str,
+        tokens: int,
+        call: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Await ``call()`` within the provider's limits, retrying transient errors."""
+        attempt = 0
+        while True:
+            await self._acquire(provider, tokens)
+            try:
+                return await call()
+            except Exception as exc:
+                attempt += 1
+                if attempt >= self.retry.max_attempts or not is_retryable_error(exc):
+                    raise
+                delay = retry_after_seconds(exc)
+                if delay is not None and delay > self.retry.max_delay:
+                    # A long hint usually means a daily quota; let the caller
+                    # fall back instead of stalling every stage on it.
+                    logger.warning(
+                        "llm call rate limited provider=%s retry_after=%.0fs "
+                        "exceeds max_delay=%.0fs, giving up",
+                        provider or "default",
+                        delay,
+                        self.retry.max_delay,
+                    )
+                    raise
+                if delay is not None:
+                    state = self._state(provider)
+                    with state.lock:
+                        until = self._clock() + delay
+                        state.blocked_until = max(state.blocked_until, until)
+                else:
+                    delay = self.retry.backoff(attempt, self._rng)
+                logger.warning(
+                    "llm call failed provider=%s attempt=%d retry_in=%.1fs error=%s",
+                    provider or "default",
+                    attempt,
+                    delay,
+                    exc,
+                )
+                await self._sleep(delay)
+
+    async def _acquire(self, provider: str, tokens: int) -> None:
+        state = self._state(provider)
+        with state.lock:
+            now = self._clock()
+            wait = max(state.blocked_until - now, 0.0)
+            if state.requests is not None:
+                wait = max(wait, state.requests.reserve(1, now))
+            if state.tokens is not None:
+                wait = max(wait, state.tokens.reserve(tokens, now))
+        if wait > 0:
+            await self._sleep(wait)
+
+    def _state(self, provider: str) -> _ProviderState:
+        with self._lock:
+            state = self._states.get(provider)
+            if state is None:
+                limits = self._limits.get(provider, ProviderLimits())
+                now = self._clock()
+                state = _ProviderState(
+                    requests=_bucket(limits.requests_per_minute, now),
+                    tokens=_bucket(limits.tokens_per_minute, now),
+                )
+                self._states[provider] = state
+            return state
+
+
+def _bucket(per_minute: int, now: float) -> TokenBucket | None:
+    return TokenBucket(per_minute, now) if per_minute > 0 else None
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """Whether ``exc`` looks like a rate limit, timeout or transient server error."""
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+    status = _status_code(exc)
+    if status is not None:
+        return status in RETRYABLE_STATUS_CODES
+    return any(cls.__name__ in _RETRYABLE_ERROR_NAMES for cls in type(exc).__mro__)
+
+
+def retry_after_seconds(exc: BaseException) -> float | None:
+    """Return the ``Retry-After`` delay carried by ``exc``, when present."""
+    for headers in _response_headers(exc):
+        value = headers.get("retry-after-ms")
+        if value is not None:
+            try:
+                return max(float(value) / 1000.0, 0.0)
+            except ValueError:
+                pass
+        value = headers.get("retry-after")
+        if value is None:
+            continue
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            moment = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            continue
+        return max(moment.timestamp() - time.time(), 0.0)
+    return None
+
+
+def _status_code(exc: BaseException) -> int | None:
+    for name in ("status_code", "code", "status"):
+        value = getattr(exc, name, None)
+        if isinstance(value, int) and 100 <= value < 600:
+            return value
+    return None
+
+
+def _response_headers(exc: BaseException) -> list[Mapping[str, str]]:
+    found: list[Mapping[str, str]] = []
+    for candidate in (
+        getattr(exc, "litellm_response_headers", None),
+        getattr(exc, "headers", None),
+        getattr(getattr(exc, "response", None), "headers", None),
+    ):
+        if candidate is None:
+            continue
+        try:
+            found.append({str(k).lower(): str(v) for k, v in dict(candidate).items()})
+        except (TypeError, ValueError):
+            continue
+    return found
@@ -1,7 +1,91 @@
 """LiteLLM router abstraction."""
 
-from ark.ai.google_oauth import build_google_credentials
-from litellm import completion
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+from ark.ai.batcher import estimate_tokens
+from ark.ai.google_oauth import GoogleCredentialCache
+from ark.ai.rate_limit import LLMScheduler
+from litellm import acompletion
+
+T = TypeVar("T")
+
+
+class RouterLoop:
+    """Long-lived event loop that owns every LLM client of the process.
+
+    LiteLLM keeps its HTTP clients per provider configuration and the Gemini
+    SDK client is cached here per OAuth identity, but async clients are tied
+    to the loop that created them. Running every call on this one loop lets
+    connection pools, keep-alive sockets and TLS sessions survive across
+    batches, whether callers are sync worker threads or other event loops.
+    """
+
+    def __init__(self) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self.google_clients: dict[tuple[str, str, str], object] = {}
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="ark-llm", daemon=True
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run ``coro`` on the router loop and block until it finishes."""
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("RouterLoop.run cannot block the router loop itself")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    async def submit(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Await ``coro`` on the router loop from any other event loop."""
+        loop = self._ensure_loop()
+        if asyncio.get_running_loop() is loop:
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+    def close(self) -> None:
+        """Stop the loop; a later call starts a fresh one with new clients."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+            self.google_clients.clear()
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(_cancel_pending_tasks(), loop).result(5)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5)
+        loop.close()
+
+
+async def _cancel_pending_tasks() -> None:
+    """Cancel background tasks, such as LiteLLM's logging worker, before stop."""
+    current = asyncio.current_task()
+    tasks = [task for task in asyncio.all_tasks() if task is not current]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+ROUTER_LOOP = RouterLoop()
+GOOGLE_CREDENTIALS = GoogleCredentialCache()
+LLM_SCHEDULER = LLMScheduler()
 
 
 def classify_batch(
@@ -16,7 +100,69 @@ def classify_batch(
     google_client_secret: str = "",
     google_refresh_token: str = "",
 ) -> str:
-    """Call LiteLLM chat completion for one batch and return raw content."""
+    """Call LiteLLM chat completion for one batch and return raw content.
+
+    Blocking wrapper around ``aclassify_batch`` for worker threads; the call
+    itself runs on the shared router loop so its connections are reused, and
+    is paced and retried by ``LLM_SCHEDULER`` under the provider's limits.
+    """
+    return ROUTER_LOOP.run(
+        _aclassify_batch(
+            model=model,
+            prompt=prompt,
+            temperature=temperature,
+            provider=provider,
+            base_url=base_url,
+            api_key=api_key,
+            auth_method=auth_method,
+            google_client_id=google_client_id,
+            google_client_secret=google_client_secret,
+            google_refresh_token=google_refresh_token,
+        )
+    )
+
+
+async def aclassify_batch(
+    model: str,
+    prompt: str,
+    temperature: float = 0.0,
+    provider: str = "",
+    base_url: str = "",
+    api_key: str = "",
+    auth_method: str = "api_key",
+    google_client_id: str = "",
+    google_client_secret: str = "",
+    google_refresh_token: str = "",
+) -> str:
+    """Async ``classify_batch``, safe to await from any event loop."""
+    return await ROUTER_LOOP.submit(
+        _aclassify_batch(
+            model=model,
+            prompt=prompt,
+            temperature=temperature,
+            provider=provider,
+            base_url=base_url,
+            api_key=api_key,
+            auth_method=auth_method,
+            google_client_id=google_client_id,
+            google_client_secret=google_client_secret,
+            google_refresh_token=google_refresh_token,
+        )
+    )
+
+
+async def _aclassify_batch(
+    model: str,
+    prompt: str,
+    temperature: float,
+    provider: str,
+    base_url: str,
+    api_key: str,
+    auth_method: str,
+    google_client_id: str,
+    google_client_secret: str,
+    google_refresh_token: str,
+) -> str:
     model_name = model.strip()
     completion_kwargs: dict[str, object] = {
         "model": model_name,
@@ -31,33 +177,49 @@ def classify_batch(
         completion_kwargs["base_url"] = base_url
 
     if provider == "gemini" and auth_method == "google_oauth":
-        credentials = build_google_credentials(
-            client_id=google_client_id,
-            client_secret=google_client_secret,
-            refresh_token=google_refresh_token,
-        )
-        return _classify_batch_with_google_sdk(
-            model=model_name,
-            prompt=prompt,
-            credentials=credentials,
+        key = (google_client_id, google_client_secret, google_refresh_token)
+        credentials = GOOGLE_CREDENTIALS.fresh(*key)
+        if credentials is None:
+            # Refresh off the loop; concurrent batches wait on the one owner.
+            credentials = await asyncio.to_thread(GOOGLE_CREDENTIALS.get, *key)
+        client = ROUTER_LOOP.google_clients.get(key)
+        if client is None:
+            client = _google_sdk_client(credentials)
+            ROUTER_LOOP.google_clients[key] = client
+        return await LLM_SCHEDULER.run(
+            provider,
+            estimate_tokens(prompt),
+            lambda: _aclassify_batch_with_google_sdk(
+                model=model_name,
+                prompt=prompt,
+                client=client,
+            ),
         )
     elif api_key.strip():
         completion_kwargs["api_key"] = api_key
 
-    response = completion(
-        **completion_kwargs,
+    response = await LLM_SCHEDULER.run(
+        provider,
+        estimate_tokens(prompt),
+        lambda: acompletion(**completion_kwargs),
     )
     return response.choices[0].message.content or ""
 
 
-def _classify_batch_with_google_sdk(
-    model: str, prompt: str, credentials: object
-) -> str:
-    """Call Gemini with Google official SDK using OAuth credentials."""
+def _google_sdk_client(credentials: object) -> object:
+    """Build one Gemini SDK client; it is reused for every later call.
+
+    ``GOOGLE_CREDENTIALS`` refreshes ``credentials`` in place ahead of expiry,
+    so the client never needs to refresh them itself.
+    """
     from google import genai
 
-    client = genai.Client(credentials=credentials)
-    response = client.models.generate_content(
+    return genai.Client(credentials=credentials)
+
+
+async def _aclassify_batch_with_google_sdk(model: str, prompt: str, client: Any) -> str:
+    """Call Gemini through the cached Google SDK client's async API."""
+    response = await client.aio.models.generate_content(
         model=model,
         contents=prompt,
     )
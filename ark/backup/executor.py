@@ -1,12 +1,37 @@
 """Mirror backup copy operations."""
 
+import os
 import shutil
 from pathlib import Path
 
 
+def mirror_destination(src_root: Path, src_path: Path, dst_root: Path) -> Path:
+    """Return the mirrored target path for one source file."""
+    return dst_root / src_root.name / src_path.relative_to(src_root)
+
+
 def mirror_copy_one(src_root: Path, src_path: Path, dst_root: Path) -> None:
     """Copy one file while preserving source root structure."""
-    relative_path = src_path.relative_to(src_root)
-    destination = dst_root / src_root.name / relative_path
+    destination = mirror_destination(src_root, src_path, dst_root)
     destination.parent.mkdir(parents=True, exist_ok=True)
     shutil.copy2(src_path, destination)
+
+
+def mirror_link_one(
+    src_root: Path, src_path: Path, dst_root: Path, existing: Path
+) -> bool:
+    """Hardlink one file to an already-mirrored link of the same inode.
+
+    Falls back to a normal copy when the target filesystem refuses links;
+    returns whether a hardlink was created.
+    """
+    destination = mirror_destination(src_root, src_path, dst_root)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        if destination.exists() or destination.is_symlink():
+            destination.unlink()
+        os.link(existing, destination)
+    except OSError:
+        shutil.copy2(src_path, destination)
+        return False
+    return True
@@ -1,6 +1,7 @@
 """CLI entrypoint for Ark."""
 
 import logging
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Callable
 
@@ -12,11 +13,17 @@ from ark.ai.decision_client import (
     llm_path_risk,
     llm_suffix_risk,
 )
+from ark.ai.path_families import PathFamily
+from ark.ai.router import GOOGLE_CREDENTIALS, LLM_SCHEDULER
 from ark.pipeline.config import PipelineConfig
 from ark.pipeline.run_backup import run_backup_pipeline
 from ark.runtime_logging import setup_runtime_logging
 from ark.state.backup_run_store import BackupRunStore
 from ark.state.config_store import JSONConfigStore
+from ark.state.decision_cache import DecisionCache
+from ark.state.scan_index import ScanIndex
+from ark.state.token_store import EncryptedTokenStore
+from ark.tui.llm_catalog import batch_token_budget, rate_limits
 from ark.tui.main_menu import run_main_menu
 from ark.tui.stage1_review import SuffixReviewRow
 from ark.tui.stage3_review import PathReviewRow
@@ -41,6 +48,9 @@ def run_main_menu_flow() -> None:
     setup_runtime_logging("INFO")
     store = JSONConfigStore(Path.home() / ".ark" / "config.json")
     config = store.load()
+    GOOGLE_CREDENTIALS.store = EncryptedTokenStore(
+        Path.home() / ".ark" / "cache" / "google_tokens.json"
+    )
 
     run_main_menu(
         config=config,
@@ -117,7 +127,18 @@ def _execute_backup(
             payload={"message": message},
         )
 
-    llm_kwargs = _llm_call_kwargs(config)
+    decision_cache = DecisionCache(
+        Path.home() / ".ark" / "cache" / "llm_decisions.sqlite3"
+    )
+    llm_kwargs = {**_llm_call_kwargs(config), "cache": decision_cache}
+    LLM_SCHEDULER.configure(
+        config.llm_provider,
+        rate_limits(
+            config.llm_provider,
+            requests_per_minute=config.llm_requests_per_minute,
+            tokens_per_minute=config.llm_tokens_per_minute,
+        ),
+    )
 
     def suffix_risk_dispatch(exts: list[str]) -> dict[str, dict[str, object]]:
         if not config.ai_suffix_enabled:
@@ -135,14 +156,16 @@ def _execute_backup(
             progress_emit(f"[ai:fallback] suffix local heuristic ({exc})")
             return _heuristic_suffix_risk(exts)
 
-    def path_risk_dispatch(paths: list[str]) -> dict[str, dict[str, object]]:
+    def path_risk_dispatch(
+        paths: list[str], families: Mapping[str, PathFamily] | None = None
+    ) -> dict[str, dict[str, object]]:
         if not config.ai_path_enabled:
             return {}
         if not config.llm_enabled:
             return _heuristic_path_risk(paths)
         try:
             progress_emit(f"[ai:remote] path classification batch={len(paths)}")
-            return llm_path_risk(paths, **llm_kwargs)
+            return llm_path_risk(paths, families=families, **llm_kwargs)
         except Exception as exc:
             progress_emit(f"[ai:fallback] path local heuristic ({exc})")
             return _heuristic_path_risk(paths)
@@ -168,6 +191,7 @@ def _execute_backup(
                 "reason": "fallback",
             }
 
+    scan_index = ScanIndex(Path.home() / ".ark" / "state" / "scan_index.sqlite3")
     try:
         return run_backup_pipeline(
             target=target,
@@ -184,11 +208,20 @@ def _execute_backup(
             run_store=run_store,
             run_id=active_run_id,
             resume=should_resume,
+            scan_workers=config.scan_workers,
+            scan_index=scan_index,
+            stream_scan=config.stream_scan,
+            one_filesystem=config.one_filesystem,
+            ai_concurrency=config.ai_concurrency,
+            ai_token_budget=batch_token_budget(config.llm_provider),
         )
     except KeyboardInterrupt:
         run_store.mark_status(active_run_id, "paused")
         typer.echo("Paused safely. Resume from latest checkpoint on next run.")
         return ["Backup paused. Resume from latest checkpoint on next run."]
+    finally:
+        scan_index.close()
+        decision_cache.close()
 
 
 def _non_interactive_stage1(rows: list[SuffixReviewRow]) -> set[str]:
@@ -1,8 +1,95 @@
 """Filesystem scanning helpers."""
 
-from dataclasses import dataclass
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
 from pathlib import Path
 
+from ark.collector.walker import (
+    DEFAULT_SCAN_WORKERS,
+    DirectoryListing,
+    FileRecord,
+    stream_roots,
+)
+
+SUFFIX_EXAMPLE_LIMIT = 3
+
+
+@dataclass
+class SuffixStats:
+    """File count, byte total and largest example paths for one suffix."""
+
+    count: int = 0
+    total_bytes: int = 0
+    largest: list[tuple[int, str]] = field(default_factory=list)
+
+    def add(self, size: int, path: str) -> None:
+        """Count one file, keeping the largest examples in size order."""
+        self.count += 1
+        self.total_bytes += size
+        if len(self.largest) < SUFFIX_EXAMPLE_LIMIT or size > self.largest[-1][0]:
+            self.largest.append((size, path))
+            self.largest.sort(key=lambda item: (-item[0], item[1]))
+            del self.largest[SUFFIX_EXAMPLE_LIMIT:]
+
+
+class SuffixHistogram:
+    """Per-suffix volume summary folded in while the scan runs."""
+
+    def __init__(self) -> None:
+        self.stats: dict[str, SuffixStats] = {}
+
+    def add_records(self, records: Iterable[FileRecord]) -> None:
+        """Count records; files without a suffix are not tracked."""
+        stats = self.stats
+        for record in records:
+            suffix = record.path.suffix
+            if not suffix:
+                continue
+            ext = suffix.lower()
+            entry = stats.get(ext)
+            if entry is None:
+                entry = stats[ext] = SuffixStats()
+            entry.add(record.size, str(record.path))
+
+    def extensions(self) -> set[str]:
+        """Return every suffix seen so far."""
+        return set(self.stats)
+
+    def get(self, ext: str) -> SuffixStats | None:
+        """Return stats for one lower-cased suffix."""
+        return self.stats.get(ext)
+
+    def to_payload(self) -> dict[str, list]:
+        """Serialize for scan checkpoints."""
+        return {
+            ext: [entry.count, entry.total_bytes, entry.largest]
+            for ext, entry in sorted(self.stats.items())
+        }
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, list]) -> SuffixHistogram:
+        """Restore a histogram written by ``to_payload``."""
+        histogram = cls()
+        for ext, (count, total_bytes, largest) in payload.items():
+            histogram.stats[ext] = SuffixStats(
+                count=int(count),
+                total_bytes=int(total_bytes),
+                largest=[(int(size), str(path)) for size, path in largest],
+            )
+        return histogram
+
+    @classmethod
+    def from_records(
+        cls, files_by_root: Mapping[Path, Iterable[FileRecord]]
+    ) -> SuffixHistogram:
+        """Build a histogram from already-collected ``files_by_root``."""
+        histogram = cls()
+        for records in files_by_root.values():
+            histogram.add_records(records)
+        return histogram
+
 
 @dataclass
 class SuffixSummary:
@@ -10,20 +97,25 @@ class SuffixSummary:
 
     extensions: set[str]
     no_extension_names: set[str]
+    histogram: SuffixHistogram = field(default_factory=SuffixHistogram)
 
 
-def collect_suffix_summary(roots: list[Path]) -> SuffixSummary:
-    """Collect deduplicated suffix summary from file roots."""
-    extensions: set[str] = set()
+def collect_suffix_summary(
+    roots: list[Path], workers: int = DEFAULT_SCAN_WORKERS
+) -> SuffixSummary:
+    """Collect suffix summary and histogram from roots in one parallel walk."""
+    histogram = SuffixHistogram()
     no_extension_names: set[str] = set()
 
-    for root in roots:
-        for path in root.rglob("*"):
-            if not path.is_file():
-                continue
-            if path.suffix:
-                extensions.add(path.suffix.lower())
-            else:
-                no_extension_names.add(path.name)
+    def on_listing(listing: DirectoryListing) -> None:
+        histogram.add_records(listing.files)
+        no_extension_names.update(
+            record.path.name for record in listing.files if not record.path.suffix
+        )
 
-    return SuffixSummary(extensions=extensions, no_extension_names=no_extension_names)
+    stream_roots(roots, workers=workers, on_listing=on_listing)
+    return SuffixSummary(
+        extensions=histogram.extensions(),
+        no_extension_names=no_extension_names,
+        histogram=histogram,
+    )
@@ -0,0 +1,136 @@
+"""On-disk spool of scanned file records for bounded-memory pipelines."""
+
+from __future__ import annotations
+
+import json
+import shutil
+import tempfile
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import IO
+
+from ark.collector.walker import FileRecord
+
+_MANIFEST_NAME = "roots.json"
+
+
+class SpooledRecords:
+    """Re-iterable view over the records spooled for one root."""
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def __iter__(self) -> Iterator[FileRecord]:
+        if not self.path.exists():
+            return
+        with self.path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                if line.strip():
+                    yield FileRecord.from_row(json.loads(line))
+
+
+class RecordSpool(Mapping[Path, SpooledRecords]):
+    """Append-only per-root record files exposed as ``files_by_root``.
+
+    Stages iterate ``items()``/``values()`` exactly like the in-memory dict,
+    but records are streamed from disk so peak memory does not grow with the
+    number of scanned files.
+    """
+
+    def __init__(self, directory: Path | None = None):
+        self._temporary = directory is None
+        self.directory = directory or Path(tempfile.mkdtemp(prefix="ark-scan-"))
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._roots: list[Path] = []
+        self._root_ids: dict[Path, int] = {}
+        self._handles: dict[Path, IO[str]] = {}
+        self.record_count = 0
+
+    @classmethod
+    def open(cls, directory: Path) -> RecordSpool:
+        """Reopen a finished spool written by an earlier run."""
+        spool = cls(directory)
+        manifest = json.loads((directory / _MANIFEST_NAME).read_text(encoding="utf-8"))
+        for root, root_id in manifest.get("roots", []):
+            spool._roots.append(Path(root))
+            spool._root_ids[Path(root)] = int(root_id)
+        spool.record_count = int(manifest.get("record_count", 0))
+        return spool
+
+    def add_root(self, root: Path) -> None:
+        """Register one scanned root, keeping registration order."""
+        if root not in self._root_ids:
+            self._root_ids[root] = len(self._root_ids)
+            self._roots.append(root)
+
+    def append(self, root: Path, records: list[FileRecord]) -> None:
+        """Append one batch of records for a root."""
+        self.add_root(root)
+        handle = self._handles.get(root)
+        if handle is None:
+            handle = self._root_path(root).open("a", encoding="utf-8")
+            self._handles[root] = handle
+        for record in records:
+            handle.write(json.dumps(record.to_row(), separators=(",", ":")))
+            handle.write("\n")
+        self.record_count += len(records)
+
+    def finish(self, roots: list[Path] | None = None) -> None:
+        """Flush writers and persist the manifest in ``roots`` order."""
+        for handle in self._handles.values():
+            handle.close()
+        self._handles.clear()
+        if roots is not None:
+            for root in roots:
+                self.add_root(root)
+            self._roots = [root for root in roots if root in self._root_ids]
+        (self.directory / _MANIFEST_NAME).write_text(
+            json.dumps(
+                {
+                    "roots": [
+                        [str(root), self._root_ids[root]] for root in self._roots
+                    ],
+                    "record_count": self.record_count,
+                }
+            ),
+            encoding="utf-8",
+        )
+
+    def reset(self) -> None:
+        """Drop every spooled record so a scan can start over."""
+        for handle in self._handles.values():
+            handle.close()
+        self._handles.clear()
+        for path in self.directory.glob("root-*.jsonl"):
+            path.unlink()
+        (self.directory / _MANIFEST_NAME).unlink(missing_ok=True)
+        self._roots.clear()
+        self._root_ids.clear()
+        self.record_count = 0
+
+    def close(self) -> None:
+        """Close writers, removing the spool if it lives in a temp directory."""
+        for handle in self._handles.values():
+            handle.close()
+        self._handles.clear()
+        if self._temporary:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+    def discard(self) -> None:
+        """Close writers and remove the spool directory unconditionally."""
+        self._temporary = True
+        self.close()
+
+    def __getitem__(self, root: Path) -> SpooledRecords:
+        if root not in self._root_ids:
+            raise KeyError(root)
+        return SpooledRecords(self._root_path(root))
+
+    def __iter__(self) -> Iterator[Path]:
+        return iter(list(self._roots))
+
+    def __len__(self) -> int:
+        return len(self._roots)
+
+    def _root_path(self, root: Path) -> Path:
+        return self.directory / f"root-{self._root_ids[root]}.jsonl"
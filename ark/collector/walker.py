@@ -0,0 +1,465 @@
+"""Parallel scandir walker for multi-root source scans."""
+
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Collection, Mapping, Protocol, Sequence
+
+from ark.rules.local_rules import (
+    IGNORE_FILE_NAMES,
+    IgnoreLayer,
+    build_scan_pathspec,
+    load_directory_ignore_spec,
+    should_ignore_in_layers,
+)
+
+DEFAULT_SCAN_WORKERS = 8
+_INDEX_FLUSH_SIZE = 500
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+@dataclass(frozen=True, slots=True)
+class FileRecord:
+    """Stat snapshot captured once per discovered file during the scan."""
+
+    path: Path
+    size: int
+    mtime_ns: int
+    inode: int
+    device: int
+    mode: int
+    nlink: int = 1
+
+    @classmethod
+    def from_stat(cls, path: Path, stat: os.stat_result) -> FileRecord:
+        """Build one record from an existing stat result."""
+        return cls(
+            path=path,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            inode=stat.st_ino,
+            device=stat.st_dev,
+            mode=stat.st_mode,
+            nlink=stat.st_nlink,
+        )
+
+    @property
+    def hardlink_key(self) -> tuple[int, int] | None:
+        """Return ``(device, inode)`` when other links to this file may exist."""
+        if self.nlink > 1:
+            return self.device, self.inode
+        return None
+
+    def to_row(self) -> list:
+        """Serialize into a compact JSON-friendly row."""
+        return [
+            str(self.path),
+            self.size,
+            self.mtime_ns,
+            self.inode,
+            self.device,
+            self.mode,
+            self.nlink,
+        ]
+
+    @classmethod
+    def from_row(cls, row: list) -> FileRecord:
+        """Restore one record serialized by ``to_row``.
+
+        Rows written before ``nlink`` was recorded restore as single links.
+        """
+        path, size, mtime_ns, inode, device, mode, *rest = row
+        return cls(
+            path=Path(path),
+            size=int(size),
+            mtime_ns=int(mtime_ns),
+            inode=int(inode),
+            device=int(device),
+            mode=int(mode),
+            nlink=int(rest[0]) if rest else 1,
+        )
+
+
+@dataclass
+class DirectorySnapshot:
+    """Unfiltered listing of one directory keyed by its own stat identity."""
+
+    path: str
+    mtime_ns: int
+    inode: int
+    device: int
+    listed_at_ns: int
+    files: list[FileRecord] = field(default_factory=list)
+    subdirs: list[str] = field(default_factory=list)
+
+
+class DirectoryIndex(Protocol):
+    """Persistent directory listing cache consulted by the walker."""
+
+    def lookup(self, directory: str) -> DirectorySnapshot | None:
+        """Return the last stored snapshot for one directory."""
+
+    def store(
+        self, snapshots: list[DirectorySnapshot], removed_dirs: list[str]
+    ) -> None:
+        """Persist fresh snapshots and forget removed subtrees."""
+
+
+@dataclass
+class DirectoryListing:
+    """Files and kept subdirectories discovered in one directory."""
+
+    root: Path
+    directory: Path
+    files: list[FileRecord] = field(default_factory=list)
+    subdirs: list[tuple[Path, str]] = field(default_factory=list)
+    from_index: bool = False
+    snapshot: DirectorySnapshot | None = None
+    removed_dirs: list[str] = field(default_factory=list)
+    layers: tuple[IgnoreLayer, ...] = ()
+    resumed: bool = False
+
+
+def walk_roots(
+    roots: list[Path],
+    workers: int = DEFAULT_SCAN_WORKERS,
+    on_listing: Callable[[DirectoryListing], None] | None = None,
+    index: DirectoryIndex | None = None,
+    exclude_dirs: Collection[str] = (),
+    one_filesystem: bool = False,
+    completed_dirs: Mapping[str, Sequence[str]] | None = None,
+) -> dict[Path, list[FileRecord]]:
+    """Walk roots concurrently and return sorted file records per root."""
+    files_by_root: dict[Path, list[FileRecord]] = {}
+
+    def collect(listing: DirectoryListing) -> None:
+        files_by_root.setdefault(listing.root, []).extend(listing.files)
+        if on_listing:
+            on_listing(listing)
+
+    scanned = stream_roots(
+        roots,
+        workers=workers,
+        on_listing=collect,
+        index=index,
+        exclude_dirs=exclude_dirs,
+        one_filesystem=one_filesystem,
+        completed_dirs=completed_dirs,
+    )
+    return {
+        root: sorted(files_by_root.get(root, []), key=lambda item: str(item.path))
+        for root in scanned
+    }
+
+
+def stream_roots(
+    roots: list[Path],
+    workers: int = DEFAULT_SCAN_WORKERS,
+    on_listing: Callable[[DirectoryListing], None] | None = None,
+    index: DirectoryIndex | None = None,
+    exclude_dirs: Collection[str] = (),
+    one_filesystem: bool = False,
+    completed_dirs: Mapping[str, Sequence[str]] | None = None,
+) -> list[Path]:
+    """Walk roots concurrently, handing each listing to ``on_listing``.
+
+    ``on_listing`` always runs on the calling thread. ``exclude_dirs`` are
+    never entered, ``one_filesystem`` skips directories on another device,
+    and ``completed_dirs`` (directory -> kept subdirectory names) are not
+    re-listed. Returns the scanned roots in input order.
+    """
+    if workers <= 0:
+        raise ValueError("workers must be positive")
+
+    scanned: list[Path] = []
+    devices: dict[Path, int | None] = {}
+    snapshots: list[DirectorySnapshot] = []
+    removed_dirs: list[str] = []
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ark-scan")
+    pending: dict[Future[DirectoryListing], Path] = {}
+    completed_dirs = completed_dirs or {}
+
+    def submit(
+        root: Path, layers: tuple[IgnoreLayer, ...], directory: Path, rel: str
+    ) -> None:
+        subdirs = completed_dirs.get(str(directory))
+        if subdirs is not None:
+            future = executor.submit(
+                _resume_directory, root, layers, directory, rel, subdirs
+            )
+        else:
+            future = executor.submit(
+                _list_directory, root, layers, directory, rel, index, devices[root]
+            )
+        pending[future] = root
+
+    def flush_index() -> None:
+        if index is not None and (snapshots or removed_dirs):
+            index.store(list(snapshots), list(removed_dirs))
+        snapshots.clear()
+        removed_dirs.clear()
+
+    try:
+        for root in roots:
+            if not root.exists() or not root.is_dir() or root in scanned:
+                continue
+            scanned.append(root)
+            devices[root] = root.stat().st_dev if one_filesystem else None
+            layers = (IgnoreLayer("", build_scan_pathspec(root)),)
+            submit(root, layers, root, "")
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                root = pending.pop(future)
+                listing = future.result()
+                for child, child_rel in listing.subdirs:
+                    if exclude_dirs and str(child) in exclude_dirs:
+                        continue
+                    submit(root, listing.layers, child, child_rel)
+                if listing.snapshot is not None:
+                    snapshots.append(listing.snapshot)
+                removed_dirs.extend(listing.removed_dirs)
+                if len(snapshots) >= _INDEX_FLUSH_SIZE:
+                    flush_index()
+                if on_listing:
+                    on_listing(listing)
+        flush_index()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    return scanned
+
+
+def _list_directory(
+    root: Path,
+    layers: tuple[IgnoreLayer, ...],
+    directory: Path,
+    rel: str,
+    index: DirectoryIndex | None = None,
+    device: int | None = None,
+) -> DirectoryListing:
+    """List one directory applying the same pruning rules as ``os.walk``.
+
+    When ``device`` is set, a directory on any other device is left unlisted.
+    """
+    listing = DirectoryListing(root=root, directory=directory, layers=layers)
+
+    def ignored(name: str, is_dir: bool) -> bool:
+        child_rel = f"{rel}/{name}" if rel else name
+        return should_ignore_in_layers(listing.layers, child_rel, is_dir=is_dir)
+
+    if index is None:
+
+        def select_files(entries: list[os.DirEntry]) -> list[os.DirEntry]:
+            stamps: dict[str, tuple[int, int]] = {}
+            for entry in entries:
+                if entry.name in IGNORE_FILE_NAMES:
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    stamps[entry.name] = (stat.st_mtime_ns, stat.st_size)
+            listing.layers = _push_ignore_layer(layers, directory, rel, stamps)
+            return [entry for entry in entries if not ignored(entry.name, False)]
+
+        snapshot = _read_directory(directory, select_files=select_files, device=device)
+        if snapshot is None:
+            return listing
+        listing.files = snapshot.files
+    else:
+        snapshot = _read_directory_with_index(directory, index, listing, device)
+        if snapshot is None:
+            return listing
+        stamps: dict[str, tuple[int, int]] = {}
+        for record in snapshot.files:
+            if record.path.name in IGNORE_FILE_NAMES:
+                try:
+                    stat = os.stat(record.path)
+                except OSError:
+                    continue
+                stamps[record.path.name] = (stat.st_mtime_ns, stat.st_size)
+        listing.layers = _push_ignore_layer(layers, directory, rel, stamps)
+        listing.files = [
+            record for record in snapshot.files if not ignored(record.path.name, False)
+        ]
+        if listing.from_index:
+            listing.files = _restat_records(listing.files)
+
+    for name in snapshot.subdirs:
+        if not ignored(name, True):
+            listing.subdirs.append((directory / name, f"{rel}/{name}" if rel else name))
+    return listing
+
+
+def _resume_directory(
+    root: Path,
+    layers: tuple[IgnoreLayer, ...],
+    directory: Path,
+    rel: str,
+    subdirs: Sequence[str],
+) -> DirectoryListing:
+    """Rebuild the listing of an already completed directory without scandir.
+
+    Only the ignore files are stat'ed so nested rules still reach the
+    unfinished subtrees below; files come from the caller's checkpoint.
+    """
+    listing = DirectoryListing(
+        root=root, directory=directory, layers=layers, resumed=True
+    )
+    stamps: dict[str, tuple[int, int]] = {}
+    for name in IGNORE_FILE_NAMES:
+        try:
+            stat = os.stat(directory / name)
+        except OSError:
+            continue
+        stamps[name] = (stat.st_mtime_ns, stat.st_size)
+    listing.layers = _push_ignore_layer(layers, directory, rel, stamps)
+    for name in subdirs:
+        child_rel = f"{rel}/{name}" if rel else name
+        if not should_ignore_in_layers(listing.layers, child_rel, is_dir=True):
+            listing.subdirs.append((directory / name, child_rel))
+    return listing
+
+
+def _push_ignore_layer(
+    layers: tuple[IgnoreLayer, ...],
+    directory: Path,
+    rel: str,
+    stamps: dict[str, tuple[int, int]],
+) -> tuple[IgnoreLayer, ...]:
+    """Stack ignore files found in a nested directory on top of ``layers``.
+
+    The root's own ignore files are already part of the first layer.
+    """
+    if not rel or not stamps:
+        return layers
+    spec = load_directory_ignore_spec(directory, stamps)
+    if spec is None:
+        return layers
+    return (*layers, IgnoreLayer(rel, spec))
+
+
+def _read_directory_with_index(
+    directory: Path,
+    index: DirectoryIndex,
+    listing: DirectoryListing,
+    device: int | None = None,
+) -> DirectorySnapshot | None:
+    """Reuse the indexed listing when the directory identity is unchanged.
+
+    Only the names are trusted; the caller re-stats the files it keeps.
+    """
+    try:
+        stat = os.stat(directory)
+    except OSError:
+        return None
+    if device is not None and stat.st_dev != device:
+        return None
+
+    cached = index.lookup(str(directory))
+    if cached is not None and _snapshot_is_current(cached, stat):
+        listing.from_index = True
+        return cached
+
+    snapshot = _read_directory(directory, stat=stat)
+    if snapshot is None:
+        return None
+    listing.snapshot = snapshot
+    if cached is not None:
+        kept = set(snapshot.subdirs)
+        listing.removed_dirs = [
+            str(directory / name) for name in cached.subdirs if name not in kept
+        ]
+    return snapshot
+
+
+def _restat_records(records: list[FileRecord]) -> list[FileRecord]:
+    """Stat indexed files again, since in-place edits keep the directory mtime.
+
+    Files that vanished since the listing are dropped.
+    """
+    fresh: list[FileRecord] = []
+    for record in records:
+        try:
+            stat = os.stat(record.path)
+        except OSError:
+            continue
+        fresh.append(FileRecord.from_stat(record.path, stat))
+    return fresh
+
+
+def _snapshot_is_current(snapshot: DirectorySnapshot, stat: os.stat_result) -> bool:
+    """Return whether a snapshot still describes the directory on disk.
+
+    Snapshots taken within ``_RACY_WINDOW_NS`` of the directory mtime are not
+    trusted, since a change in the same timestamp tick would go unnoticed.
+    """
+    if (snapshot.mtime_ns, snapshot.inode, snapshot.device) != (
+        stat.st_mtime_ns,
+        stat.st_ino,
+        stat.st_dev,
+    ):
+        return False
+    return snapshot.listed_at_ns - snapshot.mtime_ns > _RACY_WINDOW_NS
+
+
+def _read_directory(
+    directory: Path,
+    select_files: Callable[[list[os.DirEntry]], list[os.DirEntry]] | None = None,
+    stat: os.stat_result | None = None,
+    device: int | None = None,
+) -> DirectorySnapshot | None:
+    """Scan one directory with ``os.scandir`` and stat each kept file once.
+
+    ``select_files`` sees every non-directory entry before any file is
+    stat'ed and returns the ones to keep. A directory whose device differs
+    from ``device`` is not read. The directory itself is only stat'ed for a
+    device check; without ``stat`` or ``device`` the snapshot's identity
+    fields are left at zero. Symlinked directories are neither walked nor
+    reported, matching ``os.walk(followlinks=False)``; unreadable entries
+    such as broken symlinks are skipped.
+    """
+    listed_at_ns = time.time_ns()
+    try:
+        if stat is None and device is not None:
+            stat = os.stat(directory)
+        if device is not None and stat.st_dev != device:
+            return None
+        iterator = os.scandir(directory)
+    except OSError:
+        return None
+
+    snapshot = DirectorySnapshot(
+        path=str(directory),
+        mtime_ns=stat.st_mtime_ns if stat else 0,
+        inode=stat.st_ino if stat else 0,
+        device=stat.st_dev if stat else 0,
+        listed_at_ns=listed_at_ns,
+    )
+    file_entries: list[os.DirEntry] = []
+    with iterator:
+        for entry in iterator:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if not entry.is_symlink():
+                    snapshot.subdirs.append(entry.name)
+                continue
+            file_entries.append(entry)
+
+    if select_files is not None:
+        file_entries = select_files(file_entries)
+    for entry in file_entries:
+        try:
+            file_stat = entry.stat()
+        except OSError:
+            continue
+        snapshot.files.append(FileRecord.from_stat(directory / entry.name, file_stat))
+    return snapshot
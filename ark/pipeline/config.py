@@ -2,15 +2,25 @@
 
 from dataclasses import dataclass, field
 
+from ark.ai.batcher import DEFAULT_AI_CONCURRENCY
+from ark.collector.walker import DEFAULT_SCAN_WORKERS
+
 
 @dataclass
 class PipelineConfig:
-    """User-editable runtime configuration for backup pipeline execution."""
+    """User-editable runtime configuration for backup pipeline execution.
+
+    ``llm_requests_per_minute`` and ``llm_tokens_per_minute`` override the
+    provider preset's pacing when set; ``0`` disables that limit.
+    """
 
     target: str = ""
     source_roots: list[str] = field(default_factory=list)
     dry_run: bool = False
     non_interactive: bool = False
+    scan_workers: int = DEFAULT_SCAN_WORKERS
+    stream_scan: bool = False
+    one_filesystem: bool = False
     llm_enabled: bool = False
     llm_provider_group: str = ""
     llm_provider: str = ""
@@ -21,8 +31,11 @@ class PipelineConfig:
     google_client_id: str = ""
     google_client_secret: str = ""
     google_refresh_token: str = ""
+    llm_requests_per_minute: int | None = None
+    llm_tokens_per_minute: int | None = None
     ai_suffix_enabled: bool = True
     ai_path_enabled: bool = True
+    ai_concurrency: int = DEFAULT_AI_CONCURRENCY
     send_full_path_to_ai: bool = False
     ai_prune_mode: str = "hide_low_value"
 
@@ -33,6 +46,14 @@ class PipelineConfig:
             errors.append("target is required")
         if not self.source_roots:
             errors.append("source roots are required")
+        if self.scan_workers < 1:
+            errors.append("scan workers must be at least 1")
+        if self.ai_concurrency < 1:
+            errors.append("ai concurrency must be at least 1")
+        if (self.llm_requests_per_minute or 0) < 0:
+            errors.append("llm requests per minute must be 0 or more")
+        if (self.llm_tokens_per_minute or 0) < 0:
+            errors.append("llm tokens per minute must be 0 or more")
         if self.llm_enabled and not self.llm_provider.strip():
             errors.append("llm provider is required when litellm is enabled")
         if self.llm_enabled and not self.llm_model.strip():
@@ -1,23 +1,51 @@
 """Run backup pipeline orchestration."""
 
-import os
+import time
+from collections.abc import Iterable, Iterator, Mapping
 from pathlib import Path
 from typing import Callable
 
-from ark.backup.executor import mirror_copy_one
-from ark.decision.tiering import classify_tier
-from ark.rules.local_rules import (
-    build_scan_pathspec,
-    hard_drop_suffixes,
-    keep_suffixes,
-    should_ignore_relpath,
+from ark.ai.batcher import (
+    DEFAULT_AI_CONCURRENCY,
+    DEFAULT_TOKEN_BUDGET,
+    TokenBudgetBatcher,
+    map_batches_ordered,
+)
+from ark.ai.path_families import (
+    MIN_BASENAME_FAMILY_MEMBERS,
+    MIN_FAMILY_MEMBERS,
+    PathFamily,
+    collapse_path_families,
 )
+from ark.backup.executor import mirror_copy_one, mirror_destination, mirror_link_one
+from ark.collector.scanner import SuffixHistogram, SuffixStats
+from ark.collector.spool import RecordSpool
+from ark.collector.walker import (
+    DEFAULT_SCAN_WORKERS,
+    DirectoryIndex,
+    DirectoryListing,
+    FileRecord,
+    stream_roots,
+    walk_roots,
+)
+from ark.decision.tiering import classify_tier
+from ark.platforms.base import PlatformAdapter, current_adapter
+from ark.rules.local_rules import hard_drop_suffixes, keep_suffixes
 from ark.state.backup_run_store import BackupRunStore
+from ark.state.review_journal import ReviewJournal
+from ark.state.scan_log import ScanSegmentLog
 from ark.signals.extractor import extension_score
 from ark.tui.stage1_review import SuffixReviewRow, run_stage1_review
 from ark.tui.stage3_review import PathReviewRow, run_stage3_review
 
 HARD_DROP_SUFFIXES = hard_drop_suffixes()
+_SCAN_SEGMENT_SIZE = 200
+_STAGE2_INPUT_FORMAT = "families-v2"
+_FAMILY_LOG_LIMIT = 5
+
+# Called as ``fn(paths)``; batches holding family templates also pass them as
+# ``families=``, a mapping from template to ``PathFamily``.
+PathRiskFn = Callable[..., dict[str, dict[str, object]]]
 
 
 def run_backup_pipeline(
@@ -27,7 +55,7 @@ def run_backup_pipeline(
     stage1_review_fn: Callable[[list[SuffixReviewRow]], set[str]] | None = None,
     stage3_review_fn: Callable[[list[PathReviewRow]], set[str]] | None = None,
     suffix_risk_fn: Callable[[list[str]], dict[str, dict[str, object]]] | None = None,
-    path_risk_fn: Callable[[list[str]], dict[str, dict[str, object]]] | None = None,
+    path_risk_fn: PathRiskFn | None = None,
     directory_decision_fn: (
         Callable[[str, list[str], list[str]], dict[str, object]] | None
     ) = None,
@@ -37,10 +65,31 @@ def run_backup_pipeline(
     run_store: BackupRunStore | None = None,
     run_id: str | None = None,
     resume: bool = False,
+    scan_workers: int = DEFAULT_SCAN_WORKERS,
+    scan_index: DirectoryIndex | None = None,
+    stream_scan: bool = False,
+    platform_adapter: PlatformAdapter | None = None,
+    one_filesystem: bool = False,
+    ai_concurrency: int = DEFAULT_AI_CONCURRENCY,
+    ai_token_budget: int = DEFAULT_TOKEN_BUDGET,
 ) -> list[str]:
-    """Run staged review flow and return progress logs."""
+    """Run staged review flow and return progress logs.
+
+    With ``stream_scan`` the scan spools file records to disk instead of
+    holding them in memory; later stages re-read the spool and only keep
+    the suffix set and stage-2 candidates. ``platform_adapter`` (defaults to
+    the running platform) supplies mounts that the scan must never enter,
+    and ``one_filesystem`` keeps each root's walk on the root's device.
+    Hardlinked files are classified once and re-linked at the target.
+    Up to ``ai_concurrency`` stage-2 ``path_risk_fn`` batches run at once,
+    each packed to fit ``ai_token_budget`` estimated tokens; a batch holding
+    family templates also gets their ``PathFamily`` entries as ``families=``.
+    """
     progress = progress_callback or (lambda _message: None)
     normalized_source_roots = [str(item) for item in (source_roots or [])]
+    exclude_dirs = _excluded_scan_dirs(
+        platform_adapter or current_adapter(), source_roots or [], progress
+    )
 
     resume_state: dict = {}
     if run_store:
@@ -59,18 +108,107 @@ def run_backup_pipeline(
         if run_store and run_id:
             run_store.save_checkpoint(run_id, stage=stage, payload=payload)
 
+    spool: RecordSpool | None = None
+    scan_log = None
+    if run_store and run_id:
+        scan_log = ScanSegmentLog(run_store.scan_log_path(run_id))
+    suffix_histogram = SuffixHistogram()
     try:
-        files_by_root = _collect_files_by_root(
-            source_roots,
-            progress_callback=progress,
-            resume_payload=resume_state.get("scan") if resume else None,
-            checkpoint_callback=lambda payload: checkpoint("scan", payload),
-        )
+        if stream_scan:
+            spool, suffix_histogram = _stream_files_by_root(
+                source_roots,
+                spool_dir=(
+                    run_store.scan_spool_dir(run_id) if run_store and run_id else None
+                ),
+                progress_callback=progress,
+                resume_payload=resume_state.get("scan") if resume else None,
+                checkpoint_callback=lambda payload: checkpoint("scan", payload),
+                scan_workers=scan_workers,
+                scan_index=scan_index,
+                exclude_dirs=exclude_dirs,
+                one_filesystem=one_filesystem,
+            )
+            files_by_root: Mapping[Path, Iterable[FileRecord]] = spool
+        else:
+            files_by_root, suffix_histogram = _collect_files_by_root(
+                source_roots,
+                progress_callback=progress,
+                resume_payload=resume_state.get("scan") if resume else None,
+                checkpoint_callback=lambda payload: checkpoint("scan", payload),
+                scan_workers=scan_workers,
+                scan_index=scan_index,
+                exclude_dirs=exclude_dirs,
+                one_filesystem=one_filesystem,
+                scan_log=scan_log,
+            )
     except KeyboardInterrupt:
+        if spool is not None:
+            spool.close()
+        if scan_log is not None:
+            scan_log.close()
         if run_store and run_id:
             run_store.mark_status(run_id, "paused")
         raise
 
+    try:
+        logs = _run_review_and_copy(
+            files_by_root=files_by_root,
+            suffix_histogram=suffix_histogram,
+            target=target,
+            dry_run=dry_run,
+            source_roots=source_roots,
+            stage1_review_fn=stage1_review_fn,
+            stage3_review_fn=stage3_review_fn,
+            suffix_risk_fn=suffix_risk_fn,
+            path_risk_fn=path_risk_fn,
+            directory_decision_fn=directory_decision_fn,
+            send_full_path_to_ai=send_full_path_to_ai,
+            ai_prune_mode=ai_prune_mode,
+            progress=progress,
+            checkpoint=checkpoint,
+            resume_state=resume_state,
+            run_store=run_store,
+            run_id=run_id,
+            resume=resume,
+            ai_concurrency=ai_concurrency,
+            ai_token_budget=ai_token_budget,
+        )
+    except BaseException:
+        if spool is not None:
+            spool.close()
+        raise
+    if spool is not None:
+        spool.discard()
+    if scan_log is not None:
+        scan_log.reset()
+    return logs
+
+
+def _run_review_and_copy(
+    files_by_root: Mapping[Path, Iterable[FileRecord]],
+    suffix_histogram: SuffixHistogram | None,
+    target: str,
+    dry_run: bool,
+    source_roots: list[Path] | None,
+    stage1_review_fn: Callable[[list[SuffixReviewRow]], set[str]] | None,
+    stage3_review_fn: Callable[[list[PathReviewRow]], set[str]] | None,
+    suffix_risk_fn: Callable[[list[str]], dict[str, dict[str, object]]] | None,
+    path_risk_fn: PathRiskFn | None,
+    directory_decision_fn: (
+        Callable[[str, list[str], list[str]], dict[str, object]] | None
+    ),
+    send_full_path_to_ai: bool,
+    ai_prune_mode: str,
+    progress: Callable[[str], None],
+    checkpoint: Callable[[str, dict], None],
+    resume_state: dict,
+    run_store: BackupRunStore | None,
+    run_id: str | None,
+    resume: bool,
+    ai_concurrency: int = DEFAULT_AI_CONCURRENCY,
+    ai_token_budget: int = DEFAULT_TOKEN_BUDGET,
+) -> list[str]:
+
     has_configured_sources = bool(source_roots)
     using_sample_data = not files_by_root and not has_configured_sources
 
@@ -92,6 +230,7 @@ def run_backup_pipeline(
         files_by_root,
         use_sample_rows=using_sample_data,
         suffix_risk_fn=suffix_risk_fn,
+        suffix_histogram=suffix_histogram,
     )
     review_stage1 = stage1_review_fn or run_stage1_review
     whitelist = review_stage1(suffix_rows)
@@ -109,22 +248,38 @@ def run_backup_pipeline(
         progress_callback=progress,
         resume_payload=resume_state.get("stage2") if resume else None,
         checkpoint_callback=lambda payload: checkpoint("stage2", payload),
+        ai_concurrency=ai_concurrency,
+        ai_token_budget=ai_token_budget,
     )
     progress(f"[ai] candidates={len(path_rows)}")
     logs.append(f"Tier candidates: {len(path_rows)}")
 
     logs.append("Stage 3: Final Review and Backup")
+    review_journal = None
     if stage3_review_fn:
         selected_paths = stage3_review_fn(path_rows)
     else:
-        selected_paths = run_stage3_review(
-            path_rows,
-            hide_low_value_default=(ai_prune_mode == "hide_low_value"),
-            resume_state=resume_state.get("review") if resume else None,
-            checkpoint_callback=lambda payload: checkpoint("review", payload),
-            ai_directory_decision_fn=directory_decision_fn,
-        )
+        if run_store and run_id:
+            review_journal = ReviewJournal(run_store.review_journal_path(run_id))
+            if not resume:
+                review_journal.reset()
+        try:
+            selected_paths = run_stage3_review(
+                path_rows,
+                hide_low_value_default=(ai_prune_mode == "hide_low_value"),
+                resume_state=resume_state.get("review") if resume else None,
+                checkpoint_callback=lambda payload: checkpoint("review", payload),
+                ai_directory_decision_fn=directory_decision_fn,
+                ai_directory_workers=ai_concurrency,
+                review_journal=review_journal,
+            )
+        finally:
+            if review_journal is not None:
+                review_journal.close()
     checkpoint("review", {"selected_paths": sorted(selected_paths)})
+    if review_journal is not None:
+        # The final selection is in the run state now; edits are not needed.
+        review_journal.reset()
     progress(f"[review] selected={len(selected_paths)}")
     logs.append(f"Selected paths: {len(selected_paths)}")
     logs.append(f"Target: {target}")
@@ -205,102 +360,277 @@ def _sample_path_rows() -> list[PathReviewRow]:
     ]
 
 
+def _excluded_scan_dirs(
+    adapter: PlatformAdapter,
+    source_roots: list[Path],
+    progress: Callable[[str], None],
+) -> set[str]:
+    """Return adapter-excluded directories that lie inside the source roots."""
+    excluded = {
+        path
+        for path in adapter.excluded_dirs()
+        if any(root in path.parents for root in source_roots)
+    }
+    if excluded:
+        progress(f"[scan] skipping pseudo filesystem mounts={len(excluded)}")
+        for path in sorted(excluded):
+            progress(f"[scan] skip mount={path}")
+    return {str(path) for path in excluded}
+
+
 def _collect_files_by_root(
     source_roots: list[Path] | None,
     progress_callback: Callable[[str], None] | None = None,
     resume_payload: dict | None = None,
     checkpoint_callback: Callable[[dict], None] | None = None,
-) -> dict[Path, list[Path]]:
+    scan_workers: int = DEFAULT_SCAN_WORKERS,
+    scan_index: DirectoryIndex | None = None,
+    exclude_dirs: set[str] | None = None,
+    one_filesystem: bool = False,
+    scan_log: ScanSegmentLog | None = None,
+) -> tuple[dict[Path, list[FileRecord]], SuffixHistogram]:
+    """Scan roots into memory, building the suffix histogram on the way.
+
+    Progress is checkpointed by appending only new rows to ``scan_log``;
+    the run checkpoint itself just records whether the log is complete.
+    A partial log resumes at directory granularity: directories it already
+    lists are not re-read, and their rows are merged back in at the end.
+    """
     progress = progress_callback or (lambda _message: None)
+    histogram = SuffixHistogram()
     if not source_roots:
-        return {}
+        return {}, histogram
 
-    if resume_payload and resume_payload.get("scan_complete"):
-        restored: dict[Path, list[Path]] = {}
+    replay = None
+    if resume_payload and resume_payload.get("segment_log") and scan_log is not None:
+        replay = scan_log.replay()
+        if resume_payload.get("scan_complete") and replay.complete:
+            restored = {
+                Path(root): [FileRecord.from_row(row) for row in rows]
+                for root, rows in replay.rows_by_root.items()
+            }
+            progress("[scan] restored completed scan checkpoint")
+            return restored, SuffixHistogram.from_records(restored)
+    elif resume_payload and resume_payload.get("scan_complete"):
+        restored = {}
         raw = resume_payload.get("files_by_root", {})
         for root, entries in raw.items():
-            restored[Path(root)] = [Path(item) for item in entries]
+            restored[Path(root)] = [
+                record
+                for record in (_restore_file_record(item) for item in entries)
+                if record is not None
+            ]
         progress("[scan] restored completed scan checkpoint")
-        return restored
+        return restored, SuffixHistogram.from_records(restored)
 
-    resumed_seen: set[str] = set()
-    if resume_payload:
-        raw = resume_payload.get("files_by_root", {})
-        for entries in raw.values():
-            resumed_seen.update(str(item) for item in entries)
+    resumed: dict[Path, list[FileRecord]] = {}
+    if replay is not None:
+        for root, rows in replay.rows_by_root.items():
+            records = [FileRecord.from_row(row) for row in rows]
+            resumed.setdefault(Path(root), []).extend(records)
+            histogram.add_records(records)
+        progress(
+            f"[scan] resuming from checkpoint completed_dirs="
+            f"{len(replay.completed_dirs)}"
+        )
+    if scan_log is not None:
+        if replay is None:
+            scan_log.reset()
+        if checkpoint_callback:
+            checkpoint_callback({"segment_log": True, "scan_complete": False})
+
+    for root in source_roots:
+        if root.exists() and root.is_dir():
+            progress(f"[scan] scanning root={root} workers={scan_workers}")
 
-    files_by_root: dict[Path, list[Path]] = {}
+    started = time.monotonic()
     discovered = 0
+    listed_dirs = 0
+    index_hits = 0
+    pending_rows: dict[str, list[list]] = {}
+    pending_dirs: dict[str, list[str]] = {}
+    pending_count = 0
+
+    def flush_segment() -> None:
+        nonlocal pending_count
+        if scan_log is not None and (pending_rows or pending_dirs):
+            scan_log.append(pending_rows, pending_dirs)
+        pending_rows.clear()
+        pending_dirs.clear()
+        pending_count = 0
+
+    def on_listing(listing: DirectoryListing) -> None:
+        nonlocal discovered, listed_dirs, index_hits, pending_count
+        if listing.resumed:
+            return
+        listed_dirs += 1
+        index_hits += int(listing.from_index)
+        histogram.add_records(listing.files)
+        previous = discovered
+        discovered += len(listing.files)
+        if listing.files:
+            pending_rows.setdefault(str(listing.root), []).extend(
+                record.to_row() for record in listing.files
+            )
+            pending_count += len(listing.files)
+        pending_dirs[str(listing.directory)] = [
+            child.name for child, _rel in listing.subdirs
+        ]
+        if max(pending_count, len(pending_dirs)) >= _SCAN_SEGMENT_SIZE:
+            flush_segment()
+        if discovered // 200 > previous // 200:
+            rate = discovered / max(time.monotonic() - started, 1e-6)
+            progress(
+                f"[scan] discovered={discovered} rate={rate:.0f}/s "
+                f"current={listing.directory}"
+            )
+
+    files_by_root = walk_roots(
+        source_roots,
+        workers=scan_workers,
+        on_listing=on_listing,
+        index=scan_index,
+        exclude_dirs=exclude_dirs or (),
+        one_filesystem=one_filesystem,
+        completed_dirs=replay.completed_dirs if replay is not None else None,
+    )
+    for root, records in resumed.items():
+        if root in files_by_root:
+            files_by_root[root] = sorted(
+                [*records, *files_by_root[root]], key=lambda item: str(item.path)
+            )
+    elapsed = max(time.monotonic() - started, 1e-6)
+    total = sum(len(paths) for paths in files_by_root.values())
+    progress(
+        f"[scan] complete files={total} rate={discovered / elapsed:.0f}/s "
+        f"elapsed={elapsed:.1f}s"
+    )
+    if scan_index is not None:
+        progress(f"[scan] index reused={index_hits}/{listed_dirs} directories")
+
+    if scan_log is not None:
+        scan_log.compact(
+            {
+                str(root): [record.to_row() for record in records]
+                for root, records in files_by_root.items()
+            }
+        )
+        if checkpoint_callback:
+            checkpoint_callback({"segment_log": True, "scan_complete": True})
+    return files_by_root, histogram
+
+
+def _stream_files_by_root(
+    source_roots: list[Path] | None,
+    spool_dir: Path | None = None,
+    progress_callback: Callable[[str], None] | None = None,
+    resume_payload: dict | None = None,
+    checkpoint_callback: Callable[[dict], None] | None = None,
+    scan_workers: int = DEFAULT_SCAN_WORKERS,
+    scan_index: DirectoryIndex | None = None,
+    exclude_dirs: set[str] | None = None,
+    one_filesystem: bool = False,
+) -> tuple[RecordSpool, SuffixHistogram]:
+    """Scan roots into an on-disk spool and build the suffix histogram on the fly.
+
+    Partial streaming scans are not resumable; they restart from scratch.
+    """
+    progress = progress_callback or (lambda _message: None)
+    if (
+        spool_dir is not None
+        and resume_payload
+        and resume_payload.get("streaming")
+        and resume_payload.get("scan_complete")
+    ):
+        try:
+            restored = RecordSpool.open(spool_dir)
+        except FileNotFoundError:
+            restored = None
+        if restored is not None:
+            progress("[scan] restored completed streaming scan spool")
+            raw_histogram = resume_payload.get("suffix_histogram")
+            if isinstance(raw_histogram, dict):
+                return restored, SuffixHistogram.from_payload(raw_histogram)
+            return restored, SuffixHistogram.from_records(restored)
+
+    spool = RecordSpool(spool_dir)
+    spool.reset()
+    histogram = SuffixHistogram()
+    if not source_roots:
+        spool.finish([])
+        return spool, histogram
+
     for root in source_roots:
-        if not root.exists() or not root.is_dir():
-            continue
-        progress(f"[scan] scanning root={root}")
-        spec = build_scan_pathspec(root)
-        files = []
-        for current, dir_names, file_names in os.walk(root, topdown=True):
-            base = Path(current)
-            base_rel = str(base.relative_to(root)) if base != root else ""
-            kept_dirs: list[str] = []
-            for name in dir_names:
-                rel = f"{base_rel}/{name}" if base_rel else name
-                if not should_ignore_relpath(spec, rel, is_dir=True):
-                    kept_dirs.append(name)
-            dir_names[:] = kept_dirs
-
-            for file_name in file_names:
-                path = base / file_name
-                rel_file = str(path.relative_to(root))
-                if should_ignore_relpath(spec, rel_file, is_dir=False):
-                    continue
-                text = str(path)
-                if text in resumed_seen:
-                    continue
-                files.append(path)
-                discovered += 1
-                if discovered % 200 == 0:
-                    progress(f"[scan] discovered={discovered} current={path.parent}")
-                    if checkpoint_callback:
-                        merged = {
-                            str(item_root): [str(item) for item in items]
-                            for item_root, items in files_by_root.items()
-                        }
-                        merged.setdefault(str(root), [])
-                        merged[str(root)].extend(str(item) for item in files)
-                        checkpoint_callback(
-                            {
-                                "files_by_root": merged,
-                                "scan_complete": False,
-                            }
-                        )
-        files_by_root[root] = sorted(files, key=lambda item: str(item))
+        if root.exists() and root.is_dir():
+            progress(f"[scan] scanning root={root} workers={scan_workers} streaming")
+
+    started = time.monotonic()
+    discovered = 0
+
+    def on_listing(listing: DirectoryListing) -> None:
+        nonlocal discovered
+        spool.append(listing.root, listing.files)
+        previous = discovered
+        discovered += len(listing.files)
+        histogram.add_records(listing.files)
+        if discovered // 200 > previous // 200:
+            rate = discovered / max(time.monotonic() - started, 1e-6)
+            progress(
+                f"[scan] discovered={discovered} rate={rate:.0f}/s "
+                f"current={listing.directory}"
+            )
+            if checkpoint_callback:
+                checkpoint_callback({"streaming": True, "scan_complete": False})
 
+    scanned = stream_roots(
+        source_roots,
+        workers=scan_workers,
+        on_listing=on_listing,
+        index=scan_index,
+        exclude_dirs=exclude_dirs or (),
+        one_filesystem=one_filesystem,
+    )
+    spool.finish(scanned)
+    elapsed = max(time.monotonic() - started, 1e-6)
+    progress(
+        f"[scan] complete files={discovered} rate={discovered / elapsed:.0f}/s "
+        f"elapsed={elapsed:.1f}s"
+    )
     if checkpoint_callback:
         checkpoint_callback(
             {
-                "files_by_root": {
-                    str(root): [str(item) for item in paths]
-                    for root, paths in files_by_root.items()
-                },
+                "streaming": True,
                 "scan_complete": True,
+                "suffix_histogram": histogram.to_payload(),
             }
         )
-    return files_by_root
+    return spool, histogram
+
+
+def _restore_file_record(item: object) -> FileRecord | None:
+    """Restore one checkpointed record, accepting legacy plain-path entries."""
+    if isinstance(item, list):
+        return FileRecord.from_row(item)
+    path = Path(str(item))
+    try:
+        return FileRecord.from_stat(path, path.stat())
+    except OSError:
+        return None
 
 
 def _build_stage1_rows(
-    files_by_root: dict[Path, list[Path]],
+    files_by_root: Mapping[Path, Iterable[FileRecord]],
     use_sample_rows: bool,
     suffix_risk_fn: Callable[[list[str]], dict[str, dict[str, object]]] | None = None,
+    suffix_histogram: SuffixHistogram | None = None,
 ) -> list[SuffixReviewRow]:
+    """Build stage-1 rows, with per-suffix volume taken from the scan histogram."""
     if not files_by_root:
         return _sample_suffix_rows() if use_sample_rows else []
 
-    discovered_extensions: set[str] = set()
-    for paths in files_by_root.values():
-        for path in paths:
-            if not path.suffix:
-                continue
-            discovered_extensions.add(path.suffix.lower())
+    if suffix_histogram is None:
+        suffix_histogram = SuffixHistogram.from_records(files_by_root)
+    discovered_extensions = suffix_histogram.extensions()
 
     if not discovered_extensions:
         return _sample_suffix_rows() if use_sample_rows else []
@@ -311,6 +641,12 @@ def _build_stage1_rows(
     )
     risk_overrides = suffix_risk_fn(ai_candidate_exts) if suffix_risk_fn else {}
     for ext in sorted(discovered_extensions):
+        stats = suffix_histogram.get(ext) or SuffixStats()
+        volume = {
+            "file_count": stats.count,
+            "total_bytes": stats.total_bytes,
+            "examples": tuple(path for _size, path in stats.largest),
+        }
         if ext in HARD_DROP_SUFFIXES:
             rows.append(
                 SuffixReviewRow(
@@ -319,6 +655,7 @@ def _build_stage1_rows(
                     tag="hard-drop-rule",
                     confidence=0.99,
                     reason="Hard drop rule: temporary/generated suffix",
+                    **volume,
                 )
             )
             continue
@@ -351,6 +688,7 @@ def _build_stage1_rows(
                 tag=tag,
                 confidence=confidence,
                 reason=reason,
+                **volume,
             )
         )
     return rows
@@ -364,30 +702,75 @@ def _stage1_heuristic(ext: str) -> tuple[str, str, float, str]:
 
 
 def _build_stage2_rows(
-    files_by_root: dict[Path, list[Path]],
+    files_by_root: Mapping[Path, Iterable[FileRecord]],
     whitelist: set[str],
     use_sample_rows: bool,
-    path_risk_fn: Callable[[list[str]], dict[str, dict[str, object]]] | None = None,
+    path_risk_fn: PathRiskFn | None = None,
     send_full_path_to_ai: bool = False,
     progress_callback: Callable[[str], None] | None = None,
     resume_payload: dict | None = None,
     checkpoint_callback: Callable[[dict], None] | None = None,
+    ai_concurrency: int = DEFAULT_AI_CONCURRENCY,
+    ai_token_budget: int = DEFAULT_TOKEN_BUDGET,
 ) -> list[PathReviewRow]:
+    """Tier whitelisted candidates, querying ``path_risk_fn`` concurrently.
+
+    Families of similar inputs (numbered frames, hashes, versions) are sent
+    once as a template whose answer applies to every member. Batches are
+    packed by estimated tokens rather than a fixed count. Batch results are
+    merged in candidate order, so the ``next_index`` checkpoint always marks
+    a prefix whose answers are all in the lookup.
+    """
     progress = progress_callback or (lambda _message: None)
     if not files_by_root:
         return _sample_path_rows() if use_sample_rows else []
 
-    candidate_paths: list[Path] = []
-    for paths in files_by_root.values():
-        for path in paths:
-            ext = path.suffix.lower()
-            if whitelist and ext not in whitelist:
-                continue
-            candidate_paths.append(path)
+    candidates: list[FileRecord] = []
+    for records in files_by_root.values():
+        root_candidates = [
+            record
+            for record in records
+            if not whitelist or record.path.suffix.lower() in whitelist
+        ]
+        root_candidates.sort(key=lambda item: str(item.path))
+        candidates.extend(root_candidates)
+    candidates, alias_count = _drop_hardlink_aliases(candidates)
+    if alias_count:
+        progress(f"[ai:path] hardlink aliases grouped={alias_count}")
 
-    candidate_inputs = [
-        str(path) if send_full_path_to_ai else path.name for path in candidate_paths
-    ]
+    # Rows look answers up by input key, so every distinct basename (or
+    # path) is asked once and the answer fans out to all matching files.
+    candidate_inputs = list(
+        dict.fromkeys(
+            str(record.path) if send_full_path_to_ai else record.path.name
+            for record in candidates
+        )
+    )
+    if len(candidate_inputs) < len(candidates):
+        progress(
+            f"[ai:path] unique inputs={len(candidate_inputs)} "
+            f"candidates={len(candidates)}"
+        )
+    # Bare basenames carry no directory context, so unrelated names such as
+    # report1.pdf and report2.pdf only collapse in much larger families.
+    collapse = collapse_path_families(
+        candidate_inputs,
+        min_members=(
+            MIN_FAMILY_MEMBERS if send_full_path_to_ai else MIN_BASENAME_FAMILY_MEMBERS
+        ),
+    )
+    if collapse.families:
+        progress(
+            f"[ai:path] path families={len(collapse.families)} "
+            f"members={len(collapse.template_of)}"
+        )
+        largest = sorted(collapse.families.values(), key=lambda item: -item.count)
+        for family in largest[:_FAMILY_LOG_LIMIT]:
+            progress(
+                f"[ai:path] family template={family.template} count={family.count} "
+                f"samples={', '.join(family.samples)}"
+            )
+    candidate_inputs = collapse.inputs
     path_risk_lookup: dict[str, dict[str, object]] = {}
     if resume_payload and isinstance(resume_payload.get("risk_lookup"), dict):
         raw_lookup = dict(resume_payload.get("risk_lookup", {}))
@@ -398,32 +781,57 @@ def _build_stage2_rows(
         }
 
     if path_risk_fn:
-        batch_size = 50
-        start_index = int(resume_payload.get("next_index", 0)) if resume_payload else 0
-        for index in range(start_index, len(candidate_inputs), batch_size):
-            batch = candidate_inputs[index : index + batch_size]
-            if not batch:
-                continue
+        start_index = 0
+        if resume_payload and resume_payload.get("inputs") == _STAGE2_INPUT_FORMAT:
+            start_index = int(resume_payload.get("next_index", 0))
+        batcher = TokenBudgetBatcher(ai_token_budget)
+        remaining = candidate_inputs[start_index:]
+        if remaining:
             progress(
-                f"[ai:path] querying batch={index // batch_size + 1} size={len(batch)}"
+                f"[ai:path] querying candidates={len(remaining)} "
+                f"concurrency={ai_concurrency} token_budget={ai_token_budget}"
+            )
+
+        def located_batches() -> Iterator[tuple[int, list[str]]]:
+            index = start_index
+            for batch in batcher.batches(remaining):
+                yield index, batch
+                index += len(batch)
+
+        def classify(
+            item: tuple[int, list[str]],
+        ) -> tuple[int, list[str], dict[str, dict[str, object]]]:
+            index, batch = item
+            update = _classify_path_batch(
+                path_risk_fn, batch, collapse.families, batcher, progress
             )
-            update = path_risk_fn(batch)
+            return index, batch, update
+
+        results = map_batches_ordered(classify, located_batches(), ai_concurrency)
+        for position, (index, batch, update) in results:
+            progress(f"[ai:path] merged batch={position + 1} size={len(batch)}")
             path_risk_lookup.update(update)
             if checkpoint_callback:
                 checkpoint_callback(
                     {
                         "next_index": index + len(batch),
+                        "inputs": _STAGE2_INPUT_FORMAT,
                         "risk_lookup": path_risk_lookup,
                     }
                 )
 
     rows: list[PathReviewRow] = []
-    for path in candidate_paths:
+    for record in candidates:
+        path = record.path
         signal_score = extension_score(path)
         ai_score = _ai_score_heuristic(path)
 
         key = str(path) if send_full_path_to_ai else path.name
-        override = path_risk_lookup.get(key) or path_risk_lookup.get(str(path))
+        override = (
+            path_risk_lookup.get(key)
+            or path_risk_lookup.get(str(path))
+            or path_risk_lookup.get(collapse.template_of.get(key, ""))
+        )
         ai_risk = "neutral"
         reason = "Local signal + heuristic AI fusion"
         override_confidence = 0.0
@@ -441,7 +849,7 @@ def _build_stage2_rows(
             PathReviewRow(
                 path=str(path),
                 tier=tier,
-                size_bytes=path.stat().st_size,
+                size_bytes=record.size,
                 reason=reason,
                 confidence=confidence,
                 ai_risk=ai_risk,
@@ -450,6 +858,70 @@ def _build_stage2_rows(
     return rows
 
 
+def _classify_path_batch(
+    path_risk_fn: PathRiskFn,
+    batch: list[str],
+    families: Mapping[str, PathFamily],
+    batcher: TokenBudgetBatcher,
+    progress: Callable[[str], None],
+    split: bool = True,
+) -> dict[str, dict[str, object]]:
+    """Query one batch, splitting it in half once if the reply cannot be parsed.
+
+    Only the ``families`` whose templates are in the batch are passed on.
+
+    A reply made only of parse fallbacks usually means the model truncated
+    or mangled its JSON, so the shared batcher also shrinks later batches.
+    A half that fails again keeps its fallback answers, so a model that never
+    returns valid JSON costs at most three calls per batch.
+    """
+    batch_families = {key: families[key] for key in batch if key in families}
+    if batch_families:
+        update = path_risk_fn(batch, families=batch_families)
+    else:
+        update = path_risk_fn(batch)
+    if not split or len(batch) < 2 or not _is_parse_fallback_batch(update):
+        return update
+    batcher.shrink()
+    progress(
+        f"[ai:path] parse fallback size={len(batch)} splitting "
+        f"token_budget={batcher.budget}"
+    )
+    middle = len(batch) // 2
+    halves = (batch[:middle], batch[middle:])
+    merged: dict[str, dict[str, object]] = {}
+    for half in halves:
+        merged.update(
+            _classify_path_batch(
+                path_risk_fn, half, families, batcher, progress, split=False
+            )
+        )
+    return merged
+
+
+def _is_parse_fallback_batch(update: dict[str, dict[str, object]]) -> bool:
+    return bool(update) and all(
+        str(item.get("reason", "")).lower().startswith("llm parse fallback")
+        for item in update.values()
+    )
+
+
+def _drop_hardlink_aliases(
+    candidates: list[FileRecord],
+) -> tuple[list[FileRecord], int]:
+    """Keep the first path of each hardlink group; the copy stage re-links the rest."""
+    seen: set[tuple[int, int]] = set()
+    kept: list[FileRecord] = []
+    for record in candidates:
+        key = record.hardlink_key
+        if key is not None:
+            if key in seen:
+                continue
+            seen.add(key)
+        kept.append(record)
+    return kept, len(candidates) - len(kept)
+
+
 def _apply_suffix_risk_override(
     ext: str,
     label: str,
@@ -476,30 +948,66 @@ def _apply_suffix_risk_override(
 
 
 def _copy_selected_paths(
-    files_by_root: dict[Path, list[Path]],
+    files_by_root: Mapping[Path, Iterable[FileRecord]],
     selected_paths: set[str],
     target_root: Path,
     progress_callback: Callable[[str], None] | None = None,
     resume_payload: dict | None = None,
     checkpoint_callback: Callable[[dict], None] | None = None,
 ) -> int:
+    """Copy selected files, re-creating hardlink groups as hardlinks.
+
+    A hardlink alias is copied whenever any path of its group is selected,
+    since stage 2 only reviews the first path of each group.
+    """
     progress = progress_callback or (lambda _message: None)
     selected_lookup = set(selected_paths)
     already_copied = {
         str(path)
         for path in (resume_payload.get("copied_paths", []) if resume_payload else [])
     }
+    selected_links = {
+        record.hardlink_key
+        for records in files_by_root.values()
+        for record in records
+        if record.hardlink_key is not None and str(record.path) in selected_lookup
+    }
+    link_targets: dict[tuple[int, int], Path] = {}
     copied = 0
 
-    for src_root, paths in files_by_root.items():
-        for src_path in paths:
+    for src_root, records in files_by_root.items():
+        for record in records:
+            src_path = record.path
             src_path_str = str(src_path)
-            if src_path_str not in selected_lookup:
+            link_key = record.hardlink_key
+            if src_path_str not in selected_lookup and (
+                link_key is None or link_key not in selected_links
+            ):
                 continue
             if src_path_str in already_copied:
+                if link_key is not None:
+                    link_targets.setdefault(
+                        link_key, mirror_destination(src_root, src_path, target_root)
+                    )
                 continue
-            progress(f"[copy] copying {src_path_str}")
-            mirror_copy_one(src_root=src_root, src_path=src_path, dst_root=target_root)
+            existing = link_targets.get(link_key) if link_key is not None else None
+            if existing is not None:
+                progress(f"[copy] linking {src_path_str}")
+                mirror_link_one(
+                    src_root=src_root,
+                    src_path=src_path,
+                    dst_root=target_root,
+                    existing=existing,
+                )
+            else:
+                progress(f"[copy] copying {src_path_str}")
+                mirror_copy_one(
+                    src_root=src_root, src_path=src_path, dst_root=target_root
+                )
+                if link_key is not None:
+                    link_targets[link_key] = mirror_destination(
+                        src_root, src_path, target_root
+                    )
             copied += 1
             already_copied.add(src_path_str)
             if checkpoint_callback:
@@ -0,0 +1 @@
+"""Platform adapters for root discovery and file iteration."""
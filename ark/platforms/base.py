@@ -1,5 +1,8 @@
 """Cross-platform adapter contracts."""
 
+import os
+import sys
+from collections.abc import Collection
 from pathlib import Path
 from typing import Iterator, Protocol
 
@@ -10,5 +13,47 @@ class PlatformAdapter(Protocol):
     def list_roots(self) -> list[Path]:
         """List scan roots for the platform."""
 
+    def excluded_dirs(self) -> set[Path]:
+        """List directories that are never scanned, such as pseudo mounts."""
+
     def iter_files(self, root: Path) -> Iterator[Path]:
         """Iterate files under a root."""
+
+
+def current_adapter() -> PlatformAdapter:
+    """Return the adapter for the running platform."""
+    if sys.platform == "win32":
+        from ark.platforms.windows import WindowsAdapter
+
+        return WindowsAdapter()
+    from ark.platforms.posix import PosixAdapter
+
+    return PosixAdapter()
+
+
+def scandir_files(root: Path, excluded: Collection[Path] = ()) -> Iterator[Path]:
+    """Yield files under ``root`` using ``os.scandir`` entry types.
+
+    Directory entries are typed from the listing itself, so no extra stat is
+    needed per entry. Symlinked directories are not followed and ``excluded``
+    directories are not entered.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        files: list[Path] = []
+        subdirs: list[Path] = []
+        try:
+            with os.scandir(directory) as iterator:
+                for entry in iterator:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(Path(entry.path))
+                        elif entry.is_file():
+                            files.append(Path(entry.path))
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+        yield from files
+        stack.extend(path for path in reversed(subdirs) if path not in excluded)
@@ -0,0 +1,142 @@
+"""Linux/macOS adapter implementation."""
+
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+from ark.platforms.base import scandir_files
+
+MOUNTINFO_PATH = Path("/proc/self/mountinfo")
+PSEUDO_FILESYSTEMS = frozenset(
+    {
+        "binfmt_misc",
+        "bpf",
+        "cgroup",
+        "cgroup2",
+        "configfs",
+        "debugfs",
+        "devpts",
+        "devtmpfs",
+        "efivarfs",
+        "fusectl",
+        "hugetlbfs",
+        "mqueue",
+        "nsfs",
+        "overlay",
+        "proc",
+        "pstore",
+        "ramfs",
+        "rpc_pipefs",
+        "securityfs",
+        "selinuxfs",
+        "sysfs",
+        "tmpfs",
+        "tracefs",
+    }
+)
+SNAP_MOUNT_DIRS = (Path("/snap"), Path("/var/lib/snapd/snap"))
+_OCTAL_ESCAPE = re.compile(r"\\([0-7]{3})")
+
+
+@dataclass(frozen=True)
+class MountPoint:
+    """One mounted filesystem parsed from ``mountinfo``."""
+
+    path: Path
+    fstype: str
+    source: str
+
+    @property
+    def is_pseudo(self) -> bool:
+        """Return whether the mount holds no user data.
+
+        ``/`` always counts as real, since containers run on an overlay root.
+        squashfs only counts for snap package images, not for other images.
+        """
+        if self.path == Path("/"):
+            return False
+        if self.fstype == "squashfs":
+            return any(parent in self.path.parents for parent in SNAP_MOUNT_DIRS)
+        return self.fstype in PSEUDO_FILESYSTEMS
+
+
+def parse_mountinfo(text: str) -> list[MountPoint]:
+    """Parse ``/proc/self/mountinfo``; later mounts shadow earlier ones."""
+    mounts: dict[Path, MountPoint] = {}
+    for line in text.splitlines():
+        fields = line.split()
+        if "-" not in fields:
+            continue
+        separator = fields.index("-")
+        if separator < 6 or len(fields) < separator + 3:
+            continue
+        path = Path(_unescape(fields[4]))
+        mounts.pop(path, None)
+        mounts[path] = MountPoint(
+            path=path,
+            fstype=fields[separator + 1],
+            source=_unescape(fields[separator + 2]),
+        )
+    return list(mounts.values())
+
+
+def _unescape(value: str) -> str:
+    return _OCTAL_ESCAPE.sub(lambda match: chr(int(match.group(1), 8)), value)
+
+
+class PosixAdapter:
+    """Mount-aware adapter for Linux, with a plain fallback for macOS."""
+
+    def __init__(self, mountinfo_path: Path = MOUNTINFO_PATH):
+        self.mountinfo_path = mountinfo_path
+
+    def mounts(self) -> list[MountPoint]:
+        """Return current mounts, or an empty list when mountinfo is missing."""
+        try:
+            text = self.mountinfo_path.read_text(encoding="utf-8")
+        except OSError:
+            return []
+        return parse_mountinfo(text)
+
+    def list_roots(self) -> list[Path]:
+        mounts = self.mounts()
+        if not mounts:
+            return _fallback_roots()
+        excluded = self.excluded_dirs()
+        return sorted(
+            mount.path
+            for mount in mounts
+            if not mount.is_pseudo and not _is_under_any(mount.path, excluded)
+        )
+
+    def excluded_dirs(self) -> set[Path]:
+        """Return pseudo mounts that have no real filesystem mounted below.
+
+        Excluded directories are pruned with their whole subtree, so a pseudo
+        mount such as a tmpfs ``/run`` holding ``/run/media/usb`` stays
+        walkable; the pseudo mounts nested under it are still excluded.
+        """
+        mounts = self.mounts()
+        real = [mount.path for mount in mounts if not mount.is_pseudo]
+        return {
+            mount.path
+            for mount in mounts
+            if mount.is_pseudo and not any(mount.path in path.parents for path in real)
+        }
+
+    def iter_files(self, root: Path) -> Iterator[Path]:
+        return scandir_files(root, excluded=self.excluded_dirs())
+
+
+def _is_under_any(path: Path, parents: set[Path]) -> bool:
+    return any(parent in path.parents for parent in parents)
+
+
+def _fallback_roots() -> list[Path]:
+    roots = [Path("/")]
+    volumes = Path("/Volumes")
+    if sys.platform == "darwin" and volumes.is_dir():
+        roots.extend(sorted(path for path in volumes.iterdir() if path.is_dir()))
+    return roots
@@ -3,6 +3,8 @@
 from pathlib import Path
 from typing import Iterator
 
+from ark.platforms.base import scandir_files
+
 
 class WindowsAdapter:
     """Windows filesystem adapter."""
@@ -15,7 +17,8 @@ class WindowsAdapter:
                 roots.append(candidate)
         return roots
 
+    def excluded_dirs(self) -> set[Path]:
+        return set()
+
     def iter_files(self, root: Path) -> Iterator[Path]:
-        for path in root.rglob("*"):
-            if path.is_file():
-                yield path
+        return scandir_files(root)
@@ -0,0 +1,170 @@
+"""Compiled gitignore matcher with set-lookup fast paths for common rules."""
+
+from __future__ import annotations
+
+import re
+
+try:
+    import pathspec
+except ModuleNotFoundError:  # pragma: no cover
+    pathspec = None  # type: ignore
+
+_GLOB_CHARS = frozenset("*?[\\")
+_BRACKET_RE = re.compile(r"\[([^\]\[!^\-\\/]+)\]")
+_MAX_EXPANSIONS = 16
+
+
+class CompiledIgnoreMatcher:
+    """Gitignore matcher that resolves most rules without regex.
+
+    Rules are split into four classes:
+
+    - basename: ``name`` or ``name/``, matched against any path segment;
+    - suffix: ``*.ext``, matched by the extension tails of each segment;
+    - anchored prefix: ``dir/name`` or ``/name``, matched by path prefixes;
+    - general: anything else, matched with the pathspec regex.
+
+    Results follow ``pathspec.PathSpec.match_file``: the last matching rule
+    wins, so each rule keeps its line index and only general rules newer
+    than the best fast-path hit are searched.
+    """
+
+    def __init__(self, lines: list[str]):
+        if pathspec is None:  # pragma: no cover
+            raise RuntimeError("CompiledIgnoreMatcher requires pathspec")
+        compiled = pathspec.PathSpec.from_lines("gitignore", lines).patterns
+
+        self.lines = list(lines)
+        self._basenames: dict[str, tuple[int, bool]] = {}
+        self._dir_basenames: dict[str, tuple[int, bool]] = {}
+        self._suffixes: dict[str, tuple[int, bool]] = {}
+        self._prefixes: dict[str, tuple[int, bool]] = {}
+        self._dir_prefixes: dict[str, tuple[int, bool]] = {}
+        self._general: list[tuple[int, bool, re.Pattern[str]]] = []
+
+        for index, (line, pattern) in enumerate(zip(lines, compiled)):
+            include = pattern.include
+            if include is None:
+                continue
+            if not self._add_fast_rule(line, index, include):
+                self._general.append((index, include, pattern.regex))
+        self._general.reverse()
+        self._suffix_dots = max((key.count(".") for key in self._suffixes), default=0)
+        self._prefix_depth = max(
+            (key.count("/") + 1 for key in (*self._prefixes, *self._dir_prefixes)),
+            default=0,
+        )
+
+    def _add_fast_rule(self, line: str, index: int, include: bool) -> bool:
+        body = line
+        if body != body.strip():
+            return False
+        if body.startswith("!"):
+            body = body[1:]
+        dir_only = body.endswith("/")
+        core = body[:-1] if dir_only else body
+        if not core or core.endswith("/"):
+            return False
+
+        anchored = "/" in core
+        if core.startswith("/"):
+            core = core[1:]
+            if not core:
+                return False
+
+        if not anchored and core.startswith("*.") and not dir_only:
+            tails = _expand_literal(core[1:])
+            if tails is None:
+                return False
+            for tail in tails:
+                self._suffixes[tail] = (index, include)
+            return True
+
+        names = _expand_literal(core)
+        if names is None or any(
+            part in ("", ".", "..") for part in core.split("/")
+        ):
+            return False
+        if anchored:
+            target = self._dir_prefixes if dir_only else self._prefixes
+        else:
+            target = self._dir_basenames if dir_only else self._basenames
+        for name in names:
+            target[name] = (index, include)
+        return True
+
+    def match_file(self, path: str) -> bool:
+        """Return whether one normalized relative path is ignored."""
+        return self.match_verdict(path) is True
+
+    def match_verdict(self, path: str) -> bool | None:
+        """Return the last matching rule's verdict, or ``None`` if none match."""
+        if path.startswith("/"):
+            path = path[1:]
+        elif path.startswith("./"):
+            path = path[2:]
+
+        best = -1
+        include: bool | None = None
+        segments = path.split("/")
+        basenames = self._basenames
+        suffixes = self._suffixes
+        suffix_dots = self._suffix_dots
+
+        for segment in segments:
+            hit = basenames.get(segment)
+            if hit is not None and hit[0] > best:
+                best, include = hit
+            if suffixes:
+                dot = len(segment)
+                for _ in range(suffix_dots):
+                    dot = segment.rfind(".", 0, dot)
+                    if dot == -1:
+                        break
+                    hit = suffixes.get(segment[dot:])
+                    if hit is not None and hit[0] > best:
+                        best, include = hit
+
+        if self._dir_basenames:
+            for segment in segments[:-1]:
+                hit = self._dir_basenames.get(segment)
+                if hit is not None and hit[0] > best:
+                    best, include = hit
+
+        if self._prefix_depth:
+            depth = min(self._prefix_depth, len(segments))
+            for count in range(1, depth + 1):
+                prefix = "/".join(segments[:count])
+                hit = self._prefixes.get(prefix)
+                if hit is not None and hit[0] > best:
+                    best, include = hit
+                if count < len(segments):
+                    hit = self._dir_prefixes.get(prefix)
+                    if hit is not None and hit[0] > best:
+                        best, include = hit
+
+        for index, rule_include, regex in self._general:
+            if index <= best:
+                break
+            if regex.search(path) is not None:
+                return rule_include
+        return include
+
+
+def _expand_literal(text: str) -> list[str] | None:
+    """Expand simple ``[abc]`` sets; return ``None`` for any other glob."""
+    variants = [""]
+    position = 0
+    for match in _BRACKET_RE.finditer(text):
+        literal = text[position : match.start()]
+        if _GLOB_CHARS.intersection(literal):
+            return None
+        choices = sorted(set(match.group(1)))
+        variants = [prefix + literal + char for prefix in variants for char in choices]
+        if len(variants) > _MAX_EXPANSIONS:
+            return None
+        position = match.end()
+    tail = text[position:]
+    if _GLOB_CHARS.intersection(tail):
+        return None
+    return [prefix + tail for prefix in variants]
@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 import fnmatch
+import os
+import re
+from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
 
+from ark.rules.ignore_matcher import CompiledIgnoreMatcher
+
 try:  # Python 3.11+
     import tomllib
 except ModuleNotFoundError:  # pragma: no cover
@@ -20,6 +25,16 @@ except ModuleNotFoundError:  # pragma: no cover
 RULES_DIR = Path(__file__).resolve().parent
 BASELINE_IGNORE_FILE = RULES_DIR / "baseline.ignore"
 SUFFIX_RULES_FILE = RULES_DIR / "suffix_rules.toml"
+_FNMATCH_CHARS = frozenset("*?[")
+IGNORE_FILE_NAMES = (".gitignore", ".arkignore")
+
+
+@dataclass(frozen=True)
+class IgnoreLayer:
+    """Ignore rules loaded from one directory, matched relative to ``base``."""
+
+    base: str
+    spec: object
 
 
 def build_scan_pathspec(source_root: Path):
@@ -31,6 +46,19 @@ def build_scan_pathspec(source_root: Path):
     return _pathspec_from_lines(lines)
 
 
+def load_directory_ignore_spec(directory: Path, stamps: dict[str, tuple[int, int]]):
+    """Return the cached matcher for ignore files found in one nested directory.
+
+    ``stamps`` maps ignore file names present in the directory to their
+    ``(mtime_ns, size)``, so an edited file is parsed again while unchanged
+    files reuse the compiled spec.
+    """
+    key = tuple((name, *stamps[name]) for name in IGNORE_FILE_NAMES if name in stamps)
+    if not key:
+        return None
+    return _cached_directory_spec(str(directory), key)
+
+
 def should_ignore_relpath(spec, relpath: str, is_dir: bool) -> bool:
     """Return whether one relative path should be ignored by rules."""
     normalized = relpath.replace("\\", "/").strip("/")
@@ -41,61 +69,141 @@ def should_ignore_relpath(spec, relpath: str, is_dir: bool) -> bool:
     return bool(spec.match_file(normalized))
 
 
+def should_ignore_in_layers(
+    layers: tuple[IgnoreLayer, ...], relpath: str, is_dir: bool
+) -> bool:
+    """Return whether a path is ignored by stacked per-directory rules.
+
+    Like git, the deepest layer with a matching rule decides; outer layers
+    are consulted only when inner ignore files say nothing about the path.
+    """
+    normalized = relpath.replace("\\", "/").strip("/")
+    if not normalized:
+        return False
+    for layer in reversed(layers):
+        if layer.base:
+            if not normalized.startswith(f"{layer.base}/"):
+                continue
+            local = normalized[len(layer.base) + 1 :]
+        else:
+            local = normalized
+        if is_dir:
+            local = f"{local}/"
+        verdict = layer.spec.match_verdict(local)
+        if verdict is not None:
+            return verdict
+    return False
+
+
 def _pathspec_from_lines(lines: list[str]):
     if pathspec is None:
         return _FallbackPathSpec(lines)
-    return pathspec.PathSpec.from_lines("gitignore", lines)
+    return CompiledIgnoreMatcher(lines)
 
 
 class _FallbackPathSpec:
-    """Very small gitignore-like matcher when pathspec dependency is unavailable."""
+    """Very small gitignore-like matcher when pathspec dependency is unavailable.
+
+    Patterns are compiled once: directory rules become segment/prefix sets,
+    plain names and ``*.ext`` rules become dict lookups, and the remaining
+    globs are joined into one alternation per match subject, ordered newest
+    first so the named group that matches is the last matching rule.
+    """
 
     def __init__(self, patterns: list[str]):
         self.patterns = patterns
+        self._fold = os.path.normcase("A") == "a"
+        self._negated: list[bool] = []
+        self._dir_segments: dict[str, int] = {}
+        self._dir_prefixes: dict[str, int] = {}
+        self._names: dict[str, int] = {}
+        self._suffixes: dict[str, int] = {}
+        path_globs: list[tuple[int, str]] = []
+        name_globs: list[tuple[int, str]] = []
+
+        for raw in patterns:
+            index = len(self._negated)
+            negated = raw.startswith("!")
+            self._negated.append(negated)
+            pat = (raw[1:] if negated else raw).replace("\\", "/").strip()
+            if not pat:
+                continue
+            if pat.endswith("/"):
+                prefix = pat.rstrip("/")
+                if "/" in prefix:
+                    self._dir_prefixes[prefix] = index
+                elif prefix:
+                    self._dir_segments[prefix] = index
+                continue
+            if self._fold:
+                pat = pat.lower()
+            if "/" in pat:
+                path_globs.append((index, pat))
+            elif not _FNMATCH_CHARS.intersection(pat):
+                self._names[pat] = index
+            elif pat.startswith("*.") and not _FNMATCH_CHARS.intersection(pat[1:]):
+                self._suffixes[pat[1:]] = index
+            else:
+                name_globs.append((index, pat))
+
+        self._path_regex = _compile_alternation(path_globs + name_globs)
+        self._name_regex = _compile_alternation(name_globs)
 
     def match_file(self, path: str) -> bool:
-        result = False
+        return self.match_verdict(path) is True
+
+    def match_verdict(self, path: str) -> bool | None:
         normalized = path.replace("\\", "/").strip()
         if not normalized:
-            return False
+            return None
         plain = normalized.rstrip("/")
-        for raw in self.patterns:
-            negated = raw.startswith("!")
-            pattern = raw[1:] if negated else raw
-            if _match_pattern(pattern, normalized, plain):
-                result = not negated
-        return result
-
-
-def _match_pattern(pattern: str, normalized: str, plain: str) -> bool:
-    pat = pattern.replace("\\", "/").strip()
-    if not pat:
-        return False
-
-    if pat.endswith("/"):
-        prefix = pat.rstrip("/")
-        if "/" in prefix:
-            return plain == prefix or plain.startswith(f"{prefix}/")
-
-        segments = [segment for segment in plain.split("/") if segment]
-        for idx, segment in enumerate(segments):
-            if segment != prefix:
+        segments = plain.split("/")
+        best = -1
+
+        for segment in segments:
+            best = max(best, self._dir_segments.get(segment, -1))
+        if self._dir_prefixes:
+            cut = plain.find("/")
+            while cut != -1:
+                best = max(best, self._dir_prefixes.get(plain[:cut], -1))
+                cut = plain.find("/", cut + 1)
+            best = max(best, self._dir_prefixes.get(plain, -1))
+
+        if self._fold:
+            normalized, plain = normalized.lower(), plain.lower()
+        name = plain.rsplit("/", 1)[-1]
+        best = max(best, self._names.get(name, -1))
+        if self._suffixes:
+            dot = name.find(".")
+            while dot != -1:
+                best = max(best, self._suffixes.get(name[dot:], -1))
+                dot = name.find(".", dot + 1)
+
+        for regex, subjects in (
+            (self._path_regex, (normalized, plain)),
+            (self._name_regex, (name,)),
+        ):
+            if regex is None:
                 continue
-            if idx == len(segments) - 1:
-                return True
-            return True
-        return False
+            for subject in subjects:
+                match = regex.match(subject)
+                if match is not None:
+                    best = max(best, int(match.lastgroup[1:]))
 
-    if "/" in pat:
-        return fnmatch.fnmatch(normalized, pat) or fnmatch.fnmatch(plain, pat)
+        if best < 0:
+            return None
+        return not self._negated[best]
 
-    return any(
-        [
-            fnmatch.fnmatch(plain, pat),
-            fnmatch.fnmatch(normalized, pat),
-            fnmatch.fnmatch(plain.split("/")[-1], pat),
-        ]
-    )
+
+def _compile_alternation(globs: list[tuple[int, str]]) -> re.Pattern[str] | None:
+    """Join fnmatch globs into one regex whose first alternative is the newest."""
+    if not globs:
+        return None
+    alternatives = [
+        f"(?P<p{index}>{fnmatch.translate(pat)})"
+        for index, pat in sorted(globs, reverse=True)
+    ]
+    return re.compile("|".join(alternatives))
 
 
 def hard_drop_suffixes() -> set[str]:
@@ -121,6 +229,16 @@ def suffix_category(ext: str) -> str:
     return "Other"
 
 
+@lru_cache(maxsize=4096)
+def _cached_directory_spec(directory: str, key: tuple[tuple[str, int, int], ...]):
+    lines: list[str] = []
+    for name, *_ in key:
+        lines.extend(_read_ignore_file(Path(directory) / name))
+    if not lines:
+        return None
+    return _pathspec_from_lines(lines)
+
+
 @lru_cache(maxsize=1)
 def _load_suffix_rules() -> dict:
     content = SUFFIX_RULES_FILE.read_bytes()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import threading
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
@@ -18,6 +19,7 @@ class BackupRunStore:
     def __init__(self, root_dir: Path):
         self.root_dir = root_dir
         self.root_dir.mkdir(parents=True, exist_ok=True)
+        self._event_lock = threading.Lock()
 
     def create_run(self, target: str, source_roots: list[str], dry_run: bool) -> str:
         """Create a new run state file and return run id."""
@@ -67,8 +69,9 @@ class BackupRunStore:
         }
         event_path = self._events_path(run_id)
         event_path.parent.mkdir(parents=True, exist_ok=True)
-        with event_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(record, ensure_ascii=True) + "\n")
+        line = json.dumps(record, ensure_ascii=True) + "\n"
+        with self._event_lock, event_path.open("a", encoding="utf-8") as handle:
+            handle.write(line)
 
     def mark_status(self, run_id: str, status: str) -> None:
         """Update run lifecycle status."""
@@ -113,6 +116,18 @@ class BackupRunStore:
             "state": latest,
         }
 
+    def scan_spool_dir(self, run_id: str) -> Path:
+        """Return directory holding streamed scan records for one run."""
+        return self.root_dir / f"{run_id}.spool"
+
+    def scan_log_path(self, run_id: str) -> Path:
+        """Return the append-only scan segment log for one run."""
+        return self.root_dir / f"{run_id}.scan.jsonl"
+
+    def review_journal_path(self, run_id: str) -> Path:
+        """Return the append-only stage-3 review journal for one run."""
+        return self.root_dir / f"{run_id}.review.jsonl"
+
     def _state_path(self, run_id: str) -> Path:
         return self.root_dir / f"{run_id}.json"
 
@@ -1,5 +1,7 @@
 """Interfaces for state persistence backends."""
 
+import sqlite3
+import threading
 from pathlib import Path
 from typing import Protocol
 
@@ -19,3 +21,38 @@ class StateStore(Protocol):
 def ensure_parent_exists(file_path: Path) -> None:
     """Ensure parent directory exists for state files."""
     file_path.parent.mkdir(parents=True, exist_ok=True)
+
+
+class ThreadLocalConnections:
+    """Hand each thread its own SQLite connection to one WAL-mode database.
+
+    Concurrent readers then never share a connection, and WAL keeps them
+    from blocking on the single writer. ``close`` closes every connection
+    opened so far; later calls to ``connect`` open fresh ones.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def connect(self) -> sqlite3.Connection:
+        """Return the calling thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self) -> None:
+        """Close every connection opened by any thread."""
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
@@ -3,6 +3,8 @@
 import json
 from pathlib import Path
 
+from ark.ai.batcher import DEFAULT_AI_CONCURRENCY
+from ark.collector.walker import DEFAULT_SCAN_WORKERS
 from ark.pipeline.config import PipelineConfig
 from ark.state.base import ensure_parent_exists
 
@@ -25,6 +27,9 @@ class JSONConfigStore:
             source_roots=list(payload.get("source_roots", [])),
             dry_run=bool(payload.get("dry_run", False)),
             non_interactive=bool(payload.get("non_interactive", False)),
+            scan_workers=int(payload.get("scan_workers", DEFAULT_SCAN_WORKERS)),
+            stream_scan=bool(payload.get("stream_scan", False)),
+            one_filesystem=bool(payload.get("one_filesystem", False)),
             llm_enabled=bool(payload.get("llm_enabled", False)),
             llm_provider_group=str(payload.get("llm_provider_group", "")),
             llm_provider=str(payload.get("llm_provider", "")),
@@ -35,8 +40,13 @@ class JSONConfigStore:
             google_client_id=str(payload.get("google_client_id", "")),
             google_client_secret=str(payload.get("google_client_secret", "")),
             google_refresh_token=str(payload.get("google_refresh_token", "")),
+            llm_requests_per_minute=_optional_int(
+                payload.get("llm_requests_per_minute")
+            ),
+            llm_tokens_per_minute=_optional_int(payload.get("llm_tokens_per_minute")),
             ai_suffix_enabled=bool(payload.get("ai_suffix_enabled", True)),
             ai_path_enabled=bool(payload.get("ai_path_enabled", True)),
+            ai_concurrency=int(payload.get("ai_concurrency", DEFAULT_AI_CONCURRENCY)),
             send_full_path_to_ai=bool(payload.get("send_full_path_to_ai", False)),
             ai_prune_mode=str(payload.get("ai_prune_mode", "hide_low_value")),
         )
@@ -48,6 +58,9 @@ class JSONConfigStore:
             "source_roots": config.source_roots,
             "dry_run": config.dry_run,
             "non_interactive": config.non_interactive,
+            "scan_workers": config.scan_workers,
+            "stream_scan": config.stream_scan,
+            "one_filesystem": config.one_filesystem,
             "llm_enabled": config.llm_enabled,
             "llm_provider_group": config.llm_provider_group,
             "llm_provider": config.llm_provider,
@@ -58,9 +71,16 @@ class JSONConfigStore:
             "google_client_id": config.google_client_id,
             "google_client_secret": config.google_client_secret,
             "google_refresh_token": config.google_refresh_token,
+            "llm_requests_per_minute": config.llm_requests_per_minute,
+            "llm_tokens_per_minute": config.llm_tokens_per_minute,
             "ai_suffix_enabled": config.ai_suffix_enabled,
             "ai_path_enabled": config.ai_path_enabled,
+            "ai_concurrency": config.ai_concurrency,
             "send_full_path_to_ai": config.send_full_path_to_ai,
             "ai_prune_mode": config.ai_prune_mode,
         }
         self.file_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+def _optional_int(value: object) -> int | None:
+    return None if value is None else int(value)
@@ -0,0 +1,122 @@
+"""SQLite-backed cache of LLM decisions shared across runs."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Callable
+
+from ark.state.base import ThreadLocalConnections, ensure_parent_exists
+
+DEFAULT_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+DEFAULT_CACHE_MAX_ENTRIES = 200_000
+_QUERY_CHUNK = 500
+
+
+class DecisionCache:
+    """Persist LLM answers keyed by namespace and normalized input key.
+
+    The namespace carries provider, model and prompt schema version, so a
+    model switch or prompt change never reuses stale answers. Entries older
+    than ``ttl_seconds`` are ignored and purged; once more than
+    ``max_entries`` are stored, the least recently used ones are evicted.
+    Connections are per thread, so concurrent classification batches can
+    share one cache.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        ensure_parent_exists(db_path)
+        self._connections = ThreadLocalConnections(db_path)
+        self._write_lock = threading.Lock()
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        with self._connections.connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS decisions ("
+                "namespace TEXT NOT NULL, "
+                "key TEXT NOT NULL, "
+                "value TEXT NOT NULL, "
+                "created_at REAL NOT NULL, "
+                "used_at REAL NOT NULL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS decisions_used_at ON decisions (used_at)"
+            )
+
+    def get_many(self, namespace: str, keys: Iterable[str]) -> dict[str, dict]:
+        """Return fresh cached answers for ``keys`` and mark them as used."""
+        wanted = list(dict.fromkeys(keys))
+        now = self._clock()
+        cutoff = now - self.ttl_seconds
+        conn = self._connections.connect()
+        hits: dict[str, dict] = {}
+        for start in range(0, len(wanted), _QUERY_CHUNK):
+            chunk = wanted[start : start + _QUERY_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                "SELECT key, value FROM decisions "
+                f"WHERE namespace = ? AND created_at >= ? AND key IN ({placeholders})",
+                (namespace, cutoff, *chunk),
+            ).fetchall()
+            for key, value in rows:
+                hits[key] = json.loads(value)
+        if hits:
+            with self._write_lock, conn:
+                conn.executemany(
+                    "UPDATE decisions SET used_at = ? WHERE namespace = ? AND key = ?",
+                    [(now, namespace, key) for key in hits],
+                )
+        return hits
+
+    def put_many(self, namespace: str, values: Mapping[str, dict]) -> None:
+        """Store answers, then purge expired and least recently used entries."""
+        if not values:
+            return
+        now = self._clock()
+        conn = self._connections.connect()
+        with self._write_lock, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO decisions "
+                "(namespace, key, value, created_at, used_at) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (namespace, key, json.dumps(value, sort_keys=True), now, now)
+                    for key, value in values.items()
+                ],
+            )
+            conn.execute(
+                "DELETE FROM decisions WHERE created_at < ?",
+                (now - self.ttl_seconds,),
+            )
+            (count,) = conn.execute("SELECT COUNT(*) FROM decisions").fetchone()
+            if count > self.max_entries:
+                conn.execute(
+                    "DELETE FROM decisions WHERE rowid IN ("
+                    "SELECT rowid FROM decisions ORDER BY used_at LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+
+    def __len__(self) -> int:
+        conn = self._connections.connect()
+        (count,) = conn.execute("SELECT COUNT(*) FROM decisions").fetchone()
+        return int(count)
+
+    def close(self) -> None:
+        """Close every per-thread connection."""
+        self._connections.close()
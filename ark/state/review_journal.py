@@ -0,0 +1,140 @@
+"""Append-only journal of stage-3 review edits."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO
+
+from ark.state.base import ensure_parent_exists
+
+DEFAULT_COMPACT_EVERY = 2_000
+
+
+@dataclass
+class ReviewCursor:
+    """Where the reviewer was in the tree."""
+
+    current_dir: str = ""
+    page_index: int = 0
+    show_low_value: bool = False
+
+
+@dataclass
+class ReviewReplay:
+    """Review state reconstructed from a journal."""
+
+    selected_paths: list[str]
+    toggles: list[str] = field(default_factory=list)
+    cursor: ReviewCursor = field(default_factory=ReviewCursor)
+
+
+class ReviewJournal:
+    """JSONL journal holding a selection snapshot followed by edits.
+
+    The first line stores the full selection and cursor; every later line is
+    one toggled path or one cursor move, so a keypress costs a constant-size
+    append instead of rewriting the whole selection. After ``compact_every``
+    edits the owner folds them into a fresh snapshot. A torn final line left
+    by a crash is ignored on replay.
+    """
+
+    def __init__(self, path: Path, compact_every: int = DEFAULT_COMPACT_EVERY):
+        if compact_every <= 0:
+            raise ValueError("compact_every must be positive")
+        self.path = path
+        self.compact_every = compact_every
+        self.pending = 0
+        self._handle: IO[str] | None = None
+        self._cursor: ReviewCursor | None = None
+
+    @property
+    def needs_compaction(self) -> bool:
+        """Whether enough edits piled up to fold them into a snapshot."""
+        return self.pending >= self.compact_every
+
+    def snapshot(self, selected_paths: list[str], cursor: ReviewCursor) -> None:
+        """Replace the journal with one snapshot of the full review state."""
+        self.close()
+        ensure_parent_exists(self.path)
+        temp = self.path.with_suffix(".jsonl.tmp")
+        record = {"snapshot": selected_paths, "cursor": _cursor_fields(cursor)}
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        temp.write_text(line, encoding="utf-8")
+        temp.replace(self.path)
+        self.pending = 0
+        self._cursor = cursor
+
+    def toggle(self, path: str) -> None:
+        """Record that one file or directory was toggled."""
+        self._append({"toggle": path})
+
+    def move(self, cursor: ReviewCursor) -> None:
+        """Record a cursor move; repeated positions are not written again."""
+        if cursor == self._cursor:
+            return
+        self._cursor = cursor
+        self._append({"cursor": _cursor_fields(cursor)})
+
+    def replay(self) -> ReviewReplay | None:
+        """Rebuild the last snapshot and the edits after it, if any."""
+        if not self.path.exists():
+            return None
+        replay: ReviewReplay | None = None
+        edits = 0
+        with self.path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if "snapshot" in record:
+                    replay = ReviewReplay(
+                        selected_paths=[str(item) for item in record["snapshot"]],
+                        cursor=_cursor_from(record.get("cursor", {})),
+                    )
+                    edits = 0
+                elif replay is None:
+                    continue
+                elif "toggle" in record:
+                    replay.toggles.append(str(record["toggle"]))
+                    edits += 1
+                elif "cursor" in record:
+                    replay.cursor = _cursor_from(record["cursor"])
+                    edits += 1
+        if replay is not None:
+            self.pending = edits
+            self._cursor = replay.cursor
+        return replay
+
+    def reset(self) -> None:
+        """Drop the journal so the next review starts fresh."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+        self.pending = 0
+        self._cursor = None
+
+    def close(self) -> None:
+        """Close the append handle, if open."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def _append(self, record: dict) -> None:
+        if self._handle is None:
+            ensure_parent_exists(self.path)
+            self._handle = self.path.open("a", encoding="utf-8")
+        self._handle.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._handle.flush()
+        self.pending += 1
+
+
+def _cursor_fields(cursor: ReviewCursor) -> list:
+    return [cursor.current_dir, cursor.page_index, cursor.show_low_value]
+
+
+def _cursor_from(fields: object) -> ReviewCursor:
+    if not isinstance(fields, list) or len(fields) != 3:
+        return ReviewCursor()
+    return ReviewCursor(str(fields[0]), int(fields[1]), bool(fields[2]))
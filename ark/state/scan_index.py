@@ -0,0 +1,121 @@
+"""SQLite-backed directory index for incremental source scans."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from ark.collector.walker import DirectorySnapshot, FileRecord
+from ark.state.base import ThreadLocalConnections, ensure_parent_exists
+
+
+class ScanIndex:
+    """Persist per-directory listings keyed by directory mtime and inode.
+
+    Lookups may run concurrently from walker threads; each thread gets its
+    own connection, and the database runs in WAL mode so reads do not block
+    on the single writer.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        ensure_parent_exists(db_path)
+        self._connections = ThreadLocalConnections(db_path)
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        with self._connections.connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS directories ("
+                "path TEXT PRIMARY KEY, "
+                "mtime_ns INTEGER NOT NULL, "
+                "inode INTEGER NOT NULL, "
+                "device INTEGER NOT NULL, "
+                "listed_at_ns INTEGER NOT NULL, "
+                "files TEXT NOT NULL, "
+                "subdirs TEXT NOT NULL)"
+            )
+
+    def lookup(self, directory: str) -> DirectorySnapshot | None:
+        """Return the stored snapshot for one directory, if any."""
+        row = (
+            self._connections.connect()
+            .execute(
+                "SELECT mtime_ns, inode, device, listed_at_ns, files, subdirs "
+                "FROM directories WHERE path = ?",
+                (directory,),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        mtime_ns, inode, device, listed_at_ns, raw_files, raw_subdirs = row
+        base = Path(directory)
+        files = [
+            FileRecord.from_row([str(base / name), *fields])
+            for name, *fields in json.loads(raw_files)
+        ]
+        return DirectorySnapshot(
+            path=directory,
+            mtime_ns=mtime_ns,
+            inode=inode,
+            device=device,
+            listed_at_ns=listed_at_ns,
+            files=files,
+            subdirs=list(json.loads(raw_subdirs)),
+        )
+
+    def store(
+        self, snapshots: list[DirectorySnapshot], removed_dirs: list[str]
+    ) -> None:
+        """Upsert fresh snapshots and drop subtrees that no longer exist."""
+        rows = [
+            (
+                snapshot.path,
+                snapshot.mtime_ns,
+                snapshot.inode,
+                snapshot.device,
+                snapshot.listed_at_ns,
+                json.dumps(
+                    [
+                        [
+                            record.path.name,
+                            record.size,
+                            record.mtime_ns,
+                            record.inode,
+                            record.device,
+                            record.mode,
+                            record.nlink,
+                        ]
+                        for record in snapshot.files
+                    ],
+                    separators=(",", ":"),
+                ),
+                json.dumps(snapshot.subdirs, separators=(",", ":")),
+            )
+            for snapshot in snapshots
+        ]
+        with self._connections.connect() as conn:
+            for directory in removed_dirs:
+                conn.execute(
+                    "DELETE FROM directories "
+                    "WHERE path = ? OR (path >= ? AND path < ?)",
+                    _subtree_bounds(directory),
+                )
+            conn.executemany(
+                "INSERT OR REPLACE INTO directories "
+                "(path, mtime_ns, inode, device, listed_at_ns, files, subdirs) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def close(self) -> None:
+        """Close every connection opened by this index."""
+        self._connections.close()
+
+
+def _subtree_bounds(directory: str) -> tuple[str, str, str]:
+    """Return range bounds selecting one directory and all its descendants."""
+    sep = os.sep
+    return directory, f"{directory}{sep}", f"{directory}{chr(ord(sep) + 1)}"
@@ -0,0 +1,91 @@
+"""Append-only segment log for resumable in-memory scans."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO
+
+from ark.state.base import ensure_parent_exists
+
+
+@dataclass
+class ScanLogReplay:
+    """Scan progress reconstructed from a segment log."""
+
+    rows_by_root: dict[str, list[list]] = field(default_factory=dict)
+    completed_dirs: dict[str, list[str]] = field(default_factory=dict)
+    complete: bool = False
+
+
+class ScanSegmentLog:
+    """JSONL log where each line holds only newly discovered file rows.
+
+    Segments are appended as the scan progresses, so checkpoint cost stays
+    proportional to the new records instead of everything found so far.
+    Each segment also maps the directories listed since the previous one to
+    their kept subdirectory names, which lets a resumed walk skip them.
+    When the scan finishes, ``compact`` rewrites the log as one segment per
+    root followed by a completion marker. A torn final line left by a crash
+    is ignored on replay.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._handle: IO[str] | None = None
+
+    def append(
+        self,
+        rows_by_root: dict[str, list[list]],
+        completed_dirs: dict[str, list[str]],
+    ) -> None:
+        """Append one segment of new rows and fully listed directories."""
+        if self._handle is None:
+            ensure_parent_exists(self.path)
+            self._handle = self.path.open("a", encoding="utf-8")
+        segment = {"rows": rows_by_root, "dirs": completed_dirs}
+        self._handle.write(json.dumps(segment, separators=(",", ":")) + "\n")
+        self._handle.flush()
+
+    def replay(self) -> ScanLogReplay:
+        """Rebuild rows and completed directories from every intact segment."""
+        replay = ScanLogReplay()
+        if not self.path.exists():
+            return replay
+        with self.path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    segment = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if segment.get("complete"):
+                    replay.complete = True
+                    continue
+                for root, rows in segment.get("rows", {}).items():
+                    replay.rows_by_root.setdefault(root, []).extend(rows)
+                replay.completed_dirs.update(segment.get("dirs", {}))
+        return replay
+
+    def compact(self, rows_by_root: dict[str, list[list]]) -> None:
+        """Replace the log with the final rows and a completion marker."""
+        self.close()
+        ensure_parent_exists(self.path)
+        temp = self.path.with_suffix(".jsonl.tmp")
+        with temp.open("w", encoding="utf-8") as handle:
+            for root, rows in rows_by_root.items():
+                segment = {"rows": {root: rows}, "dirs": {}}
+                handle.write(json.dumps(segment, separators=(",", ":")) + "\n")
+            handle.write(json.dumps({"complete": True}) + "\n")
+        temp.replace(self.path)
+
+    def reset(self) -> None:
+        """Drop every segment so a scan can start over."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """Close the append handle, if open."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
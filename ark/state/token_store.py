@@ -0,0 +1,102 @@
+"""Encrypted on-disk cache of short-lived OAuth access tokens."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+from ark.state.base import ensure_parent_exists
+
+logger = logging.getLogger("ark.state.token_store")
+
+
+class EncryptedTokenStore:
+    """Keep access tokens across runs, encrypted at rest with Fernet.
+
+    Each entry is stored under a digest of the OAuth identity and encrypted
+    with a key derived from the identity's long-lived secrets, so the file
+    alone never reveals a usable token. Those secrets sit in plaintext in
+    ``config.json``, so anyone who can read both files can decrypt the cache;
+    the encryption only keeps tokens out of a leaked or shared cache file.
+    ``cryptography`` is optional (the ``token-cache`` extra): when it is
+    missing a warning is logged and every call is a no-op.
+    """
+
+    def __init__(self, file_path: Path):
+        self.file_path = file_path
+        self._lock = threading.Lock()
+        try:
+            from cryptography.fernet import Fernet, InvalidToken
+        except ImportError:
+            logger.warning(
+                "cryptography is not installed; Google access tokens are not "
+                "cached across runs (install ark[token-cache])"
+            )
+            self._fernet = None
+            self._invalid = ()
+        else:
+            self._fernet = Fernet
+            self._invalid = (InvalidToken,)
+
+    @property
+    def available(self) -> bool:
+        """Whether encryption support is installed."""
+        return self._fernet is not None
+
+    def load(self, identity: tuple[str, ...]) -> dict | None:
+        """Return the decrypted payload stored for ``identity``, if any."""
+        if self._fernet is None:
+            return None
+        with self._lock:
+            entries = self._read()
+        sealed = entries.get(_identity_digest(identity))
+        if not isinstance(sealed, str):
+            return None
+        try:
+            raw = self._fernet(_identity_key(identity)).decrypt(sealed.encode("ascii"))
+            payload = json.loads(raw)
+        except (*self._invalid, ValueError):
+            return None
+        return payload if isinstance(payload, dict) else None
+
+    def save(self, identity: tuple[str, ...], payload: dict) -> None:
+        """Encrypt and store ``payload`` for ``identity``."""
+        if self._fernet is None:
+            return
+        sealed = self._fernet(_identity_key(identity)).encrypt(
+            json.dumps(payload, sort_keys=True).encode("utf-8")
+        )
+        with self._lock:
+            entries = self._read()
+            entries[_identity_digest(identity)] = sealed.decode("ascii")
+            self._write(entries)
+
+    def _read(self) -> dict[str, object]:
+        try:
+            entries = json.loads(self.file_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def _write(self, entries: dict[str, object]) -> None:
+        ensure_parent_exists(self.file_path)
+        temp_path = self.file_path.with_name(f"{self.file_path.name}.tmp")
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(entries, handle, indent=2)
+        os.replace(temp_path, self.file_path)
+
+
+def _identity_digest(identity: tuple[str, ...]) -> str:
+    return hashlib.sha256("\0".join(identity).encode("utf-8")).hexdigest()
+
+
+def _identity_key(identity: tuple[str, ...]) -> bytes:
+    material = "\0".join(("ark-token-store", *identity)).encode("utf-8")
+    digest = hashlib.sha256(material).digest()
+    return base64.urlsafe_b64encode(digest)
@@ -0,0 +1,12 @@
+"""Shared text formatting helpers for review screens."""
+
+
+def human_bytes(size_bytes: int) -> str:
+    """Format bytes into a compact human readable string."""
+    units = ["B", "KB", "MB", "GB", "TB"]
+    value = float(size_bytes)
+    idx = 0
+    while value >= 1024.0 and idx < len(units) - 1:
+        value /= 1024.0
+        idx += 1
+    return f"{value:.1f} {units[idx]}"
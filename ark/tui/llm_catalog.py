@@ -2,6 +2,15 @@
 
 from dataclasses import dataclass
 
+from ark.ai.batcher import DEFAULT_TOKEN_BUDGET
+from ark.ai.rate_limit import (
+    DEFAULT_REQUESTS_PER_MINUTE,
+    DEFAULT_TOKENS_PER_MINUTE,
+    ProviderLimits,
+)
+
+DEFAULT_REPLY_TOKENS = 4_096
+
 
 @dataclass(frozen=True)
 class LLMProviderPreset:
@@ -13,12 +22,35 @@ class LLMProviderPreset:
     requires_api_key: bool = True
     base_url: str = ""
     allow_base_url: bool = False
+    context_tokens: int = 128_000
+    reply_tokens: int = DEFAULT_REPLY_TOKENS
+    requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE
+    tokens_per_minute: int = DEFAULT_TOKENS_PER_MINUTE
 
     @property
     def default_model(self) -> str:
         """Return the first recommended model."""
         return self.models[0]
 
+    @property
+    def batch_token_budget(self) -> int:
+        """Return the estimated tokens one classification batch may use.
+
+        Every input is charged its answer tokens, so a budget no larger than
+        ``reply_tokens`` (the longest reply the provider returns when Ark
+        sends no ``max_tokens``) keeps the JSON answer from being cut off.
+        A quarter of the context window bounds the prompt side.
+        """
+        return min(self.reply_tokens, self.context_tokens // 4)
+
+    @property
+    def rate_limits(self) -> ProviderLimits:
+        """Return the request and token quota Ark paces this provider to."""
+        return ProviderLimits(
+            requests_per_minute=self.requests_per_minute,
+            tokens_per_minute=self.tokens_per_minute,
+        )
+
 
 LLM_PROVIDER_GROUPS: dict[str, list[LLMProviderPreset]] = {
     "OpenAI & Compatible": [
@@ -26,6 +58,7 @@ LLM_PROVIDER_GROUPS: dict[str, list[LLMProviderPreset]] = {
             name="OpenAI",
             provider="openai",
             models=("openai/gpt-4.1", "openai/gpt-4o", "openai/gpt-4.1-mini"),
+            reply_tokens=16_384,
         ),
         LLMProviderPreset(
             name="OpenRouter",
@@ -67,6 +100,7 @@ LLM_PROVIDER_GROUPS: dict[str, list[LLMProviderPreset]] = {
                 "anthropic/claude-sonnet-4",
                 "anthropic/claude-3-5-sonnet-latest",
             ),
+            context_tokens=200_000,
         ),
         LLMProviderPreset(
             name="Google Gemini",
@@ -76,6 +110,8 @@ LLM_PROVIDER_GROUPS: dict[str, list[LLMProviderPreset]] = {
                 "gemini/gemini-2.5-pro",
                 "gemini/gemini-2.5-flash",
             ),
+            context_tokens=1_000_000,
+            reply_tokens=8_192,
         ),
         LLMProviderPreset(
             name="Mistral",
@@ -85,6 +121,7 @@ LLM_PROVIDER_GROUPS: dict[str, list[LLMProviderPreset]] = {
                 "mistral/mistral-medium-latest",
                 "mistral/ministral-8b-latest",
             ),
+            context_tokens=32_000,
         ),
         LLMProviderPreset(
             name="Groq",
@@ -94,6 +131,9 @@ LLM_PROVIDER_GROUPS: dict[str, list[LLMProviderPreset]] = {
                 "groq/llama-3.1-70b-versatile",
                 "groq/qwen-qwq-32b",
             ),
+            context_tokens=32_000,
+            reply_tokens=8_192,
+            requests_per_minute=30,
         ),
     ],
     "China-Friendly": [
@@ -105,6 +145,7 @@ LLM_PROVIDER_GROUPS: dict[str, list[LLMProviderPreset]] = {
                 "deepseek/deepseek-chat",
                 "deepseek/deepseek-coder",
             ),
+            context_tokens=64_000,
         ),
         LLMProviderPreset(
             name="GLM (Zhipu)",
@@ -116,6 +157,8 @@ LLM_PROVIDER_GROUPS: dict[str, list[LLMProviderPreset]] = {
             name="Qwen (Ali Tongyi)",
             provider="qwen",
             models=("qwen/qwen-max", "qwen/qwen-plus", "qwen/qwen-turbo"),
+            context_tokens=32_000,
+            reply_tokens=8_192,
         ),
         LLMProviderPreset(
             name="Moonshot",
@@ -125,6 +168,7 @@ LLM_PROVIDER_GROUPS: dict[str, list[LLMProviderPreset]] = {
                 "moonshot/moonshot-v1-32k",
                 "moonshot/moonshot-v1-8k",
             ),
+            context_tokens=8_000,
         ),
         LLMProviderPreset(
             name="MiniMax",
@@ -134,6 +178,7 @@ LLM_PROVIDER_GROUPS: dict[str, list[LLMProviderPreset]] = {
                 "minimax/abab6.5-chat",
                 "minimax/abab5.5-chat",
             ),
+            context_tokens=8_000,
         ),
     ],
     "Research / Web": [
@@ -154,6 +199,7 @@ LLM_PROVIDER_GROUPS: dict[str, list[LLMProviderPreset]] = {
                 "cohere/command-r-plus",
                 "cohere/command-r",
             ),
+            context_tokens=128_000,
         ),
     ],
     "Local & Custom": [
@@ -164,6 +210,9 @@ LLM_PROVIDER_GROUPS: dict[str, list[LLMProviderPreset]] = {
             requires_api_key=False,
             base_url="http://localhost:11434",
             allow_base_url=True,
+            context_tokens=8_000,
+            requests_per_minute=0,
+            tokens_per_minute=0,
         ),
         LLMProviderPreset(
             name="OpenAI-Compatible (custom)",
@@ -179,6 +228,42 @@ LLM_PROVIDER_GROUPS: dict[str, list[LLMProviderPreset]] = {
 }
 
 
+def batch_token_budget(provider: str) -> int:
+    """Return the stage-2 batch token budget for a provider id."""
+    for presets in LLM_PROVIDER_GROUPS.values():
+        for preset in presets:
+            if preset.provider == provider:
+                return preset.batch_token_budget
+    return DEFAULT_TOKEN_BUDGET
+
+
+def rate_limits(
+    provider: str,
+    requests_per_minute: int | None = None,
+    tokens_per_minute: int | None = None,
+) -> ProviderLimits:
+    """Return the per-minute request and token limits for a provider id.
+
+    Explicit ``requests_per_minute``/``tokens_per_minute`` override the preset.
+    """
+    limits = ProviderLimits()
+    for presets in LLM_PROVIDER_GROUPS.values():
+        for preset in presets:
+            if preset.provider == provider:
+                limits = preset.rate_limits
+                break
+    return ProviderLimits(
+        requests_per_minute=(
+            limits.requests_per_minute
+            if requests_per_minute is None
+            else requests_per_minute
+        ),
+        tokens_per_minute=(
+            limits.tokens_per_minute if tokens_per_minute is None else tokens_per_minute
+        ),
+    )
+
+
 def find_provider_group(provider: str) -> str | None:
     """Return provider group name for provider id."""
     for group_name, presets in LLM_PROVIDER_GROUPS.items():
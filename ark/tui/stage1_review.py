@@ -1,6 +1,7 @@
 """Stage 1 suffix review defaults and interactive helpers."""
 
 from dataclasses import dataclass
+from pathlib import PurePath
 from typing import Callable
 
 from prompt_toolkit.application import Application
@@ -13,6 +14,7 @@ from rich.console import Console
 from rich.table import Table
 
 from ark.rules.local_rules import suffix_category
+from ark.tui.formatting import human_bytes
 
 
 @dataclass(frozen=True)
@@ -24,6 +26,9 @@ class SuffixReviewRow:
     tag: str
     confidence: float
     reason: str
+    file_count: int = 0
+    total_bytes: int = 0
+    examples: tuple[str, ...] = ()
 
 
 _CATEGORY_ORDER = [
@@ -48,7 +53,7 @@ def classify_suffix_category(ext: str) -> str:
 def group_suffix_rows(rows: list[SuffixReviewRow]) -> dict[str, list[SuffixReviewRow]]:
     """Group stage-1 rows by category with stable category order."""
     grouped: dict[str, list[SuffixReviewRow]] = {name: [] for name in _CATEGORY_ORDER}
-    for row in rows:
+    for row in _by_volume(rows):
         grouped[classify_suffix_category(row.ext)].append(row)
     return {name: values for name, values in grouped.items() if values}
 
@@ -72,9 +77,7 @@ def flatten_grouped_suffix_choices(
         for row in rows:
             choices.append(
                 {
-                    "name": (
-                        f"  {row.ext:8} {row.label:4} conf={row.confidence:.2f} {row.reason}"
-                    ),
+                    "name": _choice_label(row),
                     "value": row.ext,
                 }
             )
@@ -118,9 +121,12 @@ def render_stage1_table(
     table.add_column("AI Label")
     table.add_column("Tag")
     table.add_column("Confidence", justify="right")
+    table.add_column("Files", justify="right")
+    table.add_column("Size", justify="right")
+    table.add_column("Largest")
     table.add_column("Reason")
 
-    for row in rows:
+    for row in _by_volume(rows):
         category = classify_suffix_category(row.ext)
         style = _style_for_category(category)
         table.add_row(
@@ -128,6 +134,9 @@ def render_stage1_table(
             row.label,
             f"{category}/{row.tag}",
             f"{row.confidence:.2f}",
+            str(row.file_count),
+            human_bytes(row.total_bytes),
+            ", ".join(_example_names(row)),
             row.reason,
             style=style,
         )
@@ -166,7 +175,7 @@ def run_stage1_review(
         for row in grouped[category]:
             choices.append(
                 {
-                    "name": f"  {row.ext:8} {row.label:4} conf={row.confidence:.2f} {row.reason}",
+                    "name": _choice_label(row),
                     "value": row.ext,
                     "category": category_value,
                 }
@@ -285,6 +294,25 @@ def _default_checkbox_prompt(
     return list(result or [])
 
 
+def _by_volume(rows: list[SuffixReviewRow]) -> list[SuffixReviewRow]:
+    """Order rows by total bytes so the heaviest suffixes are reviewed first."""
+    return sorted(rows, key=lambda row: -row.total_bytes)
+
+
+def _choice_label(row: SuffixReviewRow) -> str:
+    label = (
+        f"  {row.ext:8} {row.label:4} conf={row.confidence:.2f} "
+        f"files={row.file_count} size={human_bytes(row.total_bytes)} {row.reason}"
+    )
+    names = _example_names(row)
+    return f"{label} e.g. {names[0]}" if names else label
+
+
+def _example_names(row: SuffixReviewRow) -> list[str]:
+    """Return the file names of the suffix's largest example paths."""
+    return [PurePath(path).name for path in row.examples]
+
+
 def _checkbox_cursor_value(
     checkbox: CheckboxList, values: list[tuple[str, str]]
 ) -> str:
@@ -1,6 +1,8 @@
 """Stage 3 final review helpers."""
 
-from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from typing import Callable
 
@@ -13,16 +15,23 @@ from prompt_toolkit.layout.controls import FormattedTextControl
 from prompt_toolkit.widgets import RadioList
 from rich.console import Console
 from rich.panel import Panel
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn
 from rich.table import Table
 from rich.text import Text
 from rich.tree import Tree
 
+from ark.ai.batcher import DEFAULT_AI_CONCURRENCY
+from ark.state.review_journal import ReviewCursor, ReviewJournal
+from ark.tui.formatting import human_bytes
 from ark.tui.tree_selection import SelectionState, TreeSelectionState, paginate_items
 
 _TREE_ACTION_HINT = (
     "Enter=select(open/toggle/control), Right=open, Space=toggle, "
     "Left/b/h=up, n/p=page, a/f=filter, q/esc=done"
 )
+DEFAULT_DIRECTORY_CALL_LIMIT = 2_000
+DIRECTORY_PRUNE_CONFIDENCE = 0.7
+_DIRECTORY_SAMPLE_FILES = 8
 
 
 @dataclass(frozen=True)
@@ -57,7 +66,7 @@ def render_stage3_table(
         table.add_row(
             row.tier,
             row.path,
-            _human_bytes(row.size_bytes),
+            human_bytes(row.size_bytes),
             f"{row.confidence:.2f}",
             row.reason,
         )
@@ -77,8 +86,18 @@ def run_stage3_review(
     ai_directory_decision_fn: (
         Callable[[str, list[str], list[str]], dict[str, object]] | None
     ) = None,
+    ai_directory_workers: int = DEFAULT_AI_CONCURRENCY,
+    ai_directory_call_limit: int = DEFAULT_DIRECTORY_CALL_LIMIT,
+    review_journal: ReviewJournal | None = None,
 ) -> set[str]:
-    """Run final TUI review for backup path selection."""
+    """Run final TUI review for backup path selection.
+
+    Before the tree opens, ``ai_directory_decision_fn`` is asked about at most
+    ``ai_directory_call_limit`` directories, ``ai_directory_workers`` at a time.
+    With a ``review_journal``, edits and cursor moves are appended to it
+    instead of passing the full state to ``checkpoint_callback`` on every
+    keypress, and a non-empty journal is replayed to resume the review.
+    """
     filtered_rows = [row for row in rows if row.tier in {"tier1", "tier2"}]
     ui = console or Console()
     _render_stage3_banner(ui, filtered_rows)
@@ -96,6 +115,9 @@ def run_stage3_review(
             checkpoint_callback=checkpoint_callback,
             console=ui,
             ai_directory_decision_fn=ai_directory_decision_fn,
+            ai_directory_workers=ai_directory_workers,
+            ai_directory_call_limit=ai_directory_call_limit,
+            review_journal=review_journal,
         )
 
     confirm_fn = confirm_prompt or _default_confirm_prompt
@@ -114,7 +136,7 @@ def _run_checkbox_mode(
     choices = [
         {
             "name": (
-                f"[{row.tier}] {row.path} | size={_human_bytes(row.size_bytes)} | "
+                f"[{row.tier}] {row.path} | size={human_bytes(row.size_bytes)} | "
                 f"conf={row.confidence:.2f} | {row.reason}"
             ),
             "value": row.path,
@@ -137,46 +159,64 @@ def _run_tree_mode(
     console: Console,
     ai_directory_decision_fn: Callable[[str, list[str], list[str]], dict[str, object]]
     | None,
+    ai_directory_workers: int = DEFAULT_AI_CONCURRENCY,
+    ai_directory_call_limit: int = DEFAULT_DIRECTORY_CALL_LIMIT,
+    review_journal: ReviewJournal | None = None,
 ) -> set[str]:
     """Run tree-based paginated decision flow."""
+    replay = review_journal.replay() if review_journal is not None else None
     defaults = {row.path for row in filtered_rows if row.tier == "tier1"}
-    if resume_state and resume_state.get("selected_paths"):
+    if replay is not None:
+        defaults = set(replay.selected_paths)
+    elif resume_state and resume_state.get("selected_paths"):
         defaults = {str(path) for path in resume_state.get("selected_paths", [])}
     low_value_files = {row.path for row in filtered_rows if row.ai_risk == "low_value"}
     candidates = [row.path for row in filtered_rows]
 
-    if ai_directory_decision_fn and not (
-        resume_state and resume_state.get("selected_paths")
+    if (
+        ai_directory_decision_fn
+        and replay is None
+        and not (resume_state and resume_state.get("selected_paths"))
     ):
-        defaults, ai_decisions = _apply_ai_directory_decisions(
+        defaults, ai_decisions, unvisited = _apply_ai_directory_decisions(
             candidates,
             defaults,
             ai_directory_decision_fn,
+            max_workers=ai_directory_workers,
+            max_calls=ai_directory_call_limit,
+            console=console,
         )
-        _render_ai_dfs_summary(console, ai_decisions)
-
-    state = TreeSelectionState.from_paths(candidates, selected_files=defaults)
+        _render_ai_dfs_summary(console, ai_decisions, unvisited)
 
-    current_dir = str(resume_state.get("current_dir", "")) if resume_state else ""
-    page_index = int(resume_state.get("page_index", 0)) if resume_state else 0
-    show_low_value = (
-        bool(resume_state.get("show_low_value", not hide_low_value_default))
-        if resume_state
-        else not hide_low_value_default
+    state = TreeSelectionState.from_paths(
+        candidates,
+        selected_files=defaults,
+        low_value_files=low_value_files,
     )
 
+    if replay is not None:
+        for path in replay.toggles:
+            state.toggle(path)
+        current_dir = replay.cursor.current_dir
+        page_index = replay.cursor.page_index
+        show_low_value = replay.cursor.show_low_value
+    else:
+        current_dir = str(resume_state.get("current_dir", "")) if resume_state else ""
+        page_index = int(resume_state.get("page_index", 0)) if resume_state else 0
+        show_low_value = (
+            bool(resume_state.get("show_low_value", not hide_low_value_default))
+            if resume_state
+            else not hide_low_value_default
+        )
+        if review_journal is not None:
+            review_journal.snapshot(
+                sorted(state.selected_files),
+                ReviewCursor(current_dir, page_index, show_low_value),
+            )
+
     while True:
         nodes = state.children(current_dir)
-        visible_nodes = [
-            node
-            for node in nodes
-            if _is_visible_node(
-                node=node,
-                state=state,
-                low_value_files=low_value_files,
-                show_low_value=show_low_value,
-            )
-        ]
+        visible_nodes = state.children(current_dir, hide_low_value=not show_low_value)
         page_items, total_pages = paginate_items(visible_nodes, page_size, page_index)
         page_index = max(0, min(page_index, total_pages - 1))
 
@@ -234,13 +274,14 @@ def _run_tree_mode(
                 page_index=page_index,
                 show_low_value=show_low_value,
                 checkpoint_callback=checkpoint_callback,
+                review_journal=review_journal,
             )
             raise
 
         if action in {"done", "control::done"}:
             break
         if action in {"up", "control::up"}:
-            current_dir = state.parent_by_path.get(current_dir, "")
+            current_dir = state.parent(current_dir)
             page_index = 0
             _checkpoint_tree_state(
                 state=state,
@@ -248,6 +289,7 @@ def _run_tree_mode(
                 page_index=page_index,
                 show_low_value=show_low_value,
                 checkpoint_callback=checkpoint_callback,
+                review_journal=review_journal,
             )
             continue
         if action == "next":
@@ -258,6 +300,7 @@ def _run_tree_mode(
                 page_index=page_index,
                 show_low_value=show_low_value,
                 checkpoint_callback=checkpoint_callback,
+                review_journal=review_journal,
             )
             continue
         if action == "prev":
@@ -268,6 +311,7 @@ def _run_tree_mode(
                 page_index=page_index,
                 show_low_value=show_low_value,
                 checkpoint_callback=checkpoint_callback,
+                review_journal=review_journal,
             )
             continue
         if action == "toggle_low_value":
@@ -279,6 +323,7 @@ def _run_tree_mode(
                 page_index=page_index,
                 show_low_value=show_low_value,
                 checkpoint_callback=checkpoint_callback,
+                review_journal=review_journal,
             )
             continue
         if action == "show_all":
@@ -290,6 +335,7 @@ def _run_tree_mode(
                 page_index=page_index,
                 show_low_value=show_low_value,
                 checkpoint_callback=checkpoint_callback,
+                review_journal=review_journal,
             )
             continue
         if action == "show_filtered":
@@ -301,28 +347,31 @@ def _run_tree_mode(
                 page_index=page_index,
                 show_low_value=show_low_value,
                 checkpoint_callback=checkpoint_callback,
+                review_journal=review_journal,
             )
             continue
         if action.startswith("space::"):
             selected_value = action.split("::", 1)[1]
             if selected_value.startswith("node::"):
-                state.toggle(selected_value.split("::", 1)[1])
+                _toggle_node(state, selected_value.split("::", 1)[1], review_journal)
             _checkpoint_tree_state(
                 state=state,
                 current_dir=current_dir,
                 page_index=page_index,
                 show_low_value=show_low_value,
                 checkpoint_callback=checkpoint_callback,
+                review_journal=review_journal,
             )
             continue
         if action.startswith("toggle::"):
-            state.toggle(action.split("::", 1)[1])
+            _toggle_node(state, action.split("::", 1)[1], review_journal)
             _checkpoint_tree_state(
                 state=state,
                 current_dir=current_dir,
                 page_index=page_index,
                 show_low_value=show_low_value,
                 checkpoint_callback=checkpoint_callback,
+                review_journal=review_journal,
             )
             continue
         if action.startswith("enter::"):
@@ -330,7 +379,7 @@ def _run_tree_mode(
             if selected_value == "control::done":
                 break
             if selected_value == "control::up":
-                current_dir = state.parent_by_path.get(current_dir, "")
+                current_dir = state.parent(current_dir)
                 page_index = 0
                 _checkpoint_tree_state(
                     state=state,
@@ -338,6 +387,7 @@ def _run_tree_mode(
                     page_index=page_index,
                     show_low_value=show_low_value,
                     checkpoint_callback=checkpoint_callback,
+                    review_journal=review_journal,
                 )
                 continue
             if selected_value.startswith("node::"):
@@ -345,7 +395,7 @@ def _run_tree_mode(
                 if state.is_dir(node):
                     current_dir = node
                 else:
-                    state.toggle(node)
+                    _toggle_node(state, node, review_journal)
             else:
                 current_dir = selected_value
             page_index = 0
@@ -355,6 +405,7 @@ def _run_tree_mode(
                 page_index=page_index,
                 show_low_value=show_low_value,
                 checkpoint_callback=checkpoint_callback,
+                review_journal=review_journal,
             )
             continue
         if action.startswith("node::"):
@@ -362,7 +413,7 @@ def _run_tree_mode(
             if state.is_dir(node):
                 current_dir = node
             else:
-                state.toggle(node)
+                _toggle_node(state, node, review_journal)
             page_index = 0
             _checkpoint_tree_state(
                 state=state,
@@ -370,6 +421,7 @@ def _run_tree_mode(
                 page_index=page_index,
                 show_low_value=show_low_value,
                 checkpoint_callback=checkpoint_callback,
+                review_journal=review_journal,
             )
             continue
 
@@ -379,18 +431,35 @@ def _run_tree_mode(
             page_index=page_index,
             show_low_value=show_low_value,
             checkpoint_callback=checkpoint_callback,
+            review_journal=review_journal,
         )
 
     return state.selected_files & set(candidates)
 
 
+def _toggle_node(
+    state: TreeSelectionState, node: str, review_journal: ReviewJournal | None
+) -> None:
+    state.toggle(node)
+    if review_journal is not None:
+        review_journal.toggle(node)
+
+
 def _checkpoint_tree_state(
     state: TreeSelectionState,
     current_dir: str,
     page_index: int,
     show_low_value: bool,
     checkpoint_callback: Callable[[dict], None] | None,
+    review_journal: ReviewJournal | None = None,
 ) -> None:
+    if review_journal is not None:
+        cursor = ReviewCursor(current_dir, page_index, show_low_value)
+        if review_journal.needs_compaction:
+            review_journal.snapshot(sorted(state.selected_files), cursor)
+        else:
+            review_journal.move(cursor)
+        return
     if checkpoint_callback is None:
         return
     checkpoint_callback(
@@ -504,17 +573,6 @@ def _default_confirm_prompt(message: str, default: bool) -> bool:
     return bool(result)
 
 
-def _human_bytes(size_bytes: int) -> str:
-    """Format bytes into a compact human readable string."""
-    units = ["B", "KB", "MB", "GB", "TB"]
-    value = float(size_bytes)
-    idx = 0
-    while value >= 1024.0 and idx < len(units) - 1:
-        value /= 1024.0
-        idx += 1
-    return f"{value:.1f} {units[idx]}"
-
-
 def _marker_for(state: SelectionState) -> str:
     if state == SelectionState.CHECKED:
         return "●"
@@ -527,23 +585,7 @@ def _display_name(path: str) -> str:
     return path.rsplit("/", 1)[-1]
 
 
-def _is_visible_node(
-    node: str,
-    state: TreeSelectionState,
-    low_value_files: set[str],
-    show_low_value: bool,
-) -> bool:
-    if show_low_value:
-        return True
-    if state.is_dir(node):
-        descendants = state.descendant_files(node)
-        if not descendants:
-            return True
-        return bool(descendants - low_value_files)
-    return node not in low_value_files
-
-
-def _hidden_node_count(all_nodes: list[str], visible_nodes: list[str]) -> int:
+def _hidden_node_count(all_nodes: Sequence[str], visible_nodes: Sequence[str]) -> int:
     return max(0, len(all_nodes) - len(visible_nodes))
 
 
@@ -601,64 +643,93 @@ def _apply_ai_directory_decisions(
     candidates: list[str],
     defaults: set[str],
     ai_directory_decision_fn: Callable[[str, list[str], list[str]], dict[str, object]],
-) -> tuple[set[str], list[dict[str, object]]]:
+    max_workers: int = DEFAULT_AI_CONCURRENCY,
+    max_calls: int = DEFAULT_DIRECTORY_CALL_LIMIT,
+    console: Console | None = None,
+) -> tuple[set[str], list[dict[str, object]], int]:
+    """Ask the AI about directories top-down and apply keep/drop decisions.
+
+    One pool of ``max_workers`` threads serves the whole walk, so at most that
+    many calls are in flight. Children of directories decided keep or drop
+    with at least ``DIRECTORY_PRUNE_CONFIDENCE`` are never queried, and no
+    more than ``max_calls`` directories are asked in total. A child is only
+    queued once its parent's answer is applied, so deeper decisions still
+    override shallower ones. Returns the selection, the decisions and how
+    many queued directories the call limit left unvisited.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
     state = TreeSelectionState.from_paths(candidates, selected_files=defaults)
     selected = set(defaults)
     decisions: list[dict[str, object]] = []
-
-    current_level = [item for item in state.children("") if state.is_dir(item)]
-    while current_level:
-        sorted_level = sorted(current_level)
-        payload_by_directory: dict[str, dict[str, object]] = {}
-
-        with ThreadPoolExecutor(max_workers=max(1, len(sorted_level))) as executor:
-            future_by_directory = {
-                directory: executor.submit(
+    pending = deque(_child_directories(state, ""))
+    in_flight: dict[Future[dict[str, object]], str] = {}
+    calls = 0
+
+    progress = Progress(
+        TextColumn("[cyan]AI directory review"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TextColumn("queued={task.fields[queued]}"),
+        console=console,
+        transient=True,
+    )
+    with ThreadPoolExecutor(max_workers=max_workers) as executor, progress:
+        task = progress.add_task("dfs", total=None, queued=len(pending))
+        while pending or in_flight:
+            while pending and len(in_flight) < max_workers and calls < max_calls:
+                directory = pending.popleft()
+                samples = sorted(state.descendant_files(directory))
+                future = executor.submit(
                     ai_directory_decision_fn,
                     directory,
-                    [item for item in state.children(directory) if state.is_dir(item)],
-                    sorted(state.descendant_files(directory))[:8],
+                    _child_directories(state, directory),
+                    samples[:_DIRECTORY_SAMPLE_FILES],
                 )
-                for directory in sorted_level
-            }
-            for directory in sorted_level:
-                payload_by_directory[directory] = future_by_directory[
-                    directory
-                ].result()
-
-        next_level: list[str] = []
-        for directory in sorted_level:
-            child_dirs = [
-                item for item in state.children(directory) if state.is_dir(item)
-            ]
-            payload = payload_by_directory[directory]
-            decision = str(payload.get("decision", "not_sure")).lower()
-            descendants = state.descendant_files(directory)
-
-            if decision == "keep":
-                selected.update(descendants)
-            elif decision == "drop":
-                selected.difference_update(descendants)
-            else:
-                decision = "not_sure"
+                in_flight[future] = directory
+                calls += 1
+            if not in_flight:
+                break
 
-            decisions.append(
-                {
-                    "directory": directory,
-                    "decision": decision,
-                    "confidence": float(payload.get("confidence", 0.0)),
-                    "reason": str(payload.get("reason", "")),
-                }
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=in_flight.__getitem__):
+                directory = in_flight.pop(future)
+                payload = future.result()
+                decision = str(payload.get("decision", "not_sure")).lower()
+                confidence = float(payload.get("confidence", 0.0))
+                descendants = state.descendant_files(directory)
+                if decision == "keep":
+                    selected.update(descendants)
+                elif decision == "drop":
+                    selected.difference_update(descendants)
+                else:
+                    decision = "not_sure"
+                decisions.append(
+                    {
+                        "directory": directory,
+                        "decision": decision,
+                        "confidence": confidence,
+                        "reason": str(payload.get("reason", "")),
+                    }
+                )
+                if decision == "not_sure" or confidence < DIRECTORY_PRUNE_CONFIDENCE:
+                    pending.extend(_child_directories(state, directory))
+            progress.update(
+                task,
+                completed=len(decisions),
+                total=min(calls + len(pending), max_calls),
+                queued=len(pending),
             )
-            next_level.extend(child_dirs)
 
-        current_level = next_level
+    return selected, decisions, len(pending)
+
 
-    return selected, decisions
+def _child_directories(state: TreeSelectionState, directory: str) -> list[str]:
+    return list(state.child_directories(directory))
 
 
 def _render_ai_dfs_summary(
-    console: Console, decisions: list[dict[str, object]]
+    console: Console, decisions: list[dict[str, object]], unvisited: int = 0
 ) -> None:
     if not decisions:
         return
@@ -673,4 +744,7 @@ def _render_ai_dfs_summary(
     text.append(f"drop={drop}", style="red")
     text.append("  ")
     text.append(f"not_sure={unsure}", style="yellow")
+    if unvisited:
+        text.append("  ")
+        text.append(f"unvisited={unvisited} (call limit)", style="magenta")
     console.print(Panel(text, border_style="magenta"))
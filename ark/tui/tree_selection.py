@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import sys
+from array import array
+from collections.abc import Iterator, Sequence
 from enum import Enum
 from pathlib import PurePosixPath
+from typing import overload
 
 
 class SelectionState(str, Enum):
@@ -15,114 +18,363 @@ class SelectionState(str, Enum):
     CHECKED = "checked"
 
 
-@dataclass
+_FILE = 1
+_DIR = 2
+_SELECTED = 4
+_LOW_VALUE = 8
+_NO_NODE = -1
+_ROOT = 0
+
+
 class TreeSelectionState:
-    """In-memory tree and selected file set."""
+    """In-memory tree and selected file set, stored as a compact node table.
+
+    Nodes are integer ids into parallel ``array`` columns: interned name,
+    parent, flags and per-directory counts of descendant, selected and
+    low-value files. Path strings are rebuilt only when handed out, so deep
+    trees no longer repeat every prefix across several containers.
+    Tri-state and visibility checks read the counts in O(1); a directory
+    toggle costs the size of its subtree.
+
+    Children are sorted once, directories first, into one offset-indexed
+    array; ``children`` hands out views over it that build paths only for the
+    slice being shown.
+    """
 
-    children_by_path: dict[str, set[str]] = field(default_factory=dict)
-    parent_by_path: dict[str, str] = field(default_factory=dict)
-    files: set[str] = field(default_factory=set)
-    directories: set[str] = field(default_factory=set)
-    selected_files: set[str] = field(default_factory=set)
+    def __init__(self) -> None:
+        self._names: list[str] = [""]
+        self._parent = array("i", [_NO_NODE])
+        self._flags = bytearray(1)
+        self._file_count = array("i", [0])
+        self._selected_count = array("i", [0])
+        self._low_value_count = array("i", [0])
+        self._child_index: dict[int, dict[str, int]] = {}
+        self._child_offsets = array("i", [0, 0])
+        self._child_ids = array("i")
+        self._child_dir_count = array("i", [0])
+        self._visible_children: dict[int, array] = {}
 
     @classmethod
     def from_paths(
         cls,
         paths: list[str],
         selected_files: set[str] | None = None,
+        low_value_files: set[str] | None = None,
     ) -> TreeSelectionState:
         state = cls()
         selected = {normalize_path(path) for path in (selected_files or set())}
+        low_value = {normalize_path(path) for path in (low_value_files or set())}
 
+        # Neighbouring candidates usually share directories; reuse the node
+        # ids of the previous path's common prefix instead of looking it up.
+        previous: list[str] = []
+        chain: list[int] = [_ROOT]
         for raw_path in paths:
             path = normalize_path(raw_path)
-            parts = _path_prefixes(path)
-            if not parts:
+            segments = _path_segments(path)
+            if not segments:
                 continue
 
-            state.files.add(parts[-1])
-            state.selected_files.update({parts[-1]} & selected)
+            shared = 0
+            limit = min(len(segments), len(previous))
+            while shared < limit and segments[shared] == previous[shared]:
+                shared += 1
+            del chain[shared + 1 :]
+            for segment in segments[shared:]:
+                chain.append(state._child(chain[-1], segment))
+            previous = segments
+            node = chain[-1]
+            ancestors = chain[:-1]
+            if state._flags[node] & _FILE:
+                continue
 
-            for idx, node in enumerate(parts):
-                parent = "" if idx == 0 else parts[idx - 1]
-                state.parent_by_path[node] = parent
-                state.children_by_path.setdefault(parent, set()).add(node)
-                state.children_by_path.setdefault(node, set())
-                if idx < len(parts) - 1:
-                    state.directories.add(node)
+            flags = _FILE
+            if path in selected:
+                flags |= _SELECTED
+            if path in low_value:
+                flags |= _LOW_VALUE
+            state._flags[node] |= flags
+            for ancestor in ancestors:
+                state._file_count[ancestor] += 1
+                if flags & _SELECTED:
+                    state._selected_count[ancestor] += 1
+                if flags & _LOW_VALUE:
+                    state._low_value_count[ancestor] += 1
 
+        state._sort_children()
         return state
 
+    @property
+    def selected_files(self) -> set[str]:
+        """Return the selected file paths."""
+        return {
+            self._path(node)
+            for node, flags in enumerate(self._flags)
+            if flags & _SELECTED
+        }
+
     def is_dir(self, node_path: str) -> bool:
         """Return whether node is a directory."""
-        return normalize_path(node_path) in self.directories
+        node = self._lookup(node_path)
+        return node > _ROOT and bool(self._flags[node] & _DIR)
+
+    def parent(self, node_path: str) -> str:
+        """Return the parent directory path, or ``""`` at the top level."""
+        node = self._lookup(node_path)
+        if node <= _ROOT:
+            return ""
+        return self._path(self._parent[node])
+
+    def children(self, node_path: str, hide_low_value: bool = False) -> ChildListing:
+        """Return sorted children of one directory path, directories first.
+
+        With ``hide_low_value``, files marked low value and directories that
+        hold only such files are left out; that listing is cached per
+        directory since low-value marks never change.
+        """
+        node = self._lookup(node_path)
+        if node == _NO_NODE:
+            return ChildListing(self, node_path, array("i"))
+        ids = self._child_slice(node)
+        if hide_low_value:
+            visible = self._visible_children.get(node)
+            if visible is None:
+                visible = array("i", (child for child in ids if self._visible(child)))
+                self._visible_children[node] = visible
+            ids = visible
+        return ChildListing(self, self._path(node), ids)
+
+    def child_directories(self, node_path: str) -> ChildListing:
+        """Return the sorted child directories of one directory path."""
+        node = self._lookup(node_path)
+        if node == _NO_NODE:
+            return ChildListing(self, node_path, array("i"))
+        start = self._child_offsets[node]
+        end = start + self._child_dir_count[node]
+        return ChildListing(self, self._path(node), self._child_ids[start:end])
+
+    def file_count(self, node_path: str) -> int:
+        """Return how many files sit below a directory node."""
+        return self._count(self._file_count, node_path)
+
+    def selected_count(self, node_path: str) -> int:
+        """Return how many selected files sit below a directory node."""
+        return self._count(self._selected_count, node_path)
+
+    def low_value_count(self, node_path: str) -> int:
+        """Return how many low-value files sit below a directory node."""
+        return self._count(self._low_value_count, node_path)
 
-    def children(self, node_path: str) -> list[str]:
-        """Return sorted children of one directory path."""
-        path = normalize_path(node_path)
-        items = list(self.children_by_path.get(path, set()))
-        return sorted(
-            items, key=lambda item: (0 if item in self.directories else 1, item)
-        )
+    def is_low_value(self, node_path: str) -> bool:
+        """Return whether a file node was marked low value."""
+        node = self._lookup(node_path)
+        return node > _ROOT and bool(self._flags[node] & _LOW_VALUE)
 
     def selection_state(self, node_path: str) -> SelectionState:
         """Return tri-state for node."""
-        path = normalize_path(node_path)
-        if path not in self.directories:
+        node = self._lookup(node_path)
+        if node <= _ROOT:
+            return SelectionState.UNCHECKED
+        if not self._flags[node] & _DIR:
             return (
                 SelectionState.CHECKED
-                if path in self.selected_files
+                if self._flags[node] & _SELECTED
                 else SelectionState.UNCHECKED
             )
 
-        descendants = self._descendant_files(path)
-        if not descendants:
-            return SelectionState.UNCHECKED
-        selected_count = len(descendants & self.selected_files)
-        if selected_count == 0:
+        total = self._file_count[node]
+        selected_count = self._selected_count[node]
+        if total == 0 or selected_count == 0:
             return SelectionState.UNCHECKED
-        if selected_count == len(descendants):
+        if selected_count == total:
             return SelectionState.CHECKED
         return SelectionState.PARTIAL
 
     def toggle(self, node_path: str) -> None:
         """Toggle one file or one directory recursively."""
-        path = normalize_path(node_path)
-        if path in self.directories:
-            descendants = self._descendant_files(path)
-            if not descendants:
+        node = self._lookup(node_path)
+        if node <= _ROOT:
+            return
+        if self._flags[node] & _DIR:
+            total = self._file_count[node]
+            if not total:
                 return
-            if self.selection_state(path) == SelectionState.CHECKED:
-                self.selected_files.difference_update(descendants)
-            else:
-                self.selected_files.update(descendants)
+            before = self._selected_count[node]
+            select = before != total
+            self._set_subtree(node, select)
+            self._add_to_ancestors(node, (total if select else 0) - before)
             return
 
-        if path in self.selected_files:
-            self.selected_files.remove(path)
-        else:
-            self.selected_files.add(path)
+        if not self._flags[node] & _FILE:
+            return
+        self._flags[node] ^= _SELECTED
+        self._add_to_ancestors(node, 1 if self._flags[node] & _SELECTED else -1)
 
-    def _descendant_files(self, node_path: str) -> set[str]:
+    def descendant_files(self, node_path: str) -> set[str]:
+        """Return all descendant file paths for a directory node."""
+        node = self._lookup(node_path)
+        if node == _NO_NODE:
+            return set()
         descendants: set[str] = set()
-        stack = list(self.children_by_path.get(node_path, set()))
+        stack = list(self._iter_children(node))
         while stack:
             item = stack.pop()
-            if item in self.directories:
-                stack.extend(self.children_by_path.get(item, set()))
-            elif item in self.files:
-                descendants.add(item)
+            if self._flags[item] & _DIR:
+                stack.extend(self._iter_children(item))
+            elif self._flags[item] & _FILE:
+                descendants.add(self._path(item))
         return descendants
 
-    def descendant_files(self, node_path: str) -> set[str]:
-        """Return all descendant file paths for a directory node."""
-        return self._descendant_files(normalize_path(node_path))
+    def _child(self, parent: int, segment: str) -> int:
+        """Return the child node named ``segment``, creating it when missing."""
+        index = self._child_index.get(parent)
+        if index is None:
+            index = self._child_index[parent] = {}
+        node = index.get(segment)
+        if node is not None:
+            return node
+        node = len(self._flags)
+        name = sys.intern(segment)
+        index[name] = node
+        self._names.append(name)
+        self._parent.append(parent)
+        self._flags.append(0)
+        self._file_count.append(0)
+        self._selected_count.append(0)
+        self._low_value_count.append(0)
+        if parent != _ROOT:
+            self._flags[parent] |= _DIR
+        return node
+
+    def _lookup(self, node_path: str) -> int:
+        node = _ROOT
+        for segment in _path_segments(normalize_path(node_path)):
+            node = self._child_index.get(node, {}).get(segment, _NO_NODE)
+            if node == _NO_NODE:
+                return _NO_NODE
+        return node
+
+    def _path(self, node: int) -> str:
+        names: list[str] = []
+        while node > _ROOT:
+            names.append(self._names[node])
+            node = self._parent[node]
+        return "/".join(reversed(names))
+
+    def _sort_children(self) -> None:
+        """Lay children out contiguously per parent, directories first by name."""
+        total = len(self._flags)
+        offsets = array("i", bytes(4 * (total + 1)))
+        for node in range(1, total):
+            offsets[self._parent[node] + 1] += 1
+        for node in range(total):
+            offsets[node + 1] += offsets[node]
+        ids = array("i", bytes(4 * (total - 1)))
+        cursor = offsets[:-1]
+        for node in range(1, total):
+            parent = self._parent[node]
+            ids[cursor[parent]] = node
+            cursor[parent] += 1
+
+        dir_count = array("i", bytes(4 * total))
+        names, flags = self._names, self._flags
+        for node in range(total):
+            start, end = offsets[node], offsets[node + 1]
+            if start == end:
+                continue
+            ordered = sorted(
+                ids[start:end],
+                key=lambda child: (not flags[child] & _DIR, names[child]),
+            )
+            ids[start:end] = array("i", ordered)
+            dir_count[node] = sum(1 for child in ordered if flags[child] & _DIR)
+        self._child_offsets = offsets
+        self._child_ids = ids
+        self._child_dir_count = dir_count
+        self._visible_children.clear()
+
+    def _child_slice(self, node: int) -> array:
+        start, end = self._child_offsets[node], self._child_offsets[node + 1]
+        return self._child_ids[start:end]
+
+    def _iter_children(self, node: int) -> Iterator[int]:
+        return iter(self._child_slice(node))
+
+    def _visible(self, node: int) -> bool:
+        if self._flags[node] & _DIR:
+            total = self._file_count[node]
+            return not total or self._low_value_count[node] < total
+        return not self._flags[node] & _LOW_VALUE
+
+    def _count(self, column: array, node_path: str) -> int:
+        node = self._lookup(node_path)
+        return column[node] if node > _ROOT else 0
+
+    def _set_subtree(self, node: int, select: bool) -> None:
+        """Select or clear every file below ``node`` and reset its counts."""
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if self._flags[current] & _DIR:
+                self._selected_count[current] = (
+                    self._file_count[current] if select else 0
+                )
+                stack.extend(self._iter_children(current))
+            elif select:
+                self._flags[current] |= _SELECTED
+            else:
+                self._flags[current] &= ~_SELECTED
+
+    def _add_to_ancestors(self, node: int, delta: int) -> None:
+        parent = self._parent[node]
+        while delta and parent > _ROOT:
+            self._selected_count[parent] += delta
+            parent = self._parent[parent]
+
+
+class ChildListing(Sequence[str]):
+    """Read-only sorted children of one directory.
+
+    Paths are only built for the items that are read, so slicing one page out
+    of a directory with 100k entries costs the page, not the directory.
+    """
+
+    def __init__(self, state: TreeSelectionState, parent_path: str, ids: array):
+        self._state = state
+        self._prefix = f"{parent_path}/" if parent_path else ""
+        self._ids = ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        names = self._state._names
+        if isinstance(index, slice):
+            return [f"{self._prefix}{names[node]}" for node in self._ids[index]]
+        return f"{self._prefix}{names[self._ids[index]]}"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (ChildListing, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ChildListing({list(self)!r})"
 
 
 def paginate_items(
-    items: list[str], page_size: int, page_index: int
+    items: Sequence[str], page_size: int, page_index: int
 ) -> tuple[list[str], int]:
-    """Return one page and total page count."""
+    """Return one page and total page count.
+
+    Only the page is sliced out, so ``items`` may be a lazy ``ChildListing``.
+    """
     if page_size <= 0:
         raise ValueError("page_size must be positive")
     if not items:
@@ -132,13 +384,13 @@ def paginate_items(
     clamped_index = max(0, min(page_index, total_pages - 1))
     start = clamped_index * page_size
     end = start + page_size
-    return items[start:end], total_pages
+    return list(items[start:end]), total_pages
 
 
 def normalize_path(path: str) -> str:
     """Normalize path string to slash-separated canonical form."""
     raw = path.replace("\\", "/").strip()
-    if not raw:
+    if not raw or _is_canonical(raw):
         return raw
     value = str(PurePosixPath(raw))
     if value != "/":
@@ -146,20 +398,23 @@ def normalize_path(path: str) -> str:
     return value
 
 
-def _path_prefixes(path: str) -> list[str]:
-    pure = PurePosixPath(path)
-    parts = pure.parts
-    if not parts:
-        return []
+def _is_canonical(path: str) -> bool:
+    """Cheap check that ``PurePosixPath`` would leave ``path`` unchanged."""
+    return (
+        "//" not in path
+        and "/./" not in path
+        and not path.endswith(("/", "/."))
+        and not path.startswith("./")
+        and path != "."
+    )
+
 
-    prefixes: list[str] = []
-    current = ""
-    for part in parts:
-        if part == "/":
-            continue
-        if not current:
-            current = f"/{part}" if path.startswith("/") else part
-        else:
-            current = f"{current}/{part}"
-        prefixes.append(current)
-    return prefixes
+def _path_segments(path: str) -> list[str]:
+    """Split a normalized path into node names; ``/`` stays on the top name."""
+    if not path or path == "/":
+        return []
+    segments = path.split("/")
+    if not segments[0]:
+        segments = segments[1:]
+        segments[0] = f"/{segments[0]}"
+    return segments
@@ -0,0 +1,67 @@
+"""Microbenchmark: ignore-rule matches/sec for pathspec vs the compiled matcher.
+
+Usage: python scripts/bench_ignore_matcher.py [--paths N] [--rounds N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+import pathspec
+
+from ark.rules.ignore_matcher import CompiledIgnoreMatcher
+from ark.rules.local_rules import (
+    BASELINE_IGNORE_FILE,
+    _FallbackPathSpec,
+    _read_ignore_file,
+)
+
+PROJECT_RULES = ["*.log", "!keep.log", "/secrets", "docs/tmp/", "coverage/"]
+SEGMENTS = ["src", "app", "lib", "docs", "tests", "assets", "core", "utils", "api"]
+FILENAMES = ["main.py", "README.md", "index.ts", "photo.jpg", "data.csv", "x.log"]
+
+
+def _sample_paths(count: int) -> list[str]:
+    rng = random.Random(0)
+    paths = []
+    for _ in range(count):
+        parts = [rng.choice(SEGMENTS) for _ in range(rng.randint(1, 6))]
+        if rng.random() < 0.2:
+            paths.append("/".join(parts) + "/")
+        else:
+            paths.append("/".join(parts + [rng.choice(FILENAMES)]))
+    return paths
+
+
+def _rate(matcher, paths: list[str], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for path in paths:
+            matcher.match_file(path)
+        best = min(best, time.perf_counter() - started)
+    return len(paths) / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paths", type=int, default=50_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    lines = _read_ignore_file(BASELINE_IGNORE_FILE) + PROJECT_RULES
+    paths = _sample_paths(args.paths)
+    matchers = {
+        "pathspec": pathspec.PathSpec.from_lines("gitignore", lines),
+        "fallback": _FallbackPathSpec(lines),
+        "compiled": CompiledIgnoreMatcher(lines),
+    }
+    for name, matcher in matchers.items():
+        rate = _rate(matcher, paths, args.rounds)
+        print(f"{name:>9}: {rate:>12,.0f} matches/sec")
+
+
+if __name__ == "__main__":
+    main()
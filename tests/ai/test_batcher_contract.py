@@ -1,7 +1,73 @@
-from ark.ai.batcher import chunk_records
+import threading
+
+import pytest
+
+from ark.ai.batcher import (
+    ANSWER_TOKENS_PER_ITEM,
+    TokenBudgetBatcher,
+    chunk_records,
+    map_batches_ordered,
+)
 
 
 def test_chunk_records_respects_batch_size() -> None:
     records = list(range(250))
     chunks = list(chunk_records(records, batch_size=100))
     assert [len(chunk) for chunk in chunks] == [100, 100, 50]
+
+
+def test_token_budget_batcher_packs_short_names_more_densely_than_deep_paths() -> None:
+    batcher = TokenBudgetBatcher(budget=1_000)
+    names = [f"n{index}.txt" for index in range(100)]
+    deep_dir = "/".join(["very-long-directory-name"] * 12)
+    deep = [f"{deep_dir}/{index}" for index in range(100)]
+
+    name_batches = list(batcher.batches(names))
+    deep_batches = list(batcher.batches(deep))
+
+    assert len(name_batches) < len(deep_batches)
+    for batch in name_batches + deep_batches:
+        assert sum(batcher.cost(text) for text in batch) <= 1_000
+
+
+def test_token_budget_batcher_shrink_applies_to_batches_packed_afterwards() -> None:
+    batcher = TokenBudgetBatcher(budget=40 * (ANSWER_TOKENS_PER_ITEM + 2))
+    batches = batcher.batches([f"f{index}.md" for index in range(100)])
+
+    first = next(batches)
+    batcher.shrink()
+    second = next(batches)
+
+    assert len(first) == 40
+    assert len(second) == 20
+
+
+def test_map_batches_ordered_yields_in_order_when_batches_finish_out_of_order() -> None:
+    release_first = threading.Event()
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def classify(batch: list[int]) -> int:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        if batch[0] == 0:
+            assert release_first.wait(timeout=5)
+        elif batch[0] == 3:
+            release_first.set()
+        with lock:
+            in_flight -= 1
+        return sum(batch)
+
+    batches = [[index] for index in range(6)]
+    results = list(map_batches_ordered(classify, batches, concurrency=4))
+
+    assert results == [(index, index) for index in range(6)]
+    assert 1 < peak <= 4
+
+
+def test_map_batches_ordered_rejects_non_positive_concurrency() -> None:
+    with pytest.raises(ValueError):
+        list(map_batches_ordered(len, [[1]], concurrency=0))
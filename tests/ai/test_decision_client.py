@@ -1,4 +1,6 @@
 import ark.ai.decision_client as decision_client
+from ark.ai.path_families import PathFamily
+from ark.state.decision_cache import DecisionCache
 
 
 def test_llm_suffix_risk_parses_json_payload(monkeypatch) -> None:
@@ -55,3 +57,105 @@ def test_llm_directory_decision_returns_not_sure_on_parse_failure(monkeypatch) -
     )
 
     assert result["decision"] == "not_sure"
+
+
+def test_llm_path_risk_only_sends_cache_misses(monkeypatch, tmp_path) -> None:
+    prompts: list[str] = []
+
+    def fake_classify_batch(**kwargs):
+        prompts.append(kwargs["prompt"])
+        return '{"items":[{"key":"a.txt","decision":"keep","confidence":0.8}]}'
+
+    monkeypatch.setattr(decision_client, "classify_batch", fake_classify_batch)
+    cache = DecisionCache(tmp_path / "cache.sqlite3")
+
+    first = decision_client.llm_path_risk(
+        ["a.txt", "b.txt"], model="openai/gpt-4.1-mini", cache=cache
+    )
+    second = decision_client.llm_path_risk(
+        ["a.txt", "b.txt"], model="openai/gpt-4.1-mini", cache=cache
+    )
+
+    assert first["a.txt"]["risk"] == second["a.txt"]["risk"] == "high_value"
+    assert len(prompts) == 2
+    assert '"b.txt"' in prompts[1] and '"a.txt"' not in prompts[1]
+    cache.close()
+
+
+def test_llm_path_risk_sends_family_counts_and_samples(monkeypatch) -> None:
+    prompts: list[str] = []
+
+    def fake_classify_batch(**kwargs):
+        prompts.append(kwargs["prompt"])
+        return '{"items":[{"key":"frame_{n}.png","decision":"drop"}]}'
+
+    monkeypatch.setattr(decision_client, "classify_batch", fake_classify_batch)
+    family = PathFamily("frame_{n}.png", count=40, samples=["frame_001.png"])
+
+    result = decision_client.llm_path_risk(
+        ["frame_{n}.png", "cover.png"],
+        model="m",
+        families={family.template: family},
+    )
+
+    assert result["frame_{n}.png"]["risk"] == "low_value"
+    assert (
+        '{"key": "frame_{n}.png", "count": 40, "samples": ["frame_001.png"]}'
+        in prompts[0]
+    )
+    assert '"cover.png"' in prompts[0]
+
+
+def test_llm_suffix_risk_reuses_cached_answers_case_insensitively(
+    monkeypatch, tmp_path
+) -> None:
+    calls: list[str] = []
+
+    def fake_classify_batch(**kwargs):
+        calls.append(kwargs["prompt"])
+        return '{"items":[{"key":".pdf","decision":"keep","confidence":0.9}]}'
+
+    monkeypatch.setattr(decision_client, "classify_batch", fake_classify_batch)
+    cache = DecisionCache(tmp_path / "cache.sqlite3")
+
+    decision_client.llm_suffix_risk([".pdf"], model="m", cache=cache)
+    result = decision_client.llm_suffix_risk([".PDF"], model="m", cache=cache)
+    other_model = decision_client.llm_suffix_risk([".pdf"], model="n", cache=cache)
+
+    assert result[".PDF"]["risk"] == "high_value"
+    assert other_model[".pdf"]["risk"] == "high_value"
+    assert len(calls) == 2
+    cache.close()
+
+
+def test_llm_path_risk_keys_cache_by_base_url(monkeypatch, tmp_path) -> None:
+    calls: list[str] = []
+
+    def fake_classify_batch(**kwargs):
+        calls.append(kwargs["base_url"])
+        return '{"items":[{"key":"a.txt","decision":"keep"}]}'
+
+    monkeypatch.setattr(decision_client, "classify_batch", fake_classify_batch)
+    cache = DecisionCache(tmp_path / "cache.sqlite3")
+
+    for base_url in (
+        "http://localhost:11434",
+        "http://localhost:11434/",
+        "http://gpu-box:11434",
+    ):
+        decision_client.llm_path_risk(
+            ["a.txt"], model="m", base_url=base_url, cache=cache
+        )
+
+    assert calls == ["http://localhost:11434", "http://gpu-box:11434"]
+    cache.close()
+
+
+def test_llm_path_risk_does_not_cache_parse_fallbacks(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(decision_client, "classify_batch", lambda **_kwargs: "oops")
+    cache = DecisionCache(tmp_path / "cache.sqlite3")
+
+    decision_client.llm_path_risk(["a.txt"], model="m", cache=cache)
+
+    assert len(cache) == 0
+    cache.close()
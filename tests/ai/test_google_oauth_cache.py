@@ -0,0 +1,98 @@
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from ark.ai.google_oauth import GoogleCredentialCache
+from ark.state.token_store import EncryptedTokenStore
+
+
+class _Clock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _refresher(calls: list[str], lifetime: float = 3600.0, delay: float = 0.0):
+    def refresh(credentials) -> None:
+        time.sleep(delay)
+        calls.append(credentials.refresh_token)
+        expiry = datetime.fromtimestamp(1_000.0 + lifetime * len(calls), timezone.utc)
+        credentials.token = f"access-{len(calls)}"
+        credentials.expiry = expiry.replace(tzinfo=None)
+
+    return refresh
+
+
+def test_credential_cache_refreshes_once_for_concurrent_callers() -> None:
+    calls: list[str] = []
+    cache = GoogleCredentialCache(
+        clock=_Clock(1_000.0), refresh=_refresher(calls, delay=0.05)
+    )
+    results: list[object] = []
+
+    def worker() -> None:
+        results.append(cache.get("id", "secret", "refresh"))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["refresh"]
+    assert len({id(item) for item in results}) == 1
+    assert results[0].token == "access-1"
+
+
+def test_credential_cache_refreshes_in_place_before_expiry() -> None:
+    calls: list[str] = []
+    clock = _Clock(1_000.0)
+    cache = GoogleCredentialCache(
+        refresh_margin=300.0, clock=clock, refresh=_refresher(calls)
+    )
+
+    first = cache.get("id", "secret", "refresh")
+    clock.now = 1_000.0 + 3600.0 - 301.0
+    assert cache.fresh("id", "secret", "refresh") is first
+    assert cache.get("id", "secret", "refresh") is first
+    assert calls == ["refresh"]
+
+    clock.now = 1_000.0 + 3600.0 - 299.0
+    assert cache.fresh("id", "secret", "refresh") is None
+    second = cache.get("id", "secret", "refresh")
+
+    assert second is first
+    assert second.token == "access-2"
+    assert calls == ["refresh", "refresh"]
+
+
+def test_credential_cache_reuses_encrypted_token_across_processes(tmp_path) -> None:
+    pytest.importorskip("cryptography")
+    store_path = tmp_path / "google_tokens.json"
+    calls: list[str] = []
+    writer = GoogleCredentialCache(
+        store=EncryptedTokenStore(store_path),
+        clock=_Clock(1_000.0),
+        refresh=_refresher(calls),
+    )
+    writer.get("id", "secret", "refresh")
+
+    reader = GoogleCredentialCache(
+        store=EncryptedTokenStore(store_path),
+        clock=_Clock(1_500.0),
+        refresh=_refresher(calls),
+    )
+    credentials = reader.get("id", "secret", "refresh")
+
+    assert credentials.token == "access-1"
+    assert calls == ["refresh"]
+    assert "access-1" not in store_path.read_text(encoding="utf-8")
+
+
+def test_credential_cache_requires_all_fields() -> None:
+    with pytest.raises(ValueError):
+        GoogleCredentialCache().get("", "secret", "refresh")
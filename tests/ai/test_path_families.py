@@ -0,0 +1,32 @@
+from ark.ai.path_families import collapse_path_families, path_template
+
+
+def test_path_template_replaces_variable_segments_but_keeps_extensions() -> None:
+    assert path_template("frames/frame_00042.png") == "frames/frame_{n}.png"
+    assert path_template("cache/ab/abcdef0123456789") == "cache/ab/{hex}"
+    assert path_template("lib/v1.2.3/index.js") == "lib/{ver}/index.js"
+    assert (
+        path_template("d0c5a5e2-3b1c-4e7e-9a6b-1234567890ab.json") == "{uuid}.json"
+    )
+    assert path_template("song.mp3") == "song.mp3"
+    assert path_template("README.md") == "README.md"
+
+
+def test_collapse_path_families_keeps_order_counts_and_samples() -> None:
+    inputs = ["a.txt"] + [f"frame_{index:05d}.png" for index in range(5)] + ["b.txt"]
+    inputs += ["IMG_1.jpg", "IMG_2.jpg"]
+
+    collapse = collapse_path_families(inputs, min_members=3, sample_limit=2)
+
+    assert collapse.inputs == [
+        "a.txt",
+        "frame_{n}.png",
+        "b.txt",
+        "IMG_1.jpg",
+        "IMG_2.jpg",
+    ]
+    family = collapse.families["frame_{n}.png"]
+    assert family.count == 5
+    assert family.samples == ["frame_00000.png", "frame_00001.png"]
+    assert collapse.template_of["frame_00003.png"] == "frame_{n}.png"
+    assert "IMG_1.jpg" not in collapse.template_of
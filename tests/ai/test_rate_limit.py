@@ -0,0 +1,198 @@
+import asyncio
+import random
+
+import pytest
+
+import ark.ai.router as router_module
+from ark.ai.rate_limit import (
+    LLMScheduler,
+    ProviderLimits,
+    RetryPolicy,
+    TokenBucket,
+    is_retryable_error,
+    retry_after_seconds,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class RateLimitError(Exception):
+    def __init__(self, headers: dict[str, str] | None = None) -> None:
+        super().__init__("429 too many requests")
+        self.status_code = 429
+        self.litellm_response_headers = headers
+
+
+class _BadRequest(Exception):
+    status_code = 400
+
+
+def _scheduler(clock: _Clock, **limits) -> LLMScheduler:
+    return LLMScheduler(
+        limits={"p": ProviderLimits(**limits)},
+        retry=RetryPolicy(max_attempts=3, base_delay=2.0, max_delay=8.0),
+        clock=clock,
+        sleep=clock.sleep,
+        rng=random.Random(0),
+    )
+
+
+def test_token_bucket_queues_reservations_behind_each_other() -> None:
+    bucket = TokenBucket(per_minute=60, now=0.0)
+
+    assert bucket.reserve(60, now=0.0) == 0.0
+    assert bucket.reserve(1, now=0.0) == pytest.approx(1.0)
+    assert bucket.reserve(1, now=0.0) == pytest.approx(2.0)
+    assert bucket.reserve(500, now=0.0) == pytest.approx(62.0)
+
+
+def test_scheduler_paces_requests_and_tokens_per_minute() -> None:
+    request_clock = _Clock()
+    by_requests = _scheduler(request_clock, requests_per_minute=2, tokens_per_minute=0)
+    token_clock = _Clock()
+    by_tokens = _scheduler(token_clock, requests_per_minute=0, tokens_per_minute=1_000)
+
+    async def call() -> str:
+        return "ok"
+
+    async def run_all() -> None:
+        for _ in range(3):
+            await by_requests.run("p", 100, call)
+        await by_tokens.run("p", 900, call)
+        await by_tokens.run("p", 300, call)
+
+    asyncio.run(run_all())
+
+    assert request_clock.sleeps == [pytest.approx(30.0)]
+    assert token_clock.sleeps == [pytest.approx(12.0)]
+
+
+def test_scheduler_honours_retry_after_for_the_whole_provider() -> None:
+    clock = _Clock()
+    scheduler = _scheduler(clock, requests_per_minute=0, tokens_per_minute=0)
+    attempts: list[float] = []
+
+    async def call() -> str:
+        attempts.append(clock.now)
+        if len(attempts) == 1:
+            raise RateLimitError({"Retry-After": "7"})
+        return "ok"
+
+    async def other() -> str:
+        return "other"
+
+    async def run_all() -> list[str]:
+        first = await scheduler.run("p", 10, call)
+        return [first, await scheduler.run("p", 10, other)]
+
+    assert asyncio.run(run_all()) == ["ok", "other"]
+    assert attempts == [0.0, 7.0]
+    assert clock.sleeps == [7.0]
+
+
+def test_scheduler_gives_up_on_retry_after_beyond_max_delay() -> None:
+    clock = _Clock()
+    scheduler = _scheduler(clock, requests_per_minute=0, tokens_per_minute=0)
+    calls: list[int] = []
+
+    async def call() -> str:
+        calls.append(1)
+        raise RateLimitError({"Retry-After": "86400"})
+
+    async def other() -> str:
+        return "other"
+
+    with pytest.raises(RateLimitError):
+        asyncio.run(scheduler.run("p", 10, call))
+
+    assert calls == [1]
+    assert clock.sleeps == []
+    assert asyncio.run(scheduler.run("p", 10, other)) == "other"
+    assert clock.sleeps == []
+
+
+def test_scheduler_backs_off_with_jitter_then_gives_up() -> None:
+    clock = _Clock()
+    scheduler = _scheduler(clock, requests_per_minute=0, tokens_per_minute=0)
+    calls: list[int] = []
+
+    async def call() -> str:
+        calls.append(1)
+        raise TimeoutError("slow")
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(scheduler.run("p", 10, call))
+
+    assert len(calls) == 3
+    assert 1.0 <= clock.sleeps[0] <= 2.0
+    assert 2.0 <= clock.sleeps[1] <= 4.0
+
+
+def test_scheduler_does_not_retry_client_errors() -> None:
+    clock = _Clock()
+    scheduler = _scheduler(clock)
+    calls: list[int] = []
+
+    async def call() -> str:
+        calls.append(1)
+        raise _BadRequest("bad prompt")
+
+    with pytest.raises(_BadRequest):
+        asyncio.run(scheduler.run("p", 10, call))
+
+    assert calls == [1]
+    assert clock.sleeps == []
+
+
+def test_retry_helpers_read_status_and_headers() -> None:
+    assert is_retryable_error(RateLimitError())
+    assert is_retryable_error(ConnectionError("reset"))
+    assert not is_retryable_error(_BadRequest())
+    assert not is_retryable_error(ValueError("parse"))
+    assert retry_after_seconds(RateLimitError({"retry-after-ms": "1500"})) == 1.5
+    assert retry_after_seconds(RateLimitError({"Retry-After": "soon"})) is None
+    assert retry_after_seconds(RateLimitError()) is None
+
+
+def test_classify_batch_retries_rate_limited_calls(monkeypatch) -> None:
+    class _Message:
+        content = "pong"
+
+    class _Choice:
+        message = _Message()
+
+    class _Response:
+        choices = [_Choice()]
+
+    clock = _Clock()
+    attempts: list[int] = []
+
+    async def fake_acompletion(**_kwargs):
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise RateLimitError({"retry-after": "0"})
+        return _Response()
+
+    monkeypatch.setattr(router_module, "acompletion", fake_acompletion)
+    monkeypatch.setattr(router_module, "LLM_SCHEDULER", _scheduler(clock))
+
+    result = router_module.classify_batch(
+        model="openai/gpt-4.1",
+        prompt="hello",
+        provider="p",
+        api_key="sk-test",
+    )
+
+    assert result == "pong"
+    assert len(attempts) == 3
@@ -1,52 +1,66 @@
+from datetime import datetime, timedelta, timezone
+
 import ark.ai.router as router_module
+from ark.ai.google_oauth import GoogleCredentialCache
 
 
 def test_classify_batch_uses_google_sdk_for_gemini_oauth(monkeypatch) -> None:
-    class FakeCredentials:
-        token = "access-1"
-
-    def fake_build_google_credentials(
-        client_id: str,
-        client_secret: str,
-        refresh_token: str,
-    ) -> object:
-        assert client_id == "id-1"
-        assert client_secret == "secret-1"
-        assert refresh_token == "refresh-1"
-        return FakeCredentials()
-
-    def fake_classify_batch_with_google_sdk(
+    refreshed: list[object] = []
+
+    def fake_refresh(credentials) -> None:
+        assert credentials.client_id == "id-1"
+        assert credentials.client_secret == "secret-1"
+        assert credentials.refresh_token == "refresh-1"
+        refreshed.append(credentials)
+        expiry = datetime.now(timezone.utc) + timedelta(hours=1)
+        credentials.token = "access-1"
+        credentials.expiry = expiry.replace(tzinfo=None)
+
+    built: list[object] = []
+
+    def fake_google_sdk_client(credentials: object) -> object:
+        built.append(credentials)
+        return object()
+
+    async def fake_aclassify_batch_with_google_sdk(
         model: str,
         prompt: str,
-        credentials: object,
+        client: object,
     ) -> str:
         assert model == "gemini/gemini-3-flash"
         assert prompt == "hello"
-        assert getattr(credentials, "token", "") == "access-1"
+        assert client is not None
         return "ok"
 
+    monkeypatch.setattr(router_module, "ROUTER_LOOP", router_module.RouterLoop())
     monkeypatch.setattr(
         router_module,
-        "build_google_credentials",
-        fake_build_google_credentials,
+        "GOOGLE_CREDENTIALS",
+        GoogleCredentialCache(refresh=fake_refresh),
     )
+    monkeypatch.setattr(router_module, "_google_sdk_client", fake_google_sdk_client)
     monkeypatch.setattr(
         router_module,
-        "_classify_batch_with_google_sdk",
-        fake_classify_batch_with_google_sdk,
+        "_aclassify_batch_with_google_sdk",
+        fake_aclassify_batch_with_google_sdk,
     )
 
-    result = router_module.classify_batch(
-        model="gemini/gemini-3-flash",
-        prompt="hello",
-        provider="gemini",
-        auth_method="google_oauth",
-        google_client_id="id-1",
-        google_client_secret="secret-1",
-        google_refresh_token="refresh-1",
-    )
+    for _ in range(2):
+        result = router_module.classify_batch(
+            model="gemini/gemini-3-flash",
+            prompt="hello",
+            provider="gemini",
+            auth_method="google_oauth",
+            google_client_id="id-1",
+            google_client_secret="secret-1",
+            google_refresh_token="refresh-1",
+        )
+        assert result == "ok"
 
-    assert result == "ok"
+    assert len(built) == 1
+    assert len(refreshed) == 1
+    assert getattr(built[0], "token", "") == "access-1"
+    router_module.ROUTER_LOOP.close()
 
 
 def test_check_llm_connectivity_reports_failure(monkeypatch) -> None:
@@ -80,11 +94,11 @@ def test_classify_batch_passes_glm_prefixed_model_verbatim(monkeypatch) -> None:
         def __init__(self, content: str) -> None:
             self.choices = [_Choice(content)]
 
-    def fake_completion(**kwargs):
+    async def fake_acompletion(**kwargs):
         captured.update(kwargs)
         return _Response("pong")
 
-    monkeypatch.setattr(router_module, "completion", fake_completion)
+    monkeypatch.setattr(router_module, "acompletion", fake_acompletion)
 
     result = router_module.classify_batch(
         model="zai/glm-4.5",
@@ -112,11 +126,11 @@ def test_classify_batch_passes_deepseek_prefixed_model_verbatim(monkeypatch) ->
         def __init__(self, content: str) -> None:
             self.choices = [_Choice(content)]
 
-    def fake_completion(**kwargs):
+    async def fake_acompletion(**kwargs):
         captured.update(kwargs)
         return _Response("pong")
 
-    monkeypatch.setattr(router_module, "completion", fake_completion)
+    monkeypatch.setattr(router_module, "acompletion", fake_acompletion)
 
     result = router_module.classify_batch(
         model="deepseek/deepseek-chat",
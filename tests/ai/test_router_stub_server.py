@@ -0,0 +1,99 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import ark.ai.router as router_module
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Minimal OpenAI-compatible chat completions endpoint."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length))
+        self.server.requests.append((self.client_address[1], body))
+        prompt = body["messages"][-1]["content"]
+        payload = json.dumps(
+            {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion",
+                "created": 0,
+                "model": body["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": f"echo:{prompt}"},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 1,
+                    "completion_tokens": 1,
+                    "total_tokens": 2,
+                },
+            }
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *_args) -> None:
+        pass
+
+
+@pytest.fixture
+def stub_server(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(router_module, "ROUTER_LOOP", router_module.RouterLoop())
+    yield server
+    router_module.ROUTER_LOOP.close()
+    server.shutdown()
+    server.server_close()
+
+
+def _route(server) -> dict[str, str]:
+    return {
+        "model": "openai/stub-model",
+        "provider": "custom",
+        "base_url": f"http://127.0.0.1:{server.server_port}/v1",
+        "api_key": "sk-test",
+    }
+
+
+def test_classify_batch_reuses_one_connection_across_calls(stub_server) -> None:
+    replies = [
+        router_module.classify_batch(prompt=f"batch-{index}", **_route(stub_server))
+        for index in range(3)
+    ]
+
+    assert replies == ["echo:batch-0", "echo:batch-1", "echo:batch-2"]
+    assert len({port for port, _body in stub_server.requests}) == 1
+
+
+def test_aclassify_batch_runs_from_foreign_event_loops(stub_server) -> None:
+    async def classify_all(offset: int) -> list[str]:
+        return await asyncio.gather(
+            *(
+                router_module.aclassify_batch(
+                    prompt=f"batch-{offset + index}", **_route(stub_server)
+                )
+                for index in range(3)
+            )
+        )
+
+    first = asyncio.run(classify_all(0))
+    second = asyncio.run(classify_all(3))
+
+    assert first == ["echo:batch-0", "echo:batch-1", "echo:batch-2"]
+    assert second == ["echo:batch-3", "echo:batch-4", "echo:batch-5"]
+    assert len({port for port, _body in stub_server.requests}) <= 3
@@ -0,0 +1,50 @@
+from pathlib import Path
+
+from ark.collector.spool import RecordSpool
+from ark.collector.walker import FileRecord
+
+
+def _record(path: str, size: int = 1) -> FileRecord:
+    return FileRecord(
+        path=Path(path), size=size, mtime_ns=1, inode=2, device=3, mode=0o100644
+    )
+
+
+def test_record_spool_streams_records_per_root_in_finish_order(tmp_path) -> None:
+    spool = RecordSpool(tmp_path / "spool")
+    spool.append(Path("/b"), [_record("/b/1.txt")])
+    spool.append(Path("/a"), [_record("/a/1.txt"), _record("/a/2.txt", 7)])
+    spool.append(Path("/b"), [_record("/b/2.txt")])
+    spool.finish([Path("/a"), Path("/b"), Path("/empty")])
+
+    assert list(spool) == [Path("/a"), Path("/b"), Path("/empty")]
+    assert [item.path for item in spool[Path("/b")]] == [
+        Path("/b/1.txt"),
+        Path("/b/2.txt"),
+    ]
+    assert [item.size for item in spool[Path("/a")]] == [1, 7]
+    assert list(spool[Path("/empty")]) == []
+    assert spool.record_count == 4
+
+
+def test_record_spool_reopens_finished_spool(tmp_path) -> None:
+    spool = RecordSpool(tmp_path / "spool")
+    spool.append(Path("/a"), [_record("/a/1.txt")])
+    spool.finish([Path("/a")])
+
+    reopened = RecordSpool.open(tmp_path / "spool")
+
+    assert dict((root, list(items)) for root, items in reopened.items()) == {
+        Path("/a"): [_record("/a/1.txt")]
+    }
+    assert reopened.record_count == 1
+
+
+def test_temporary_record_spool_is_removed_on_close() -> None:
+    spool = RecordSpool()
+    spool.append(Path("/a"), [_record("/a/1.txt")])
+    spool.finish()
+
+    spool.close()
+
+    assert not spool.directory.exists()
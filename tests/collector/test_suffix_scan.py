@@ -10,3 +10,28 @@ def test_collect_suffix_summary_deduplicates_extensions(tmp_path) -> None:
 
     assert ".txt" in summary.extensions
     assert "c" in summary.no_extension_names
+
+
+def test_collect_suffix_summary_builds_histogram_across_roots(tmp_path) -> None:
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    (second / "nested").mkdir(parents=True)
+    (first / "small.JPG").write_bytes(b"x" * 10)
+    (first / "notes.txt").write_bytes(b"x" * 5)
+    (second / "nested" / "big.jpg").write_bytes(b"x" * 300)
+    for index in range(3):
+        (second / f"mid{index}.jpg").write_bytes(b"x" * (100 + index))
+
+    summary = collect_suffix_summary([first, second], workers=2)
+    jpg = summary.histogram.get(".jpg")
+
+    assert summary.extensions == {".jpg", ".txt"}
+    assert jpg is not None
+    assert jpg.count == 5
+    assert jpg.total_bytes == 10 + 300 + 100 + 101 + 102
+    assert jpg.largest == [
+        (300, str(second / "nested" / "big.jpg")),
+        (102, str(second / "mid2.jpg")),
+        (101, str(second / "mid1.jpg")),
+    ]
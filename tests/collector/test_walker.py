@@ -0,0 +1,209 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from ark.collector.walker import FileRecord, walk_roots
+from ark.state.scan_index import ScanIndex
+
+
+def _write(path: Path, text: str = "x") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def test_walk_roots_returns_sorted_files_per_root_in_root_order(tmp_path) -> None:
+    first = tmp_path / "b-root"
+    second = tmp_path / "a-root"
+    _write(first / "z.txt")
+    _write(first / "docs" / "a.txt")
+    _write(second / "nested" / "deep" / "c.md")
+
+    result = walk_roots([first, second], workers=4)
+
+    assert list(result) == [first, second]
+    assert [item.path for item in result[first]] == [
+        first / "docs" / "a.txt",
+        first / "z.txt",
+    ]
+    assert [item.path for item in result[second]] == [
+        second / "nested" / "deep" / "c.md"
+    ]
+
+
+def test_walk_roots_prunes_ignored_directories_and_files(tmp_path) -> None:
+    root = tmp_path / "src"
+    _write(root / "node_modules" / "pkg" / "index.js")
+    _write(root / "app" / "__pycache__" / "mod.pyc")
+    _write(root / "app" / "main.py")
+    _write(root / "app" / "skip.pyc")
+    _write(root / "notes.tmp")
+    (root / ".arkignore").write_text("*.tmp\n", encoding="utf-8")
+
+    result = walk_roots([root], workers=2)
+
+    assert [item.path for item in result[root]] == [
+        root / ".arkignore",
+        root / "app" / "main.py",
+    ]
+
+
+def test_walk_roots_skips_missing_roots_and_reports_every_listing(tmp_path) -> None:
+    root = tmp_path / "src"
+    _write(root / "a" / "1.txt")
+    _write(root / "b" / "2.txt")
+    listed: list[Path] = []
+
+    result = walk_roots(
+        [tmp_path / "missing", root],
+        workers=3,
+        on_listing=lambda listing: listed.append(listing.directory),
+    )
+
+    assert list(result) == [root]
+    assert sorted(listed) == [root, root / "a", root / "b"]
+
+
+def test_walk_roots_rejects_non_positive_workers(tmp_path) -> None:
+    with pytest.raises(ValueError):
+        walk_roots([tmp_path], workers=0)
+
+
+def test_walk_roots_captures_stat_metadata_in_records(tmp_path) -> None:
+    root = tmp_path / "src"
+    _write(root / "a.txt", "hello")
+
+    result = walk_roots([root], workers=1)
+
+    record = result[root][0]
+    stat = (root / "a.txt").stat()
+    assert record.size == 5
+    assert record.mtime_ns == stat.st_mtime_ns
+    assert (record.inode, record.device, record.mode) == (
+        stat.st_ino,
+        stat.st_dev,
+        stat.st_mode,
+    )
+    assert FileRecord.from_row(record.to_row()) == record
+
+
+@pytest.mark.parametrize("use_index", [False, True])
+def test_walk_roots_stacks_nested_ignore_files(tmp_path, use_index) -> None:
+    root = tmp_path / "Projects"
+    project = root / "web"
+    _write(root / ".gitignore", "*.log\n")
+    _write(project / ".gitignore", "/generated/\ncoverage/\n!keep.log\n")
+    _write(project / "generated" / "bundle.js")
+    _write(project / "src" / "generated" / "types.ts")
+    _write(project / "src" / "coverage" / "report.html")
+    _write(project / "keep.log")
+    _write(project / "debug.log")
+    _write(root / "other" / "generated" / "data.txt")
+    index = ScanIndex(tmp_path / "index.sqlite3") if use_index else None
+
+    try:
+        result = walk_roots([root], workers=2, index=index)
+    finally:
+        if index is not None:
+            index.close()
+
+    assert [item.path for item in result[root]] == [
+        root / ".gitignore",
+        root / "other" / "generated" / "data.txt",
+        project / ".gitignore",
+        project / "keep.log",
+        project / "src" / "generated" / "types.ts",
+    ]
+
+
+def test_walk_roots_rereads_edited_nested_ignore_file(tmp_path) -> None:
+    root = tmp_path / "src"
+    nested = root / "pkg"
+    _write(nested / ".arkignore", "a.txt\n")
+    _write(nested / "a.txt")
+    _write(nested / "b.txt")
+
+    first = walk_roots([root], workers=1)
+    _write(nested / ".arkignore", "b.txt\n# edited\n")
+    second = walk_roots([root], workers=1)
+
+    assert nested / "b.txt" in [item.path for item in first[root]]
+    assert [item.path for item in second[root]] == [
+        nested / ".arkignore",
+        nested / "a.txt",
+    ]
+
+
+def test_walk_roots_one_filesystem_skips_directories_on_other_devices(
+    tmp_path, monkeypatch
+) -> None:
+    root = tmp_path / "src"
+    _write(root / "local" / "a.txt")
+    _write(root / "mnt" / "share" / "remote.txt")
+    real_stat = os.stat
+    mount = str(root / "mnt" / "share")
+
+    def fake_stat(path, *args, **kwargs):
+        result = real_stat(path, *args, **kwargs)
+        if str(path) == mount:
+            fields = list(result)
+            fields[2] = result.st_dev + 1
+            return os.stat_result(fields)
+        return result
+
+    monkeypatch.setattr(os, "stat", fake_stat)
+
+    crossed = walk_roots([root], workers=2)
+    same_device = walk_roots([root], workers=2, one_filesystem=True)
+
+    assert root / "mnt" / "share" / "remote.txt" in [r.path for r in crossed[root]]
+    assert [item.path for item in same_device[root]] == [root / "local" / "a.txt"]
+
+
+def test_walk_roots_does_not_relist_completed_directories(
+    tmp_path, monkeypatch
+) -> None:
+    root = tmp_path / "src"
+    _write(root / "top.txt")
+    _write(root / "done" / "old.txt")
+    _write(root / "done" / "todo" / "new.txt")
+    _write(root / "done" / ".gitignore", "*.log\n")
+    _write(root / "done" / "todo" / "skip.log")
+    listed: list[str] = []
+    real_scandir = os.scandir
+
+    def tracking_scandir(path):
+        listed.append(str(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", tracking_scandir)
+
+    result = walk_roots(
+        [root],
+        workers=2,
+        completed_dirs={str(root): ["done"], str(root / "done"): ["todo"]},
+    )
+
+    assert listed == [str(root / "done" / "todo")]
+    assert [item.path for item in result[root]] == [root / "done" / "todo" / "new.txt"]
+
+
+def test_walk_roots_without_index_does_not_stat_directories(
+    tmp_path, monkeypatch
+) -> None:
+    root = tmp_path / "src"
+    _write(root / "a" / "b" / "c.txt")
+    stat_calls: list[str] = []
+    real_stat = os.stat
+
+    def tracking_stat(path, *args, **kwargs):
+        stat_calls.append(str(path))
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "stat", tracking_stat)
+
+    result = walk_roots([root], workers=2)
+
+    assert [item.path for item in result[root]] == [root / "a" / "b" / "c.txt"]
+    assert str(root / "a") not in stat_calls
+    assert str(root / "a" / "b") not in stat_calls
@@ -47,3 +47,40 @@ def test_validate_for_execution_allows_complete_google_oauth_config() -> None:
     errors = config.validate_for_execution()
 
     assert errors == []
+
+
+def test_validate_for_execution_rejects_non_positive_scan_workers() -> None:
+    config = PipelineConfig(
+        target="X:/ArkBackup",
+        source_roots=["."],
+        scan_workers=0,
+    )
+
+    errors = config.validate_for_execution()
+
+    assert any("scan workers" in item for item in errors)
+
+
+def test_validate_for_execution_rejects_non_positive_ai_concurrency() -> None:
+    config = PipelineConfig(
+        target="X:/ArkBackup",
+        source_roots=["."],
+        ai_concurrency=0,
+    )
+
+    errors = config.validate_for_execution()
+
+    assert any("ai concurrency" in item for item in errors)
+
+
+def test_validate_for_execution_rejects_negative_llm_rate_limits() -> None:
+    config = PipelineConfig(
+        target="X:/ArkBackup",
+        source_roots=["."],
+        llm_requests_per_minute=-1,
+        llm_tokens_per_minute=0,
+    )
+
+    errors = config.validate_for_execution()
+
+    assert errors == ["llm requests per minute must be 0 or more"]
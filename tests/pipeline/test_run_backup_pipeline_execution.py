@@ -1,6 +1,11 @@
+import os
+from pathlib import Path
+
 import ark.pipeline.run_backup as run_backup_module
+from ark.collector.walker import FileRecord
 from ark.pipeline.run_backup import run_backup_pipeline
 from ark.state.backup_run_store import BackupRunStore
+from ark.state.scan_log import ScanSegmentLog
 
 
 def test_run_backup_pipeline_executes_mirror_copy_for_selected_paths(tmp_path) -> None:
@@ -47,6 +52,7 @@ def test_run_backup_pipeline_emits_progress_messages(tmp_path) -> None:
 
     joined = "\n".join(progress)
     assert "scan" in joined.lower()
+    assert any(line.startswith("[scan] complete") and "/s" in line for line in progress)
     assert "ai" in joined.lower()
     assert "copy" in joined.lower() or "dry run" in joined.lower()
 
@@ -153,3 +159,324 @@ def test_run_backup_pipeline_prunes_local_noise_directories_before_stage1(
     discovered_exts = {row.ext for row in observed_rows}
     assert ".txt" in discovered_exts
     assert ".py" not in discovered_exts
+
+
+def test_run_backup_pipeline_reuses_scan_stat_for_stage2_sizes(
+    tmp_path, monkeypatch
+) -> None:
+    src_root = tmp_path / "src"
+    src_root.mkdir()
+    (src_root / "a.txt").write_text("hello", encoding="utf-8")
+    observed_rows = []
+
+    def fake_stage1_review(rows):
+        def fail_stat(self, *args, **kwargs):
+            raise AssertionError(f"unexpected stat: {self}")
+
+        monkeypatch.setattr(Path, "stat", fail_stat)
+        return {row.ext for row in rows}
+
+    def fake_stage3_review(rows):
+        observed_rows.extend(rows)
+        return set()
+
+    run_backup_pipeline(
+        target=str(tmp_path / "backup"),
+        dry_run=True,
+        source_roots=[src_root],
+        stage1_review_fn=fake_stage1_review,
+        stage3_review_fn=fake_stage3_review,
+    )
+
+    assert [row.size_bytes for row in observed_rows] == [5]
+
+
+def test_run_backup_pipeline_streaming_scan_matches_in_memory_scan(tmp_path) -> None:
+    src_root = tmp_path / "src"
+    (src_root / "docs" / "deep").mkdir(parents=True)
+    (src_root / "docs" / "a.txt").write_text("a", encoding="utf-8")
+    (src_root / "docs" / "deep" / "b.md").write_text("bb", encoding="utf-8")
+    (src_root / "c.jpg").write_text("ccc", encoding="utf-8")
+    observed: dict[bool, tuple[list, list]] = {}
+
+    for stream_scan in (False, True):
+        stage1_rows = []
+        stage3_rows = []
+
+        def fake_stage1_review(rows):
+            stage1_rows.extend(rows)
+            return {".txt", ".md"}
+
+        def fake_stage3_review(rows):
+            stage3_rows.extend(rows)
+            return {row.path for row in rows}
+
+        run_backup_pipeline(
+            target=str(tmp_path / f"backup-{stream_scan}"),
+            dry_run=False,
+            source_roots=[src_root],
+            stage1_review_fn=fake_stage1_review,
+            stage3_review_fn=fake_stage3_review,
+            stream_scan=stream_scan,
+        )
+        observed[stream_scan] = (stage1_rows, stage3_rows)
+
+    assert observed[True] == observed[False]
+    assert [row.size_bytes for row in observed[True][1]] == [1, 2]
+    copied = tmp_path / "backup-True" / "src" / "docs" / "deep" / "b.md"
+    assert copied.read_text(encoding="utf-8") == "bb"
+
+
+def test_run_backup_pipeline_streaming_scan_removes_run_spool_on_completion(
+    tmp_path,
+) -> None:
+    src_root = tmp_path / "src"
+    src_root.mkdir()
+    (src_root / "a.txt").write_text("a", encoding="utf-8")
+    store = BackupRunStore(tmp_path / "runs")
+    run_id = store.create_run(
+        target=str(tmp_path / "backup"),
+        source_roots=[str(src_root)],
+        dry_run=True,
+    )
+
+    run_backup_pipeline(
+        target=str(tmp_path / "backup"),
+        dry_run=True,
+        source_roots=[src_root],
+        stage1_review_fn=lambda rows: {row.ext for row in rows},
+        stage3_review_fn=lambda rows: set(),
+        run_store=store,
+        run_id=run_id,
+        stream_scan=True,
+    )
+
+    scan_checkpoint = store.load_run(run_id)["checkpoints"]["scan"]
+    assert scan_checkpoint["scan_complete"] is True
+    assert list(scan_checkpoint["suffix_histogram"]) == [".txt"]
+    assert not store.scan_spool_dir(run_id).exists()
+
+
+def test_run_backup_pipeline_skips_adapter_excluded_mounts(tmp_path) -> None:
+    src_root = tmp_path / "src"
+    (src_root / "proc").mkdir(parents=True)
+    (src_root / "proc" / "cpuinfo.txt").write_text("x", encoding="utf-8")
+    (src_root / "notes.txt").write_text("hello", encoding="utf-8")
+    seen: list[str] = []
+    progress: list[str] = []
+
+    class FakeAdapter:
+        def list_roots(self) -> list[Path]:
+            return [src_root]
+
+        def excluded_dirs(self) -> set[Path]:
+            return {src_root / "proc", tmp_path / "elsewhere"}
+
+        def iter_files(self, root: Path):
+            return iter(())
+
+    def stage3_review(rows):
+        seen.extend(row.path for row in rows)
+        return set()
+
+    run_backup_pipeline(
+        target=str(tmp_path / "backup"),
+        dry_run=True,
+        source_roots=[src_root],
+        stage1_review_fn=lambda rows: {row.ext for row in rows},
+        stage3_review_fn=stage3_review,
+        progress_callback=progress.append,
+        platform_adapter=FakeAdapter(),
+    )
+
+    assert seen == [str(src_root / "notes.txt")]
+    assert "[scan] skipping pseudo filesystem mounts=1" in progress
+    assert f"[scan] skip mount={src_root / 'proc'}" in progress
+
+
+def test_run_backup_pipeline_reviews_hardlinks_once_and_relinks_them(
+    tmp_path,
+) -> None:
+    src_root = tmp_path / "src"
+    (src_root / "docs").mkdir(parents=True)
+    original = src_root / "docs" / "a.txt"
+    original.write_text("hello", encoding="utf-8")
+    os.link(original, src_root / "docs" / "b.txt")
+    reviewed: list[str] = []
+    target = tmp_path / "backup"
+
+    def stage3_review(rows):
+        reviewed.extend(row.path for row in rows)
+        return {row.path for row in rows}
+
+    run_backup_pipeline(
+        target=str(target),
+        dry_run=False,
+        source_roots=[src_root],
+        stage1_review_fn=lambda rows: {row.ext for row in rows},
+        stage3_review_fn=stage3_review,
+    )
+
+    copied_a = target / "src" / "docs" / "a.txt"
+    copied_b = target / "src" / "docs" / "b.txt"
+    assert reviewed == [str(original)]
+    assert copied_b.read_text(encoding="utf-8") == "hello"
+    assert copied_a.stat().st_ino == copied_b.stat().st_ino
+
+
+def test_run_backup_pipeline_stage1_rows_carry_scan_volume(tmp_path) -> None:
+    src_root = tmp_path / "src"
+    (src_root / "docs").mkdir(parents=True)
+    (src_root / "docs" / "a.txt").write_bytes(b"x" * 40)
+    (src_root / "docs" / "b.txt").write_bytes(b"x" * 2)
+    (src_root / "photo.jpg").write_bytes(b"x" * 7)
+    seen_rows = []
+
+    def stage1_review(rows):
+        seen_rows.extend(rows)
+        return set()
+
+    run_backup_pipeline(
+        target=str(tmp_path / "backup"),
+        dry_run=True,
+        source_roots=[src_root],
+        stage1_review_fn=stage1_review,
+        stage3_review_fn=lambda rows: set(),
+    )
+
+    volume = {row.ext: (row.file_count, row.total_bytes) for row in seen_rows}
+    txt_row = next(row for row in seen_rows if row.ext == ".txt")
+    assert volume == {".jpg": (1, 7), ".txt": (2, 42)}
+    assert txt_row.examples[0] == str(src_root / "docs" / "a.txt")
+
+
+def test_run_backup_pipeline_resumes_scan_from_segment_log(tmp_path) -> None:
+    src_root = tmp_path / "src"
+    (src_root / "docs").mkdir(parents=True)
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (src_root / "docs" / name).write_text(name, encoding="utf-8")
+    store = BackupRunStore(tmp_path / "runs")
+    run_id = store.create_run(
+        target=str(tmp_path / "backup"),
+        source_roots=[str(src_root)],
+        dry_run=True,
+    )
+
+    def pause_at_stage1(rows):
+        raise KeyboardInterrupt
+
+    try:
+        run_backup_pipeline(
+            target=str(tmp_path / "backup"),
+            dry_run=True,
+            source_roots=[src_root],
+            stage1_review_fn=pause_at_stage1,
+            run_store=store,
+            run_id=run_id,
+        )
+    except KeyboardInterrupt:
+        pass
+
+    scan_checkpoint = store.load_run(run_id)["checkpoints"]["scan"]
+    assert scan_checkpoint == {"segment_log": True, "scan_complete": True}
+    assert store.scan_log_path(run_id).exists()
+
+    (src_root / "docs" / "late.txt").write_text("late", encoding="utf-8")
+    progress: list[str] = []
+    reviewed: list[str] = []
+    run_backup_pipeline(
+        target=str(tmp_path / "backup"),
+        dry_run=True,
+        source_roots=[src_root],
+        stage1_review_fn=lambda rows: {row.ext for row in rows},
+        stage3_review_fn=lambda rows: reviewed.extend(r.path for r in rows) or set(),
+        progress_callback=progress.append,
+        run_store=store,
+        run_id=run_id,
+        resume=True,
+    )
+
+    assert "[scan] restored completed scan checkpoint" in progress
+    assert reviewed == [
+        str(src_root / "docs" / name) for name in ("a.txt", "b.txt", "c.txt")
+    ]
+    assert not store.scan_log_path(run_id).exists()
+
+
+def test_run_backup_pipeline_resumes_partial_scan_from_directory_frontier(
+    tmp_path,
+) -> None:
+    src_root = tmp_path / "src"
+    (src_root / "done").mkdir(parents=True)
+    (src_root / "todo").mkdir()
+    (src_root / "done" / "a.txt").write_text("a", encoding="utf-8")
+    (src_root / "todo" / "b.txt").write_text("b", encoding="utf-8")
+    store = BackupRunStore(tmp_path / "runs")
+    run_id = store.create_run(
+        target=str(tmp_path / "backup"),
+        source_roots=[str(src_root)],
+        dry_run=True,
+    )
+    store.save_checkpoint(run_id, "scan", {"segment_log": True, "scan_complete": False})
+    logged = FileRecord.from_stat(
+        src_root / "done" / "a.txt", (src_root / "done" / "a.txt").stat()
+    )
+    log = ScanSegmentLog(store.scan_log_path(run_id))
+    log.append(
+        {str(src_root): [logged.to_row()]},
+        {str(src_root): ["done", "todo"], str(src_root / "done"): []},
+    )
+    log.close()
+    (src_root / "done" / "unseen.txt").write_text("u", encoding="utf-8")
+    progress: list[str] = []
+    reviewed: list[str] = []
+
+    run_backup_pipeline(
+        target=str(tmp_path / "backup"),
+        dry_run=True,
+        source_roots=[src_root],
+        stage1_review_fn=lambda rows: {row.ext for row in rows},
+        stage3_review_fn=lambda rows: reviewed.extend(r.path for r in rows) or set(),
+        progress_callback=progress.append,
+        run_store=store,
+        run_id=run_id,
+        resume=True,
+    )
+
+    assert "[scan] resuming from checkpoint completed_dirs=2" in progress
+    assert reviewed == [
+        str(src_root / "done" / "a.txt"),
+        str(src_root / "todo" / "b.txt"),
+    ]
+
+
+def test_run_backup_pipeline_drops_review_journal_after_review(
+    tmp_path, monkeypatch
+) -> None:
+    src_root = tmp_path / "src"
+    src_root.mkdir()
+    (src_root / "a.txt").write_text("hello", encoding="utf-8")
+    store = BackupRunStore(tmp_path / "runs")
+    journals: list[object] = []
+
+    def fake_stage3_review(rows, **kwargs):
+        journal = kwargs["review_journal"]
+        journal.toggle(rows[0].path)
+        journals.append(journal)
+        return {row.path for row in rows}
+
+    monkeypatch.setattr(run_backup_module, "run_stage3_review", fake_stage3_review)
+
+    run_backup_pipeline(
+        target=str(tmp_path / "backup"),
+        dry_run=True,
+        source_roots=[src_root],
+        stage1_review_fn=lambda rows: {row.ext for row in rows},
+        run_store=store,
+    )
+
+    assert len(journals) == 1
+    assert not journals[0].path.exists()
+    run_id = journals[0].path.name.split(".")[0]
+    review = store.load_run(run_id)["checkpoints"]["review"]
+    assert review["selected_paths"] == [str(src_root / "a.txt")]
@@ -1,7 +1,9 @@
+import threading
 from pathlib import Path
 
 from ark.pipeline import run_backup as run_backup_module
 from ark.pipeline.run_backup import run_backup_pipeline
+from ark.state.backup_run_store import BackupRunStore
 
 
 def test_run_backup_pipeline_uses_stage_reviews() -> None:
@@ -265,3 +267,185 @@ def test_run_backup_pipeline_passes_full_paths_to_path_risk_function(tmp_path) -
     low_path = str(tmp_path / "b.tmp")
     assert row_by_path[low_path].ai_risk == "low_value"
     assert "Likely temp" in row_by_path[low_path].reason
+
+
+def _letters(index: int) -> str:
+    """Return a digit-free name so inputs are not collapsed into families."""
+    return "".join(chr(ord("a") + (index // 26**power) % 26) for power in (2, 1, 0))
+
+
+def test_run_backup_pipeline_merges_concurrent_path_batches_in_order(tmp_path) -> None:
+    src_root = tmp_path / "src"
+    src_root.mkdir()
+    for index in range(120):
+        (src_root / f"{_letters(index)}.txt").write_text("x", encoding="utf-8")
+    release_first = threading.Event()
+    checkpoints: list[int] = []
+
+    def fake_path_risk(paths: list[str]) -> dict[str, dict[str, object]]:
+        if paths[0] == "aaa.txt":
+            assert release_first.wait(timeout=5)
+        else:
+            release_first.set()
+        return {path: {"risk": "low_value", "score": 0.1} for path in paths}
+
+    store = BackupRunStore(tmp_path / "runs")
+    run_id = store.create_run(
+        target=str(tmp_path / "backup"), source_roots=[str(src_root)], dry_run=True
+    )
+    original_save = store.save_checkpoint
+
+    def tracking_save(run_id: str, stage: str, payload: dict) -> None:
+        if stage == "stage2":
+            checkpoints.append(payload["next_index"])
+            assert len(payload["risk_lookup"]) == payload["next_index"]
+        original_save(run_id, stage, payload)
+
+    store.save_checkpoint = tracking_save
+    observed_rows = []
+
+    run_backup_pipeline(
+        target=str(tmp_path / "backup"),
+        dry_run=True,
+        source_roots=[src_root],
+        stage1_review_fn=lambda rows: {".txt"},
+        stage3_review_fn=lambda rows: observed_rows.extend(rows) or set(),
+        path_risk_fn=fake_path_risk,
+        run_store=store,
+        run_id=run_id,
+        ai_concurrency=3,
+        ai_token_budget=50 * 32,
+    )
+
+    assert checkpoints == [50, 100, 120]
+    assert len(observed_rows) == 120
+    assert {row.ai_risk for row in observed_rows} == {"low_value"}
+
+
+def test_run_backup_pipeline_splits_path_batches_after_parse_fallback(tmp_path) -> None:
+    for index in range(8):
+        (tmp_path / f"{_letters(index)}.txt").write_text("x", encoding="utf-8")
+    calls: list[int] = []
+
+    def fake_path_risk(paths: list[str]) -> dict[str, dict[str, object]]:
+        calls.append(len(paths))
+        if len(paths) > 4:
+            return {
+                path: {"risk": "neutral", "reason": "LLM parse fallback"}
+                for path in paths
+            }
+        return {path: {"risk": "low_value", "reason": "temp"} for path in paths}
+
+    observed_rows = []
+    run_backup_pipeline(
+        target="X:/ArkBackup",
+        dry_run=True,
+        source_roots=[tmp_path],
+        stage1_review_fn=lambda rows: {".txt"},
+        stage3_review_fn=lambda rows: observed_rows.extend(rows) or set(),
+        path_risk_fn=fake_path_risk,
+        ai_concurrency=1,
+    )
+
+    assert calls == [8, 4, 4]
+    assert {row.ai_risk for row in observed_rows} == {"low_value"}
+
+
+def test_run_backup_pipeline_splits_unparsable_path_batches_only_once(
+    tmp_path,
+) -> None:
+    for index in range(8):
+        (tmp_path / f"{_letters(index)}.txt").write_text("x", encoding="utf-8")
+    calls: list[int] = []
+
+    def fake_path_risk(paths: list[str]) -> dict[str, dict[str, object]]:
+        calls.append(len(paths))
+        return {
+            path: {"risk": "neutral", "reason": "LLM parse fallback"} for path in paths
+        }
+
+    observed_rows = []
+    run_backup_pipeline(
+        target="X:/ArkBackup",
+        dry_run=True,
+        source_roots=[tmp_path],
+        stage1_review_fn=lambda rows: {".txt"},
+        stage3_review_fn=lambda rows: observed_rows.extend(rows) or set(),
+        path_risk_fn=fake_path_risk,
+        ai_concurrency=1,
+    )
+
+    assert calls == [8, 4, 4]
+    assert len(observed_rows) == 8
+    assert {row.ai_risk for row in observed_rows} == {"neutral"}
+
+
+def test_run_backup_pipeline_sends_each_basename_once(tmp_path) -> None:
+    for folder in ("a", "b", "c"):
+        (tmp_path / folder).mkdir()
+        (tmp_path / folder / "index.js").write_text("x", encoding="utf-8")
+    (tmp_path / "a" / "app.js").write_text("x", encoding="utf-8")
+    sent: list[str] = []
+
+    def fake_path_risk(paths: list[str]) -> dict[str, dict[str, object]]:
+        sent.extend(paths)
+        return {path: {"risk": "low_value", "reason": "bundle"} for path in paths}
+
+    observed_rows = []
+    run_backup_pipeline(
+        target="X:/ArkBackup",
+        dry_run=True,
+        source_roots=[tmp_path],
+        stage1_review_fn=lambda rows: {".js"},
+        stage3_review_fn=lambda rows: observed_rows.extend(rows) or set(),
+        path_risk_fn=fake_path_risk,
+    )
+
+    assert sorted(sent) == ["app.js", "index.js"]
+    assert len(observed_rows) == 4
+    assert {row.ai_risk for row in observed_rows} == {"low_value"}
+
+
+def test_run_backup_pipeline_classifies_path_families_once(tmp_path) -> None:
+    for index in range(12):
+        (tmp_path / f"frame_{index:05d}.png").write_text("x", encoding="utf-8")
+    for index in range(3):
+        (tmp_path / f"report{index}.png").write_text("x", encoding="utf-8")
+    (tmp_path / "cover.png").write_text("x", encoding="utf-8")
+    sent: list[str] = []
+    sent_families = {}
+
+    def fake_path_risk(
+        paths: list[str], families=None
+    ) -> dict[str, dict[str, object]]:
+        sent.extend(paths)
+        sent_families.update(families or {})
+        return {
+            path: {"risk": "low_value", "confidence": 0.8, "reason": "frames"}
+            for path in paths
+            if "{n}" in path
+        }
+
+    observed_rows = []
+    run_backup_pipeline(
+        target="X:/ArkBackup",
+        dry_run=True,
+        source_roots=[tmp_path],
+        stage1_review_fn=lambda rows: {".png"},
+        stage3_review_fn=lambda rows: observed_rows.extend(rows) or set(),
+        path_risk_fn=fake_path_risk,
+    )
+
+    assert sorted(sent) == [
+        "cover.png",
+        "frame_{n}.png",
+        "report0.png",
+        "report1.png",
+        "report2.png",
+    ]
+    assert sent_families["frame_{n}.png"].count == 12
+    assert sent_families["frame_{n}.png"].samples[0] == "frame_00000.png"
+    by_name = {Path(row.path).name: row for row in observed_rows}
+    assert by_name["frame_00004.png"].ai_risk == "low_value"
+    assert by_name["frame_00004.png"].confidence >= 0.8
+    assert by_name["cover.png"].ai_risk == "neutral"
@@ -0,0 +1,89 @@
+import os
+from pathlib import Path
+
+from ark.platforms.posix import PosixAdapter, parse_mountinfo
+
+MOUNTINFO = """\
+22 1 0:21 / / rw,relatime - overlay overlay rw,lowerdir=/l
+23 22 0:22 / /proc rw,relatime - proc proc rw
+24 22 0:23 / /sys rw,relatime - sysfs sysfs rw
+25 24 0:24 / /sys/fs/cgroup rw shared:9 - cgroup2 cgroup2 rw
+26 22 259:2 / /home rw,relatime shared:1 - ext4 /dev/nvme0n1p2 rw
+27 22 0:25 / /run rw,nosuid - tmpfs tmpfs rw
+28 27 259:3 / /run/media/usb rw - vfat /dev/sda1 rw
+29 22 259:4 / /mnt/My\\040Disk rw - ext4 /dev/sdb1 rw
+"""
+
+AUTOFS_MOUNTINFO = """\
+22 1 259:1 / / rw - ext4 /dev/nvme0n1p1 rw
+30 22 0:40 / /home rw - autofs systemd-1 rw
+31 30 0:41 / /home/alice rw - nfs4 fs:/home/alice rw
+32 22 7:1 / /snap/core/17 ro - squashfs /dev/loop1 ro
+33 22 7:2 / /mnt/image ro - squashfs /dev/loop2 ro
+"""
+
+
+def test_parse_mountinfo_decodes_escaped_mount_points() -> None:
+    mounts = {mount.path: mount for mount in parse_mountinfo(MOUNTINFO)}
+
+    assert mounts[Path("/mnt/My Disk")].fstype == "ext4"
+    assert mounts[Path("/home")].source == "/dev/nvme0n1p2"
+    assert mounts[Path("/sys/fs/cgroup")].is_pseudo is True
+    assert mounts[Path("/")].is_pseudo is False
+
+
+def test_posix_adapter_lists_real_mounts_and_excludes_pseudo_ones(tmp_path) -> None:
+    mountinfo = tmp_path / "mountinfo"
+    mountinfo.write_text(MOUNTINFO, encoding="utf-8")
+    adapter = PosixAdapter(mountinfo_path=mountinfo)
+
+    assert adapter.list_roots() == [
+        Path("/"),
+        Path("/home"),
+        Path("/mnt/My Disk"),
+        Path("/run/media/usb"),
+    ]
+    assert adapter.excluded_dirs() == {
+        Path("/proc"),
+        Path("/sys"),
+        Path("/sys/fs/cgroup"),
+    }
+
+
+def test_posix_adapter_keeps_automounted_homes_and_non_snap_images(
+    tmp_path,
+) -> None:
+    mountinfo = tmp_path / "mountinfo"
+    mountinfo.write_text(AUTOFS_MOUNTINFO, encoding="utf-8")
+    adapter = PosixAdapter(mountinfo_path=mountinfo)
+
+    assert adapter.excluded_dirs() == {Path("/snap/core/17")}
+    assert Path("/home/alice") in adapter.list_roots()
+    assert Path("/mnt/image") in adapter.list_roots()
+
+
+def test_posix_adapter_falls_back_to_filesystem_root_without_mountinfo(
+    tmp_path,
+) -> None:
+    adapter = PosixAdapter(mountinfo_path=tmp_path / "missing")
+
+    assert adapter.list_roots()[0] == Path("/")
+    assert adapter.excluded_dirs() == set()
+
+
+def test_posix_adapter_iter_files_skips_symlinked_and_excluded_dirs(tmp_path) -> None:
+    root = tmp_path / "root"
+    (root / "docs").mkdir(parents=True)
+    (root / "docs" / "a.txt").write_text("a", encoding="utf-8")
+    (root / "proc").mkdir()
+    (root / "proc" / "status").write_text("x", encoding="utf-8")
+    (root / "top.md").write_text("t", encoding="utf-8")
+    os.symlink(root / "docs", root / "docs-link")
+    mountinfo = tmp_path / "mountinfo"
+    mountinfo.write_text(
+        f"23 22 0:22 / {root / 'proc'} rw - proc proc rw\n", encoding="utf-8"
+    )
+
+    files = sorted(PosixAdapter(mountinfo_path=mountinfo).iter_files(root))
+
+    assert files == [root / "docs" / "a.txt", root / "top.md"]
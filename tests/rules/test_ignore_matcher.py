@@ -0,0 +1,117 @@
+import random
+
+import pathspec
+
+import ark.rules.local_rules as local_rules
+from ark.rules.ignore_matcher import CompiledIgnoreMatcher
+
+BASELINE_SAMPLE_PATHS = [
+    ".git/",
+    ".git/config",
+    "src/.git/",
+    "__pycache__/",
+    "pkg/__pycache__/mod.cpython-311.pyc",
+    "pkg/mod.py",
+    "pkg/mod.pyc",
+    "pkg/mod.pyo",
+    "pkg/mod.pyd",
+    "pkg/mod.pyx",
+    ".pytest_cache/",
+    ".venv/",
+    "venv/",
+    "tools/venv/",
+    "web/node_modules/",
+    ".opencode/node_modules/zod/v4/locales/en.ts",
+    "web/.next/",
+    "dist/",
+    "build/",
+    "docs/build/",
+    "target/",
+    "out/",
+    ".idea/",
+    ".vscode/",
+    ".cache/",
+    "src/app/main.py",
+    "docs/readme.md",
+    "notes/build.txt",
+    "output/report.pdf",
+    "targets/list.txt",
+]
+
+EXTRA_RULES = [
+    "*.log",
+    "!keep.log",
+    "/secrets",
+    "docs/tmp/",
+    "dir/*.txt",
+    "assets/**",
+    "**/generated",
+    "*.tar.gz",
+    "data?.csv",
+    "!build/keep/",
+    "cache",
+]
+
+SEGMENTS = [
+    "a",
+    "docs",
+    "tmp",
+    "build",
+    "keep",
+    "dir",
+    "assets",
+    "generated",
+    "secrets",
+    "cache",
+    "node_modules",
+    ".git",
+    "x.log",
+    "keep.log",
+    "notes.txt",
+    "b.tar.gz",
+    "data1.csv",
+    "mod.pyc",
+    "venv",
+]
+
+
+def _baseline_lines() -> list[str]:
+    return local_rules._read_ignore_file(local_rules.BASELINE_IGNORE_FILE)
+
+
+def test_compiled_matcher_matches_pathspec_on_baseline() -> None:
+    lines = _baseline_lines()
+    reference = pathspec.PathSpec.from_lines("gitignore", lines)
+    matcher = CompiledIgnoreMatcher(lines)
+
+    for path in BASELINE_SAMPLE_PATHS:
+        assert matcher.match_file(path) == reference.match_file(path), path
+
+
+def test_compiled_matcher_matches_fallback_on_baseline() -> None:
+    lines = _baseline_lines()
+    fallback = local_rules._FallbackPathSpec(lines)
+    matcher = CompiledIgnoreMatcher(lines)
+
+    for path in BASELINE_SAMPLE_PATHS:
+        assert matcher.match_file(path) == fallback.match_file(path), path
+
+
+def test_compiled_matcher_matches_pathspec_on_random_paths() -> None:
+    lines = _baseline_lines() + EXTRA_RULES
+    reference = pathspec.PathSpec.from_lines("gitignore", lines)
+    matcher = CompiledIgnoreMatcher(lines)
+    rng = random.Random(5)
+
+    for _ in range(3000):
+        parts = [rng.choice(SEGMENTS) for _ in range(rng.randint(1, 5))]
+        path = "/".join(parts) + ("/" if rng.random() < 0.4 else "")
+        assert matcher.match_file(path) == reference.match_file(path), path
+
+
+def test_compiled_matcher_keeps_last_match_wins_across_classes() -> None:
+    matcher = CompiledIgnoreMatcher(["*.log", "!keep.log", "logs/**"])
+
+    assert matcher.match_file("app/debug.log") is True
+    assert matcher.match_file("app/keep.log") is False
+    assert matcher.match_file("logs/keep.log") is True
@@ -1,3 +1,5 @@
+import fnmatch
+import random
 from pathlib import Path
 
 import ark.rules.local_rules as local_rules
@@ -35,3 +37,73 @@ def test_fallback_matcher_ignores_nested_node_modules(monkeypatch) -> None:
         local_rules.should_ignore_relpath(spec, "src/app/main.py", is_dir=False)
         is False
     )
+
+
+def test_nested_ignore_spec_is_cached_until_file_changes(tmp_path: Path) -> None:
+    (tmp_path / ".gitignore").write_text("dist/\n", encoding="utf-8")
+
+    first = local_rules.load_directory_ignore_spec(tmp_path, {".gitignore": (1, 6)})
+    again = local_rules.load_directory_ignore_spec(tmp_path, {".gitignore": (1, 6)})
+    edited = local_rules.load_directory_ignore_spec(tmp_path, {".gitignore": (2, 6)})
+    layers = (
+        local_rules.IgnoreLayer("", local_rules._pathspec_from_lines(["!dist/"])),
+        local_rules.IgnoreLayer("web", first),
+    )
+
+    assert first is again
+    assert edited is not first
+    assert local_rules.should_ignore_in_layers(layers, "web/dist", is_dir=True)
+    assert not local_rules.should_ignore_in_layers(layers, "dist", is_dir=True)
+
+
+def _reference_fallback_match(patterns: list[str], path: str) -> bool:
+    """Uncompiled fnmatch loop the precompiled fallback must agree with."""
+    result = False
+    normalized = path.replace("\\", "/").strip()
+    plain = normalized.rstrip("/")
+    for raw in patterns:
+        negated = raw.startswith("!")
+        pat = (raw[1:] if negated else raw).replace("\\", "/").strip()
+        if not pat:
+            continue
+        if pat.endswith("/"):
+            prefix = pat.rstrip("/")
+            if "/" in prefix:
+                hit = plain == prefix or plain.startswith(f"{prefix}/")
+            else:
+                hit = prefix in [segment for segment in plain.split("/") if segment]
+        elif "/" in pat:
+            hit = fnmatch.fnmatch(normalized, pat) or fnmatch.fnmatch(plain, pat)
+        else:
+            hit = any(
+                fnmatch.fnmatch(subject, pat)
+                for subject in (plain, normalized, plain.split("/")[-1])
+            )
+        if hit:
+            result = not negated
+    return result
+
+
+def test_fallback_matcher_agrees_with_uncompiled_fnmatch_rules() -> None:
+    patterns = local_rules._read_ignore_file(local_rules.BASELINE_IGNORE_FILE) + [
+        "*.log",
+        "!keep.log",
+        "docs/tmp/",
+        "dir/*.txt",
+        "data?.csv",
+        "*cache",
+        "notes",
+        "!build/",
+    ]
+    spec = local_rules._FallbackPathSpec(patterns)
+    segments = ["a", "docs", "tmp", "dir", "build", "node_modules", ".git", "notes"]
+    names = ["x.log", "keep.log", "n.txt", "data1.csv", "m.pyc", "pycache", "notes"]
+    rng = random.Random(7)
+
+    for _ in range(3000):
+        parts = [rng.choice(segments) for _ in range(rng.randint(0, 4))]
+        path = "/".join(parts + [rng.choice(names + segments)])
+        if rng.random() < 0.3:
+            path += "/"
+        expected = _reference_fallback_match(patterns, path)
+        assert spec.match_file(path) is expected, path
@@ -0,0 +1,55 @@
+from pathlib import Path
+
+from ark.state.decision_cache import DecisionCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_decision_cache_returns_answers_per_namespace(tmp_path: Path) -> None:
+    cache = DecisionCache(tmp_path / "cache.sqlite3")
+    cache.put_many("path:v1:openai:gpt", {"index.js": {"risk": "low_value"}})
+
+    assert cache.get_many("path:v1:openai:gpt", ["index.js", "a.txt"]) == {
+        "index.js": {"risk": "low_value"}
+    }
+    assert cache.get_many("path:v1:openai:other", ["index.js"]) == {}
+    cache.close()
+
+    reopened = DecisionCache(tmp_path / "cache.sqlite3")
+    assert reopened.get_many("path:v1:openai:gpt", ["index.js"]) != {}
+    reopened.close()
+
+
+def test_decision_cache_expires_entries_after_ttl(tmp_path: Path) -> None:
+    clock = FakeClock()
+    cache = DecisionCache(tmp_path / "cache.sqlite3", ttl_seconds=60, clock=clock)
+    cache.put_many("ns", {"a": {"risk": "neutral"}})
+
+    clock.now += 61
+
+    assert cache.get_many("ns", ["a"]) == {}
+    cache.put_many("ns", {"b": {"risk": "neutral"}})
+    assert len(cache) == 1
+    cache.close()
+
+
+def test_decision_cache_evicts_least_recently_used_entries(tmp_path: Path) -> None:
+    clock = FakeClock()
+    cache = DecisionCache(tmp_path / "cache.sqlite3", max_entries=2, clock=clock)
+    cache.put_many("ns", {"a": {"n": 1}})
+    clock.now += 1
+    cache.put_many("ns", {"b": {"n": 2}})
+    clock.now += 1
+    cache.get_many("ns", ["a"])
+    clock.now += 1
+
+    cache.put_many("ns", {"c": {"n": 3}})
+
+    assert set(cache.get_many("ns", ["a", "b", "c"])) == {"a", "c"}
+    cache.close()
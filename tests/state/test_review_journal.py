@@ -0,0 +1,65 @@
+import json
+
+from ark.state.review_journal import ReviewCursor, ReviewJournal
+
+
+def test_review_journal_replays_snapshot_toggles_and_last_cursor(tmp_path) -> None:
+    journal = ReviewJournal(tmp_path / "run.review.jsonl")
+    journal.snapshot(["/a/x.txt"], ReviewCursor("", 0, False))
+    journal.toggle("/a/y.txt")
+    journal.move(ReviewCursor("/a", 0, False))
+    journal.move(ReviewCursor("/a", 0, False))
+    journal.toggle("/a")
+    journal.move(ReviewCursor("/a", 2, True))
+    journal.close()
+
+    lines = (tmp_path / "run.review.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 5
+
+    replay = ReviewJournal(tmp_path / "run.review.jsonl").replay()
+
+    assert replay is not None
+    assert replay.selected_paths == ["/a/x.txt"]
+    assert replay.toggles == ["/a/y.txt", "/a"]
+    assert replay.cursor == ReviewCursor("/a", 2, True)
+
+
+def test_review_journal_compaction_starts_from_new_snapshot(tmp_path) -> None:
+    path = tmp_path / "run.review.jsonl"
+    journal = ReviewJournal(path, compact_every=2)
+    journal.snapshot([], ReviewCursor())
+    journal.toggle("/a/x.txt")
+    assert not journal.needs_compaction
+    journal.toggle("/a/y.txt")
+    assert journal.needs_compaction
+
+    journal.snapshot(["/a/x.txt", "/a/y.txt"], ReviewCursor("/a", 1, False))
+    journal.toggle("/a/x.txt")
+    journal.close()
+
+    replay = ReviewJournal(path).replay()
+
+    assert replay is not None
+    assert replay.selected_paths == ["/a/x.txt", "/a/y.txt"]
+    assert replay.toggles == ["/a/x.txt"]
+    assert replay.cursor == ReviewCursor("/a", 1, False)
+
+
+def test_review_journal_ignores_torn_tail_and_missing_file(tmp_path) -> None:
+    path = tmp_path / "run.review.jsonl"
+    assert ReviewJournal(path).replay() is None
+
+    journal = ReviewJournal(path)
+    journal.snapshot(["/a/x.txt"], ReviewCursor())
+    journal.toggle("/a/x.txt")
+    journal.close()
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps({"toggle": "/a/y.txt"})[:7])
+
+    replay = ReviewJournal(path).replay()
+
+    assert replay is not None
+    assert replay.toggles == ["/a/x.txt"]
+
+    journal.reset()
+    assert not path.exists()
@@ -0,0 +1,123 @@
+import os
+import time
+from pathlib import Path
+
+from ark.collector.walker import DirectorySnapshot, FileRecord, walk_roots
+from ark.state.scan_index import ScanIndex
+
+
+def _age_tree(root: Path, seconds: int = 60) -> None:
+    past = time.time() - seconds
+    for current, dir_names, file_names in os.walk(root):
+        for name in dir_names + file_names:
+            os.utime(Path(current) / name, (past, past))
+    os.utime(root, (past, past))
+
+
+def test_scan_index_roundtrips_snapshot(tmp_path: Path) -> None:
+    index = ScanIndex(tmp_path / "index.sqlite3")
+    record = FileRecord(
+        path=Path("/data/docs/a.txt"),
+        size=5,
+        mtime_ns=10,
+        inode=11,
+        device=12,
+        mode=0o100644,
+    )
+    snapshot = DirectorySnapshot(
+        path="/data/docs",
+        mtime_ns=1,
+        inode=2,
+        device=3,
+        listed_at_ns=4,
+        files=[record],
+        subdirs=["sub"],
+    )
+
+    index.store([snapshot], [])
+    loaded = index.lookup("/data/docs")
+    index.close()
+
+    assert loaded == snapshot
+
+
+def test_scan_index_forgets_removed_subtrees(tmp_path: Path) -> None:
+    index = ScanIndex(tmp_path / "index.sqlite3")
+    snapshots = [
+        DirectorySnapshot(path=path, mtime_ns=1, inode=1, device=1, listed_at_ns=1)
+        for path in [
+            f"{os.sep}data",
+            f"{os.sep}data{os.sep}old",
+            f"{os.sep}data{os.sep}old{os.sep}deep",
+            f"{os.sep}data{os.sep}older",
+        ]
+    ]
+    index.store(snapshots, [])
+
+    index.store([], [f"{os.sep}data{os.sep}old"])
+
+    assert index.lookup(f"{os.sep}data") is not None
+    assert index.lookup(f"{os.sep}data{os.sep}old") is None
+    assert index.lookup(f"{os.sep}data{os.sep}old{os.sep}deep") is None
+    assert index.lookup(f"{os.sep}data{os.sep}older") is not None
+    index.close()
+
+
+def test_walk_roots_reuses_unchanged_directories_from_index(tmp_path: Path) -> None:
+    root = tmp_path / "src"
+    (root / "docs").mkdir(parents=True)
+    (root / "media").mkdir()
+    (root / "docs" / "a.txt").write_text("a", encoding="utf-8")
+    (root / "media" / "b.jpg").write_text("b", encoding="utf-8")
+    _age_tree(root)
+    index = ScanIndex(tmp_path / "index.sqlite3")
+
+    first = walk_roots([root], workers=2, index=index)
+    (root / "docs" / "new.txt").write_text("new", encoding="utf-8")
+    reused: list[Path] = []
+    second = walk_roots(
+        [root],
+        workers=2,
+        index=index,
+        on_listing=lambda listing: (
+            reused.append(listing.directory) if listing.from_index else None
+        ),
+    )
+    index.close()
+
+    assert [item.path for item in first[root]] == [
+        root / "docs" / "a.txt",
+        root / "media" / "b.jpg",
+    ]
+    assert [item.path for item in second[root]] == [
+        root / "docs" / "a.txt",
+        root / "docs" / "new.txt",
+        root / "media" / "b.jpg",
+    ]
+    assert sorted(reused) == [root, root / "media"]
+
+
+def test_walk_roots_restats_files_of_indexed_directories(tmp_path: Path) -> None:
+    root = tmp_path / "src"
+    (root / "a" / "b").mkdir(parents=True)
+    target = root / "a" / "b" / "f.txt"
+    target.write_text("abc", encoding="utf-8")
+    _age_tree(root)
+    index = ScanIndex(tmp_path / "index.sqlite3")
+
+    walk_roots([root], workers=2, index=index)
+    target.write_text("x" * 3600, encoding="utf-8")
+    reused: list[Path] = []
+    second = walk_roots(
+        [root],
+        workers=2,
+        index=index,
+        on_listing=lambda listing: (
+            reused.append(listing.directory) if listing.from_index else None
+        ),
+    )
+    index.close()
+
+    assert sorted(reused) == [root, root / "a", root / "a" / "b"]
+    sizes = {record.path: record.size for record in second[root]}
+    assert sizes[target] == 3600
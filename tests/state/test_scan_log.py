@@ -0,0 +1,39 @@
+from pathlib import Path
+
+from ark.state.scan_log import ScanSegmentLog
+
+
+def test_scan_segment_log_replays_appended_segments_and_skips_torn_tail(
+    tmp_path: Path,
+) -> None:
+    log = ScanSegmentLog(tmp_path / "run.scan.jsonl")
+    log.append({"/src": [["/src/a.txt", 1, 0, 1, 1, 33188, 1]]}, {"/src/docs": []})
+    log.append({"/src": [["/src/b.txt", 2, 0, 2, 1, 33188, 1]]}, {"/src": ["docs"]})
+    log.close()
+    with log.path.open("a", encoding="utf-8") as handle:
+        handle.write('{"rows": {"/src": [["/src/c.t')
+
+    replay = ScanSegmentLog(log.path).replay()
+
+    assert [row[0] for row in replay.rows_by_root["/src"]] == [
+        "/src/a.txt",
+        "/src/b.txt",
+    ]
+    assert replay.completed_dirs == {"/src": ["docs"], "/src/docs": []}
+    assert replay.complete is False
+
+
+def test_scan_segment_log_compacts_into_one_segment_per_root(tmp_path: Path) -> None:
+    log = ScanSegmentLog(tmp_path / "run.scan.jsonl")
+    for index in range(5):
+        log.append({"/src": [[f"/src/{index}.txt", 1, 0, index, 1, 33188, 1]]}, {})
+
+    log.compact({"/src": [["/src/0.txt", 1, 0, 0, 1, 33188, 1]], "/other": []})
+    replay = log.replay()
+
+    assert len(log.path.read_text(encoding="utf-8").splitlines()) == 3
+    assert replay.complete is True
+    assert replay.rows_by_root == {
+        "/src": [["/src/0.txt", 1, 0, 0, 1, 33188, 1]],
+        "/other": [],
+    }
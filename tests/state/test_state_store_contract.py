@@ -28,6 +28,7 @@ def test_config_store_roundtrip(tmp_path) -> None:
         google_client_id="client-id",
         google_client_secret="client-secret",
         google_refresh_token="refresh-token",
+        llm_requests_per_minute=500,
         ai_suffix_enabled=True,
         ai_path_enabled=True,
         send_full_path_to_ai=True,
@@ -0,0 +1,23 @@
+import threading
+
+from ark.state.base import ThreadLocalConnections
+
+
+def test_thread_local_connections_are_per_thread_and_reopen_after_close(
+    tmp_path,
+) -> None:
+    connections = ThreadLocalConnections(tmp_path / "db.sqlite3")
+    main = connections.connect()
+    other: list[object] = []
+    worker = threading.Thread(target=lambda: other.append(connections.connect()))
+    worker.start()
+    worker.join()
+
+    assert connections.connect() is main
+    assert other[0] is not main
+    assert main.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+
+    connections.close()
+
+    assert connections.connect() is not main
+    connections.close()
@@ -0,0 +1,51 @@
+import logging
+import sys
+
+import pytest
+
+from ark.state.token_store import EncryptedTokenStore
+
+pytest.importorskip("cryptography")
+
+
+def test_token_store_round_trips_encrypted_payload(tmp_path) -> None:
+    path = tmp_path / "tokens.json"
+    store = EncryptedTokenStore(path)
+    store.save(("id", "secret", "refresh"), {"token": "access-1", "expiry": 1.0})
+
+    reopened = EncryptedTokenStore(path)
+
+    assert reopened.load(("id", "secret", "refresh")) == {
+        "token": "access-1",
+        "expiry": 1.0,
+    }
+    assert "access-1" not in path.read_text(encoding="utf-8")
+    assert "refresh" not in path.read_text(encoding="utf-8")
+    assert path.stat().st_mode & 0o077 == 0
+
+
+def test_token_store_ignores_other_identities_and_corrupt_files(tmp_path) -> None:
+    path = tmp_path / "tokens.json"
+    store = EncryptedTokenStore(path)
+    store.save(("id", "secret", "refresh"), {"token": "access-1", "expiry": 1.0})
+
+    assert store.load(("id", "secret", "other")) is None
+
+    path.write_text("not json", encoding="utf-8")
+    assert store.load(("id", "secret", "refresh")) is None
+
+
+def test_token_store_warns_and_does_nothing_without_cryptography(
+    tmp_path, monkeypatch, caplog
+) -> None:
+    monkeypatch.setitem(sys.modules, "cryptography.fernet", None)
+    path = tmp_path / "tokens.json"
+
+    with caplog.at_level(logging.WARNING, logger="ark.state.token_store"):
+        store = EncryptedTokenStore(path)
+    store.save(("id", "secret", "refresh"), {"token": "access-1", "expiry": 1.0})
+
+    assert store.available is False
+    assert "cryptography is not installed" in caplog.text
+    assert store.load(("id", "secret", "refresh")) is None
+    assert not path.exists()
@@ -1,4 +1,6 @@
-from ark.tui.llm_catalog import LLM_PROVIDER_GROUPS
+from ark.ai.batcher import DEFAULT_TOKEN_BUDGET
+from ark.ai.rate_limit import ProviderLimits
+from ark.tui.llm_catalog import LLM_PROVIDER_GROUPS, batch_token_budget, rate_limits
 
 
 def test_each_provider_has_three_recommended_models() -> None:
@@ -34,3 +36,21 @@ def test_china_friendly_group_uses_prefixed_deepseek_models() -> None:
         "deepseek/deepseek-chat",
         "deepseek/deepseek-coder",
     )
+
+
+def test_batch_token_budget_follows_preset_reply_allowance() -> None:
+    assert batch_token_budget("ollama") == 2_000
+    assert batch_token_budget("openai") == 16_384
+    assert batch_token_budget("gemini") == 8_192
+    assert batch_token_budget("anthropic") == 4_096
+    assert batch_token_budget("unknown-provider") == DEFAULT_TOKEN_BUDGET
+
+
+def test_rate_limits_follow_preset_quota() -> None:
+    assert rate_limits("ollama") == ProviderLimits(0, 0)
+    assert rate_limits("groq").requests_per_minute == 30
+    assert rate_limits("unknown-provider") == ProviderLimits()
+    assert rate_limits("groq", requests_per_minute=500) == ProviderLimits(
+        500, ProviderLimits().tokens_per_minute
+    )
+    assert rate_limits("openai", 0, 0) == ProviderLimits(0, 0)
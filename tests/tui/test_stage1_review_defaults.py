@@ -218,3 +218,40 @@ def test_classify_suffix_category_assigns_expected_buckets() -> None:
     assert classify_suffix_category(".pdf") == "Document"
     assert classify_suffix_category(".jpg") == "Image"
     assert classify_suffix_category(".tmp") == "Temp/Cache"
+
+
+def test_stage1_table_and_groups_order_suffixes_by_volume() -> None:
+    rows = [
+        SuffixReviewRow(
+            ext=".png",
+            label="keep",
+            tag="image",
+            confidence=0.9,
+            reason="image",
+            file_count=2,
+            total_bytes=2048,
+        ),
+        SuffixReviewRow(
+            ext=".jpg",
+            label="keep",
+            tag="image",
+            confidence=0.9,
+            reason="image",
+            file_count=9,
+            total_bytes=5 * 1024 * 1024,
+            examples=("/photos/trip/beach.jpg", "/photos/cat.jpg"),
+        ),
+    ]
+    console = Console(record=True, width=160)
+
+    stage1_review.render_stage1_table(rows, console=console)
+    grouped = group_suffix_rows(rows)
+
+    output = console.export_text()
+    assert output.index(".jpg") < output.index(".png")
+    assert "5.0 MB" in output
+    assert [row.ext for row in grouped["Image"]] == [".jpg", ".png"]
+    assert "beach.jpg, cat.jpg" in output
+    labels = [item["name"] for item in flatten_grouped_suffix_choices(grouped)]
+    assert labels[1].endswith("e.g. beach.jpg")
+    assert "e.g." not in labels[2]
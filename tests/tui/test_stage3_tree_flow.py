@@ -2,6 +2,9 @@ from rich.console import Console
 import threading
 import time
 
+import pytest
+
+from ark.state.review_journal import ReviewJournal
 from ark.tui.stage3_review import PathReviewRow, run_stage3_review
 
 
@@ -273,7 +276,7 @@ def test_run_stage3_review_applies_ai_dfs_drop_recursively() -> None:
 
     assert "/root" in visited
     assert "/root/docs" in visited
-    assert "/root/docs/sub" in visited
+    assert "/root/docs/sub" not in visited
     assert selected == {"/root/keep/c.txt"}
 
 
@@ -330,3 +333,180 @@ def test_run_stage3_review_ai_dfs_requests_sibling_directories_concurrently() ->
     )
 
     assert active["max"] > 1
+
+
+def _leaf_rows(count: int) -> list[PathReviewRow]:
+    return [
+        PathReviewRow(
+            path=f"/root/d{index:02d}/file.txt",
+            tier="tier1",
+            size_bytes=1,
+            reason="leaf",
+            confidence=0.9,
+        )
+        for index in range(count)
+    ]
+
+
+def test_run_stage3_review_ai_dfs_caps_concurrent_directory_calls() -> None:
+    lock = threading.Lock()
+    active = {"count": 0, "max": 0}
+
+    def fake_ai_directory_decision(
+        directory: str,
+        child_directories: list[str],
+        sample_files: list[str],
+    ) -> dict[str, object]:
+        del child_directories, sample_files
+        with lock:
+            active["count"] += 1
+            active["max"] = max(active["max"], active["count"])
+        time.sleep(0.02)
+        with lock:
+            active["count"] -= 1
+        if directory == "/root":
+            return {"decision": "not_sure", "reason": "root", "confidence": 0.5}
+        return {"decision": "keep", "reason": "leaf", "confidence": 0.9}
+
+    run_stage3_review(
+        _leaf_rows(12),
+        action_prompt=lambda _m, _c: "done",
+        confirm_prompt=lambda _msg, _default: True,
+        console=Console(record=True),
+        ai_directory_decision_fn=fake_ai_directory_decision,
+        ai_directory_workers=3,
+    )
+
+    assert 1 < active["max"] <= 3
+
+
+def test_run_stage3_review_ai_dfs_stops_at_call_limit() -> None:
+    visited: list[str] = []
+
+    def fake_ai_directory_decision(
+        directory: str,
+        child_directories: list[str],
+        sample_files: list[str],
+    ) -> dict[str, object]:
+        del child_directories, sample_files
+        visited.append(directory)
+        return {"decision": "not_sure", "reason": "unsure", "confidence": 0.2}
+
+    console = Console(record=True, width=120)
+    run_stage3_review(
+        _leaf_rows(10),
+        action_prompt=lambda _m, _c: "done",
+        confirm_prompt=lambda _msg, _default: True,
+        console=console,
+        ai_directory_decision_fn=fake_ai_directory_decision,
+        ai_directory_call_limit=4,
+    )
+
+    assert len(visited) == 4
+    assert visited[0] == "/root"
+    assert "unvisited=7 (call limit)" in console.export_text()
+
+
+def test_run_stage3_review_ai_dfs_descends_below_low_confidence_decisions() -> None:
+    rows = [
+        PathReviewRow(
+            path="/root/docs/sub/a.txt",
+            tier="tier1",
+            size_bytes=1,
+            reason="doc",
+            confidence=0.9,
+        ),
+        PathReviewRow(
+            path="/root/docs/b.txt",
+            tier="tier1",
+            size_bytes=1,
+            reason="doc",
+            confidence=0.9,
+        ),
+    ]
+    visited: list[str] = []
+
+    def fake_ai_directory_decision(
+        directory: str,
+        child_directories: list[str],
+        sample_files: list[str],
+    ) -> dict[str, object]:
+        del child_directories, sample_files
+        visited.append(directory)
+        if directory == "/root/docs":
+            return {"decision": "drop", "reason": "maybe", "confidence": 0.4}
+        if directory == "/root/docs/sub":
+            return {"decision": "keep", "reason": "notes", "confidence": 0.9}
+        return {"decision": "not_sure", "reason": "root", "confidence": 0.5}
+
+    selected = run_stage3_review(
+        rows,
+        action_prompt=lambda _m, _c: "done",
+        confirm_prompt=lambda _msg, _default: True,
+        console=Console(record=True),
+        ai_directory_decision_fn=fake_ai_directory_decision,
+    )
+
+    assert visited == ["/root", "/root/docs", "/root/docs/sub"]
+    assert selected == {"/root/docs/sub/a.txt"}
+
+
+def test_run_stage3_review_resumes_from_review_journal(tmp_path) -> None:
+    rows = [
+        PathReviewRow(
+            path=f"/root/docs/{name}.txt",
+            tier="tier1" if name == "a" else "tier2",
+            size_bytes=1,
+            reason="doc",
+            confidence=0.9,
+        )
+        for name in ("a", "b", "c")
+    ]
+    journal = ReviewJournal(tmp_path / "run.review.jsonl")
+    checkpoints: list[dict] = []
+    first_actions = iter(
+        [
+            "enter::node::/root",
+            "enter::node::/root/docs",
+            "space::node::/root/docs/b.txt",
+            "space::node::/root/docs/a.txt",
+        ]
+    )
+
+    def interrupted_prompt(_message: str, _choices: list[dict]) -> str:
+        action = next(first_actions, None)
+        if action is None:
+            raise KeyboardInterrupt
+        return action
+
+    with pytest.raises(KeyboardInterrupt):
+        run_stage3_review(
+            rows,
+            action_prompt=interrupted_prompt,
+            confirm_prompt=lambda _msg, _default: True,
+            console=Console(record=True),
+            checkpoint_callback=checkpoints.append,
+            review_journal=journal,
+        )
+    journal.close()
+
+    assert checkpoints == []
+    lines = journal.path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 5
+
+    messages: list[str] = []
+
+    def resumed_prompt(message: str, _choices: list[dict]) -> str:
+        messages.append(message)
+        return "done"
+
+    selected = run_stage3_review(
+        rows,
+        action_prompt=resumed_prompt,
+        confirm_prompt=lambda _msg, _default: True,
+        console=Console(record=True),
+        review_journal=ReviewJournal(journal.path),
+    )
+
+    assert selected == {"/root/docs/b.txt"}
+    assert messages[0].startswith("dir=/root/docs ")
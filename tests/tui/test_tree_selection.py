@@ -41,3 +41,93 @@ def test_paginate_items_slices_current_page_items() -> None:
 
     assert total_pages == 3
     assert page2 == ["item-4", "item-5", "item-6"]
+
+
+def test_directory_counts_follow_nested_toggles() -> None:
+    state = TreeSelectionState.from_paths(
+        [
+            "/data/docs/a.txt",
+            "/data/docs/sub/b.txt",
+            "/data/docs/sub/c.log",
+            "/data/media/d.jpg",
+        ],
+        selected_files={"/data/media/d.jpg"},
+        low_value_files={"/data/docs/sub/c.log"},
+    )
+
+    assert state.file_count("/data") == 4
+    assert state.low_value_count("/data/docs") == 1
+    assert state.selection_state("/data") == SelectionState.PARTIAL
+
+    state.toggle("/data/docs/sub")
+    assert state.selected_count("/data/docs") == 2
+    assert state.selection_state("/data/docs") == SelectionState.PARTIAL
+
+    state.toggle("/data/docs/a.txt")
+    assert state.selection_state("/data/docs") == SelectionState.CHECKED
+    assert state.selection_state("/data") == SelectionState.CHECKED
+
+    state.toggle("/data")
+    assert state.selected_files == set()
+    assert state.selected_count("/data/docs/sub") == 0
+    assert state.selection_state("/data/media") == SelectionState.UNCHECKED
+
+    state.toggle("/data/docs/sub/b.txt")
+    assert state.selected_count("/data") == 1
+    assert state.selection_state("/data/docs/sub") == SelectionState.PARTIAL
+
+
+def test_node_table_keeps_public_path_api() -> None:
+    state = TreeSelectionState.from_paths(
+        [
+            "/data/docs/b.txt",
+            "/data/docs/a.txt",
+            "/data/docs/sub/c.txt",
+            "data/docs/relative.txt",
+            "/data/docs/a.txt",
+        ],
+        low_value_files={"/data/docs/b.txt"},
+    )
+
+    assert state.children("") == ["/data", "data"]
+    assert state.children("/data/docs") == [
+        "/data/docs/sub",
+        "/data/docs/a.txt",
+        "/data/docs/b.txt",
+    ]
+    assert state.parent("/data/docs/sub/c.txt") == "/data/docs/sub"
+    assert state.parent("/data") == ""
+    assert state.file_count("/data") == 3
+    assert state.file_count("data") == 1
+    assert state.is_low_value("/data/docs/b.txt")
+    assert not state.is_dir("/data/docs/a.txt")
+    assert state.is_dir("/data/docs/sub/")
+    assert state.descendant_files("/missing") == set()
+
+
+def test_children_are_sorted_once_and_sliced_lazily() -> None:
+    state = TreeSelectionState.from_paths(
+        [
+            "/big/z.txt",
+            "/big/b.log",
+            "/big/cache/x.tmp",
+            "/big/a.txt",
+            "/big/docs/readme.md",
+        ],
+        low_value_files={"/big/b.log", "/big/cache/x.tmp"},
+    )
+
+    listing = state.children("/big")
+    assert len(listing) == 5
+    assert listing[0] == "/big/cache"
+    assert listing[2:4] == ["/big/a.txt", "/big/b.log"]
+    assert state.child_directories("/big") == ["/big/cache", "/big/docs"]
+    assert state.children("/big", hide_low_value=True) == [
+        "/big/docs",
+        "/big/a.txt",
+        "/big/z.txt",
+    ]
+
+    page, total_pages = paginate_items(listing, page_size=2, page_index=2)
+    assert page == ["/big/z.txt"]
+    assert total_pages == 3